@@ -0,0 +1,120 @@
+"""Initial schema as previously created by ``Base.metadata.create_all``.
+
+Databases created before migrations existed can be marked with
+``alembic stamp 0001_initial_schema`` and then upgraded.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint("role IN ('admin','vorstand','team','mitarbeit','public')", name="ck_users_role"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("responsible_user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint("status IN ('green','yellow','red')", name="ck_projects_status"),
+    )
+    op.create_index("ix_projects_id", "projects", ["id"])
+
+    op.create_table(
+        "rooms",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+    )
+    op.create_index("ix_rooms_id", "rooms", ["id"])
+
+    op.create_table(
+        "news",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("is_public", sa.Boolean(), nullable=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("author_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_news_id", "news", ["id"])
+
+    op.create_table(
+        "events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("start", sa.DateTime(), nullable=False),
+        sa.Column("end", sa.DateTime(), nullable=False),
+        sa.Column("room_id", sa.Integer(), sa.ForeignKey("rooms.id"), nullable=False),
+        sa.Column("is_public", sa.Boolean(), nullable=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+    )
+    op.create_index("ix_events_id", "events", ["id"])
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("assignee_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("due_date", sa.Date(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint("status IN ('open','in_progress','done')", name="ck_tasks_status"),
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+
+    op.create_table(
+        "metrics",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_metrics_id", "metrics", ["id"])
+
+    op.create_table(
+        "system_status",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service", sa.String(), nullable=False, unique=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint("status IN ('ok','warning','down','planned')", name="ck_system_status_state"),
+    )
+    op.create_index("ix_system_status_id", "system_status", ["id"])
+
+
+def downgrade() -> None:
+    for table in ("system_status", "metrics", "tasks", "events", "news", "rooms", "projects", "users"):
+        op.drop_table(table)
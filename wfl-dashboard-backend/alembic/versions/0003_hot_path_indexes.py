@@ -0,0 +1,43 @@
+"""Indexes for the dashboard summary, project summary and list endpoints.
+
+Composite indexes lead with the equality filter and end with the sort
+column, so filtered lists are served in index order without a sort step.
+
+Revision ID: 0003_hot_path_indexes
+Revises: 0002_user_token_version
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_hot_path_indexes"
+down_revision = "0002_user_token_version"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_events_start", "events", ["start"]),
+    ("ix_events_room_start", "events", ["room_id", "start"]),
+    ("ix_events_project_start", "events", ["project_id", "start"]),
+    ("ix_news_created_at", "news", ["created_at"]),
+    ("ix_news_public_created", "news", ["is_public", "created_at"]),
+    ("ix_news_project_created", "news", ["project_id", "created_at"]),
+    ("ix_projects_created_at", "projects", ["created_at"]),
+    ("ix_projects_status_created", "projects", ["status", "created_at"]),
+    ("ix_tasks_project_status", "tasks", ["project_id", "status"]),
+    ("ix_tasks_assignee_due", "tasks", ["assignee_id", "due_date"]),
+    ("ix_tasks_status_due", "tasks", ["status", "due_date"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.create_index("ix_tasks_due_created", "tasks", ["due_date", sa.text("created_at DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_due_created", table_name="tasks")
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
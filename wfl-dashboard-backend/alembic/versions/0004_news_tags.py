@@ -0,0 +1,45 @@
+"""Normalized news tags for indexed tag filtering and facets.
+
+Backfills ``news_tags`` from the JSON ``news.tags`` column of existing rows.
+
+Revision ID: 0004_news_tags
+Revises: 0003_hot_path_indexes
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_news_tags"
+down_revision = "0003_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    news_tags = op.create_table(
+        "news_tags",
+        sa.Column("news_id", sa.Integer(), sa.ForeignKey("news.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("tag", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_news_tags_tag_created", "news_tags", ["tag", "created_at", "news_id"])
+
+    news = sa.table("news", sa.column("id", sa.Integer), sa.column("tags", sa.JSON), sa.column("created_at", sa.DateTime))
+    connection = op.get_bind()
+    rows: list[dict] = []
+    for news_id, tags, created_at in connection.execute(sa.select(news.c.id, news.c.tags, news.c.created_at)).all():
+        for tag in dict.fromkeys(tag for tag in tags or () if tag):
+            rows.append({"news_id": news_id, "tag": tag, "created_at": created_at})
+        if len(rows) >= BATCH_SIZE:
+            op.bulk_insert(news_tags, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(news_tags, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_tags_tag_created", table_name="news_tags")
+    op.drop_table("news_tags")
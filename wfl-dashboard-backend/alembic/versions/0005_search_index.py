@@ -0,0 +1,61 @@
+"""FTS5 search index over news, projects, tasks and events.
+
+Creates the ``search_index`` virtual table with its sync triggers and fills
+it from existing rows. SQLite only; other dialects skip this revision.
+
+Revision ID: 0005_search_index
+Revises: 0004_news_tags
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0005_search_index"
+down_revision = "0004_news_tags"
+branch_labels = None
+depends_on = None
+
+# (table, rowid code, title, body, project column)
+SOURCES = [
+    ("news", 0, "title", "body", "project_id"),
+    ("projects", 1, "title", "description", "id"),
+    ("tasks", 2, "title", "description", "project_id"),
+    ("events", 3, "title", "description", "project_id"),
+]
+
+
+def _entry(row: str, code: int, title: str, body: str, project: str) -> str:
+    return f"{row}.id * 4 + {code}, {row}.{title}, coalesce({row}.{body}, ''), {row}.{project}"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute(
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "title, body, project_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    op.execute("INSERT INTO search_index(search_index, rank) VALUES ('rank', 'bm25(10.0, 1.0)')")
+    for table, code, title, body, project in SOURCES:
+        insert = (
+            "INSERT INTO search_index(rowid, title, body, project_id) "
+            f"VALUES ({_entry('new', code, title, body, project)});"
+        )
+        delete = f"DELETE FROM search_index WHERE rowid = old.id * 4 + {code};"
+        columns = ", ".join(dict.fromkeys(c for c in (title, body, project) if c != "id"))
+        op.execute(f"CREATE TRIGGER {table}_search_ai AFTER INSERT ON {table} BEGIN {insert} END")
+        op.execute(f"CREATE TRIGGER {table}_search_ad AFTER DELETE ON {table} BEGIN {delete} END")
+        op.execute(f"CREATE TRIGGER {table}_search_au AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END")
+        op.execute(
+            "INSERT INTO search_index(rowid, title, body, project_id) "
+            f"SELECT {_entry(table, code, title, body, project)} FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table, *_columns in SOURCES:
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{suffix}")
+    op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,56 @@
+"""Denormalized per-project task and news counters.
+
+Creates ``project_counters`` and fills it from the current tasks and news so
+enabling ``PROJECT_COUNTERS_ENABLED`` later starts from exact values. Widens
+``ix_tasks_project_status`` by ``due_date`` so the grouped counts, including
+the overdue sum, are answered from the index alone.
+
+Revision ID: 0006_project_counters
+Revises: 0005_search_index
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_project_counters"
+down_revision = "0005_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_project_status_due", "tasks", ["project_id", "status", "due_date"])
+    op.drop_index("ix_tasks_project_status", table_name="tasks")
+    op.create_table(
+        "project_counters",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("tasks_open", sa.Integer(), nullable=False),
+        sa.Column("tasks_in_progress", sa.Integer(), nullable=False),
+        sa.Column("tasks_done", sa.Integer(), nullable=False),
+        sa.Column("tasks_overdue", sa.Integer(), nullable=False),
+        sa.Column("news_count", sa.Integer(), nullable=False),
+        sa.Column("counted_on", sa.Date(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO project_counters
+            (project_id, tasks_open, tasks_in_progress, tasks_done, tasks_overdue, news_count, counted_on)
+        SELECT
+            p.id,
+            (SELECT count(*) FROM tasks t WHERE t.project_id = p.id AND t.status = 'open'),
+            (SELECT count(*) FROM tasks t WHERE t.project_id = p.id AND t.status = 'in_progress'),
+            (SELECT count(*) FROM tasks t WHERE t.project_id = p.id AND t.status = 'done'),
+            (SELECT count(*) FROM tasks t
+                WHERE t.project_id = p.id AND t.status != 'done' AND t.due_date < CURRENT_DATE),
+            (SELECT count(*) FROM news n WHERE n.project_id = p.id),
+            CURRENT_DATE
+        FROM projects p
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_counters")
+    op.create_index("ix_tasks_project_status", "tasks", ["project_id", "status"])
+    op.drop_index("ix_tasks_project_status_due", table_name="tasks")
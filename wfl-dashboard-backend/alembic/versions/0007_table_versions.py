@@ -0,0 +1,32 @@
+"""Per-table change versions for conditional GETs.
+
+Creates ``table_versions`` with one row per versioned table; the ORM write
+hook increments a row whenever its table changes.
+
+Revision ID: 0007_table_versions
+Revises: 0006_project_counters
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_table_versions"
+down_revision = "0006_project_counters"
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ("events", "metrics", "news", "projects", "system_status")
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+    )
+    op.bulk_insert(table, [{"table_name": name, "version": 0} for name in VERSIONED_TABLES])
+
+
+def downgrade() -> None:
+    op.drop_table("table_versions")
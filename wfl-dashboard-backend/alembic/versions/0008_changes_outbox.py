@@ -0,0 +1,38 @@
+"""Transactional outbox of committed writes.
+
+Creates the append-only ``changes`` table; the ORM write hook adds one row
+per created, updated or deleted row in the writing transaction.
+
+Revision ID: 0008_changes_outbox
+Revises: 0007_table_versions
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_changes_outbox"
+down_revision = "0007_table_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "changes",
+        sa.Column("seq", sa.Integer(), primary_key=True),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("operation", sa.String(), nullable=False),
+        sa.Column("fields", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_changes_entity_seq", "changes", ["entity", "seq"])
+    op.create_index("ix_changes_created_at", "changes", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_changes_created_at", table_name="changes")
+    op.drop_index("ix_changes_entity_seq", table_name="changes")
+    op.drop_table("changes")
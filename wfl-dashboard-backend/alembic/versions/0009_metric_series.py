@@ -0,0 +1,64 @@
+"""Metric time series with rollups.
+
+Creates ``metric_points`` (raw samples), ``metric_rollups`` (1-minute,
+1-hour and 1-day buckets) and ``metric_dirty_hours`` (hours waiting for the
+rollup job), and seeds one sample per existing metric from its current value.
+
+Revision ID: 0009_metric_series
+Revises: 0008_changes_outbox
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_metric_series"
+down_revision = "0008_changes_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metric_points",
+        sa.Column("metric_id", sa.Integer(), sa.ForeignKey("metrics.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("ts", sa.Integer(), primary_key=True),
+        sa.Column("value", sa.Float(), nullable=False),
+        sqlite_with_rowid=False,
+    )
+    op.create_table(
+        "metric_rollups",
+        sa.Column("metric_id", sa.Integer(), sa.ForeignKey("metrics.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("resolution", sa.Integer(), primary_key=True),
+        sa.Column("bucket", sa.Integer(), primary_key=True),
+        sa.Column("min", sa.Float(), nullable=False),
+        sa.Column("max", sa.Float(), nullable=False),
+        sa.Column("sum", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("last", sa.Float(), nullable=False),
+        sa.Column("last_ts", sa.Integer(), nullable=False),
+        sqlite_with_rowid=False,
+    )
+    op.create_table(
+        "metric_dirty_hours",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("metric_id", sa.Integer(), nullable=False),
+        sa.Column("hour", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_metric_dirty_hours_metric_hour", "metric_dirty_hours", ["metric_id", "hour"], unique=True)
+
+    # Current values become the first sample of each series
+    op.execute(
+        "INSERT INTO metric_points (metric_id, ts, value) "
+        "SELECT id, CAST(strftime('%s', COALESCE(updated_at, CURRENT_TIMESTAMP)) AS INTEGER), value FROM metrics"
+    )
+    op.execute(
+        "INSERT INTO metric_dirty_hours (metric_id, hour) SELECT DISTINCT metric_id, ts - ts % 3600 FROM metric_points"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metric_dirty_hours_metric_hour", table_name="metric_dirty_hours")
+    op.drop_table("metric_dirty_hours")
+    op.drop_table("metric_rollups")
+    op.drop_table("metric_points")
@@ -0,0 +1,61 @@
+"""System status history with daily rollups.
+
+Creates ``system_status_history`` (append-only status transitions) and
+``system_status_daily`` (per-service totals of complete UTC days), and seeds
+one transition per existing entry from its current status.
+
+Revision ID: 0010_status_history
+Revises: 0009_metric_series
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_status_history"
+down_revision = "0009_metric_series"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "system_status_history",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("ts", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_system_status_history_service_ts", "system_status_history", ["service", "ts"])
+    op.create_table(
+        "system_status_daily",
+        sa.Column("service", sa.String(), primary_key=True),
+        sa.Column("day", sa.Integer(), primary_key=True),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False)
+            for name in (
+                "ok_seconds",
+                "warning_seconds",
+                "down_seconds",
+                "planned_seconds",
+                "incidents",
+                "recoveries",
+                "repair_seconds",
+            )
+        ),
+        sqlite_with_rowid=False,
+    )
+
+    # The current status of each service is where its history starts
+    op.execute(
+        "INSERT INTO system_status_history (service, status, message, ts) "
+        "SELECT service, status, message, CAST(strftime('%s', COALESCE(updated_at, CURRENT_TIMESTAMP)) AS INTEGER) "
+        "FROM system_status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("system_status_daily")
+    op.drop_index("ix_system_status_history_service_ts", table_name="system_status_history")
+    op.drop_table("system_status_history")
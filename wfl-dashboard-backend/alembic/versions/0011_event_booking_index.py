@@ -0,0 +1,25 @@
+"""Index for room booking conflicts and availability.
+
+Overlap checks ask for events of a room that end after a moment and start
+before another; leading with ``end`` keeps the scan to the events still
+running at that moment instead of the room's whole history.
+
+Revision ID: 0011_event_booking_index
+Revises: 0010_status_history
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0011_event_booking_index"
+down_revision = "0010_status_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_room_end_start", "events", ["room_id", "end", "start"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_room_end_start", table_name="events")
@@ -0,0 +1,144 @@
+"""Command line entry point for operational tasks.
+
+    python -m app.cli migrate          apply pending migrations (run before deploying workers)
+    python -m app.cli check            exit non-zero when the schema is not at head
+    python -m app.cli stamp REVISION   mark an existing database without running migrations
+    python -m app.cli counters [ID..]  recompute project counters from scratch (all projects by default)
+    python -m app.cli compact-changes  drop outbox entries older than the retention window (run daily)
+    python -m app.cli rollup-metrics   fold new metric samples into 1m/1h/1d rollups and apply retention
+    python -m app.cli rollup-status    fold complete days of the status history into per-service daily rollups
+    python -m app.cli probe-health     run the HEALTH_PROBES once and update the system status rows
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.core.config import get_settings
+from app.core.health_poller import HealthPoller, load_probes
+from app.db import session as db_session
+from app.db.changes import compact_changes
+from app.db.counters import refresh_project_counters
+from app.db.metric_series import run_rollups
+from app.db.migrations import UNVERSIONED_HINT, schema_state, stamp_database, upgrade_database
+from app.db.status_history import run_status_rollups
+
+
+def _migrate(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    before = schema_state(db_session.engine)
+    if before.is_unversioned:
+        print(UNVERSIONED_HINT)
+        return 1
+    if before.is_current:
+        print(f"Schema already at {before.head}")
+        return 0
+    upgrade_database(db_session.engine, args.revision)
+    print(f"Migrated {before.current or 'empty'} -> {args.revision} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+def _check(_args: argparse.Namespace) -> int:
+    state = schema_state(db_session.engine)
+    print(f"current={state.current} head={state.head}")
+    return 0 if state.is_current else 1
+
+
+def _stamp(args: argparse.Namespace) -> int:
+    stamp_database(db_session.engine, args.revision)
+    print(f"Stamped database at {args.revision}")
+    return 0
+
+
+def _counters(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    with db_session.engine.begin() as connection:
+        rows = refresh_project_counters(connection, args.project_ids or None)
+    print(f"Recomputed counters of {rows} projects in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+def _compact_changes(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    days = get_settings().changes_retention_days if args.days is None else args.days
+    with db_session.engine.begin() as connection:
+        rows = compact_changes(connection, days)
+    print(f"Removed {rows} outbox entries older than {days} days in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+def _rollup_metrics(_args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    hours = run_rollups(db_session.engine)
+    print(f"Rolled up {hours} metric hours in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+def _rollup_status(_args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    days = run_status_rollups(db_session.engine)
+    print(f"Rolled up {days} service days in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+def _probe_health(_args: argparse.Namespace) -> int:
+    poller = HealthPoller(load_probes(), get_settings().health_poll_concurrency)
+
+    async def run() -> dict:
+        try:
+            return await poller.poll_once()
+        finally:
+            await poller.close()
+
+    results = asyncio.run(run())
+    for service, result in results.items():
+        print(f"{service:<24} {result.status:<8} {result.message}")
+    print(f"{poller.writes} status rows changed")
+    return 0 if all(result.status == "ok" for result in results.values()) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser with all subcommands registered."""
+
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="WfL dashboard maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = commands.add_parser("migrate", help="Apply database migrations")
+    migrate.add_argument("revision", nargs="?", default="head")
+    migrate.set_defaults(handler=_migrate)
+
+    check = commands.add_parser("check", help="Verify the schema is at the newest revision")
+    check.set_defaults(handler=_check)
+
+    stamp = commands.add_parser("stamp", help="Set the revision without running migrations")
+    stamp.add_argument("revision")
+    stamp.set_defaults(handler=_stamp)
+
+    counters = commands.add_parser("counters", help="Recompute denormalized project counters")
+    counters.add_argument("project_ids", nargs="*", type=int, metavar="PROJECT_ID")
+    counters.set_defaults(handler=_counters)
+
+    compact = commands.add_parser("compact-changes", help="Remove old entries from the changes outbox")
+    compact.add_argument("--days", type=int, help="retention in days (default: CHANGES_RETENTION_DAYS)")
+    compact.set_defaults(handler=_compact_changes)
+
+    rollups = commands.add_parser("rollup-metrics", help="Roll up metric samples and apply their retention")
+    rollups.set_defaults(handler=_rollup_metrics)
+
+    status_rollups = commands.add_parser("rollup-status", help="Roll up the status history into daily totals")
+    status_rollups.set_defaults(handler=_rollup_status)
+
+    health = commands.add_parser("probe-health", help="Run the configured health probes once")
+    health.set_defaults(handler=_probe_health)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
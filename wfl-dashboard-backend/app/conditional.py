@@ -0,0 +1,53 @@
+"""Weak ETags and ``If-None-Match`` handling for polled GET endpoints.
+
+The ETag hashes the request path, its query parameters, the API version and
+the change versions of the tables the endpoint reads (see
+:mod:`app.db.versions`). A matching ``If-None-Match`` ends the request with
+``304 Not Modified`` before the handler runs, so neither the list query nor
+any serialization happens. Versions are read before the handler's query;
+a write landing in between can only make the ETag older than the body,
+which costs the client one extra full response, never a stale 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.db.versions import read_versions
+
+
+def compute_etag(request: Request, versions: dict[str, int]) -> str:
+    """Weak ETag for ``request`` given the change versions of the tables it reads."""
+
+    params = sorted(request.query_params.multi_items())
+    key = repr((request.app.version, request.url.path, params, sorted(versions.items())))
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` comparison using the weak comparison function (RFC 9110)."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def conditional_get(*tables: str) -> Callable[..., object]:
+    """Build a route dependency answering 304 while none of ``tables`` changed."""
+
+    async def dependency(request: Request, response: Response, db: AsyncSession = Depends(get_db)) -> str:
+        etag = compute_etag(request, await read_versions(db, tables))
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+
+    return dependency
@@ -0,0 +1,239 @@
+"""In-process feed of committed writes for the ``/api/stream`` SSE endpoint.
+
+An ORM flush records which rows of the streamed tables it created, updated
+or deleted; ``after_commit`` publishes them to the feed, a rollback drops
+them. Published changes go into one bounded replay buffer with increasing
+sequence numbers. Subscribers do not get queues or timers of their own: each
+keeps its position in the buffer and sleeps on a shared wakeup that a
+publish sets once, and that one timer per event loop also sets every
+heartbeat interval while the loop has subscribers. Idle clients thus cost
+nothing until something happens,
+and a client that falls more than a buffer behind is told to reload instead
+of growing memory. Like the view caches the feed is per process; with several
+workers a client only sees the writes its worker committed.
+"""
+
+import asyncio
+import json
+import secrets
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.changes import FlushedChange, flushed_changes
+
+STREAM_TOPICS = ("events", "metrics", "news", "projects", "system_status", "tasks")
+PENDING_CHANGES_KEY = "change_feed_pending"
+
+
+def sse_frame(event: str, event_id: str, data: Any) -> bytes:
+    """Encode one Server-Sent Events message."""
+
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """One committed create, update or delete of a streamed row, with its SSE frame encoded once."""
+
+    seq: int
+    entity: str
+    entity_id: Any
+    operation: str
+    fields: tuple[str, ...]
+    frame: bytes
+
+
+class ChangeFeed:
+    """Bounded replay buffer of committed changes with a broadcast wakeup per event loop."""
+
+    def __init__(self, buffer_size: int, heartbeat_seconds: float) -> None:
+        # Sequence numbers restart with the process; the epoch tells a resuming client which run issued its id
+        self.epoch = secrets.token_hex(4)
+        self._buffer: deque[ChangeEvent] = deque(maxlen=max(1, buffer_size))
+        self._seq = 0
+        self._lock = threading.Lock()
+        self.heartbeat_seconds = heartbeat_seconds
+        self._wakeups: dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self._subscribers: dict[asyncio.AbstractEventLoop, int] = {}
+        self.published = 0
+
+    @property
+    def subscribers(self) -> int:
+        return sum(self._subscribers.values())
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def publish(self, changes: Iterable[tuple[str, Any, str, tuple[str, ...]]]) -> None:
+        """Append ``(entity, id, operation, fields)`` changes and wake every subscriber.
+
+        Safe to call from any thread; commits in sync mode run on the threadpool.
+        """
+
+        with self._lock:
+            for entity, entity_id, operation, fields in changes:
+                self._seq += 1
+                data = {"entity": entity, "id": entity_id, "operation": operation, "fields": list(fields)}
+                frame = sse_frame(entity, self.event_id(self._seq), data)
+                self._buffer.append(ChangeEvent(self._seq, entity, entity_id, operation, fields, frame))
+                self.published += 1
+            loops = list(self._wakeups)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._wake, loop)
+            except RuntimeError:
+                # The loop is closed; nothing is waiting on it anymore
+                with self._lock:
+                    self._wakeups.pop(loop, None)
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            wakeup = self._wakeups.get(loop)
+            if wakeup is not None:
+                self._wakeups[loop] = asyncio.Event()
+        if wakeup is not None:
+            wakeup.set()
+
+    def _tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            # Without subscribers the timer stops; the next wakeup() arms a new one
+            idle = loop not in self._subscribers
+            wakeup = self._wakeups.pop(loop, None) if idle else None
+        if idle:
+            if wakeup is not None:
+                wakeup.set()
+            return
+        self._wake(loop)
+        loop.call_later(self.heartbeat_seconds, self._tick, loop)
+
+    def subscribe(self, limit: int) -> Callable[[], None] | None:
+        """Take one of ``limit`` subscriber slots for the running loop.
+
+        Returns the function that gives the slot back (calling it again does
+        nothing), or ``None`` when every slot is taken.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.subscribers >= limit:
+                return None
+            self._subscribers[loop] = self._subscribers.get(loop, 0) + 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            with self._lock:
+                if released:
+                    return
+                released = True
+                remaining = self._subscribers[loop] - 1
+                if remaining:
+                    self._subscribers[loop] = remaining
+                else:
+                    del self._subscribers[loop]
+
+        return release
+
+    def wakeup(self) -> asyncio.Event:
+        """Return the event the next publish or heartbeat tick sets for the running loop.
+
+        Take it *before* reading :meth:`since` so a publish in between is not missed.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            wakeup = self._wakeups.get(loop)
+            if wakeup is None:
+                wakeup = self._wakeups[loop] = asyncio.Event()
+                loop.call_later(self.heartbeat_seconds, self._tick, loop)
+        return wakeup
+
+    def since(self, seq: int) -> list[ChangeEvent] | None:
+        """Return the changes after ``seq``, or ``None`` when some of them already left the buffer."""
+
+        with self._lock:
+            if seq >= self._seq:
+                return []
+            first = self._buffer[0].seq if self._buffer else self._seq + 1
+            if seq < first - 1:
+                return None
+            return list(islice(self._buffer, seq - first + 1, None))
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for monitoring."""
+
+        with self._lock:
+            return {
+                "subscribers": self.subscribers,
+                "published": self.published,
+                "buffered": len(self._buffer),
+                "last_seq": self._seq,
+            }
+
+
+_change_feed: ChangeFeed | None = None
+
+
+def get_change_feed() -> ChangeFeed:
+    """Return the process-wide change feed."""
+
+    global _change_feed
+    if _change_feed is None:
+        settings = get_settings()
+        _change_feed = ChangeFeed(settings.stream_replay_buffer_size, settings.stream_heartbeat_seconds)
+    return _change_feed
+
+
+def _merge(previous: tuple[str, tuple[str, ...]] | None, operation: str, fields: tuple[str, ...]) -> tuple[str, tuple[str, ...]] | None:
+    """Fold several flushes of one row within a transaction into a single change."""
+
+    if previous is None:
+        return operation, fields
+    before, before_fields = previous
+    if before == "create":
+        return None if operation == "delete" else previous
+    if operation == "update":
+        return before, tuple(dict.fromkeys(before_fields + fields))
+    return operation, fields
+
+
+def queue_changes(session: Session, changes: Iterable[FlushedChange]) -> None:
+    """Publish ``changes`` when ``session`` commits (for bulk Core writes, which bypass the flush hook)."""
+
+    pending: dict[tuple[str, Any], tuple[str, tuple[str, ...]] | None] = session.info.setdefault(PENDING_CHANGES_KEY, {})
+    for entity, entity_id, operation, fields in changes:
+        key = (entity, entity_id)
+        pending[key] = _merge(pending.get(key), operation, fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    changes = flushed_changes(session, STREAM_TOPICS)
+    if changes:
+        queue_changes(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session: Session) -> None:
+    pending = session.info.pop(PENDING_CHANGES_KEY, None)
+    if pending:
+        get_change_feed().publish(
+            (entity, entity_id, *change) for (entity, entity_id), change in pending.items() if change is not None
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changes(session: Session) -> None:
+    session.info.pop(PENDING_CHANGES_KEY, None)
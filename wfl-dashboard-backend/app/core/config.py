@@ -1,6 +1,7 @@
 """Application configuration using Pydantic settings."""
 
 from functools import lru_cache
+from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,10 +11,106 @@ class Settings(BaseSettings):
 
     app_name: str = "WfL Dashboard API"
     database_url: str = "sqlite:///./data.db"
+    # Serve requests through an AsyncEngine (aiosqlite / asyncpg) instead of the threadpool
+    database_async: bool = False
+
+    # Apply pending migrations at startup; disable for multi-worker deploys and run `python -m app.cli migrate`
+    db_auto_migrate: bool = True
+
+    # Connection pool (ignored for in-memory SQLite)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = -1
+    db_pool_timeout: int = 30
+
+    # SQLite performance profile applied to every new connection
+    sqlite_profile_enabled: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64_000
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_temp_store: str = "MEMORY"
     secret_key: str = "change-me"
     access_token_expire_minutes: int = 60
     algorithm: str = "HS256"
 
+    # bcrypt runs in a dedicated process pool; 0 workers falls back to the request threadpool
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
+    password_hash_retry_after: int = 1
+
+    # Authenticated users are cached per token; 0 disables the cache
+    principal_cache_size: int = 1024
+    principal_cache_ttl_seconds: int = 60
+
+    # Embed uid/role/token version in JWTs so role checks skip the user lookup
+    token_role_claims: bool = False
+    token_version_cache_ttl_seconds: int = 60
+
+    # Dashboard summary cache; writes invalidate it, the TTL bounds staleness across workers (0 disables)
+    status_summary_cache_ttl_seconds: int = 30
+
+    # Per-project task/news counters maintained on write; run `python -m app.cli counters` after enabling
+    project_counters_enabled: bool = False
+
+    # List endpoints validate ORM rows once and return pydantic-core encoded JSON, skipping the response_model pass
+    fast_json_responses: bool = True
+
+    # Streaming exports fetch and encode rows in batches of this size
+    export_batch_size: int = 1000
+
+    # /api/stream: changes kept for Last-Event-ID resume, heartbeat interval and concurrent subscriber cap
+    stream_replay_buffer_size: int = 1024
+    stream_heartbeat_seconds: float = 15.0
+    stream_max_subscribers: int = 10_000
+
+    # Entries of the `changes` outbox older than this are removed by `python -m app.cli compact-changes`
+    changes_retention_days: int = 30
+
+    # Metric time series: background rollup interval (0 = only via `python -m app.cli rollup-metrics`),
+    # retention per resolution in days (0 = keep forever) and request limits
+    metric_rollup_interval_seconds: float = 60.0
+    metric_rollup_batch_hours: int = 500
+    metric_raw_retention_days: int = 7
+    metric_minute_retention_days: int = 31
+    metric_hour_retention_days: int = 400
+    metric_day_retention_days: int = 0
+    metric_series_max_points: int = 5000
+    metric_ingest_max_points: int = 10_000
+    # Samples and bulk records may be dated at most this far past the server clock
+    metric_max_future_seconds: int = 300
+
+    # POST /api/metrics/bulk: records per request, and the optional write-behind buffer
+    # (0 = write through; otherwise flush interval in seconds and cap on pending metric names)
+    metric_bulk_max_records: int = 5000
+    metric_write_behind_seconds: float = 0.0
+    metric_write_behind_max_pending: int = 10_000
+
+    # Prometheus metrics at GET /metrics (outside /api, so Traefik does not route it publicly);
+    # with a token set, scrapers have to send it as a bearer token
+    telemetry_enabled: bool = True
+    telemetry_token: str | None = None
+
+    # Background health checks feeding /api/system/status: JSON list of probes
+    # ({"service", "kind": http|tcp|sql|file, "target", "interval", "timeout", "degraded_after", "max_age"})
+    # and how many checks may run at the same time
+    health_probes: list[dict[str, Any]] = []
+    health_poll_concurrency: int = 8
+
+    # Status history: interval of the background job folding complete days into per-service daily rollups
+    # (0 = only via `python -m app.cli rollup-status`) and days per rollup transaction
+    status_rollup_interval_seconds: float = 300.0
+    status_rollup_batch_days: int = 366
+
+    # Longest range GET /api/rooms/availability computes free slots for
+    room_availability_max_days: int = 92
+
+    # Keyset pagination for list endpoints; legacy mode returns the full list when no page params are sent
+    pagination_default_page_size: int = 50
+    pagination_max_page_size: int = 500
+    pagination_legacy_unbounded: bool = True
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
 
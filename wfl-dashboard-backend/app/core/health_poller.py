@@ -0,0 +1,198 @@
+"""Background health checks that keep ``SystemStatus`` rows current.
+
+Probes are configured with ``HEALTH_PROBES`` (a JSON list, see
+:class:`ProbeConfig`). There are four kinds:
+
+- ``http``: GET a URL; 2xx/3xx is ok, anything else is down.
+- ``tcp``: connect to ``host:port``.
+- ``sql``: run a statement (default ``SELECT 1``) on the application database.
+- ``file``: check that a file exists and is younger than ``max_age`` seconds.
+
+Each probe loops on its own interval with its own timeout. All of them
+share one event loop and a semaphore of ``HEALTH_POLL_CONCURRENCY``
+concurrent checks. A result only reaches the database when its status or
+message differs from the row, so steady states cause no writes.
+
+Messages describe the state and never carry measurements; a latency in the
+message would change on every poll. Rows set to ``planned`` by hand
+(maintenance) are left alone until someone changes them back. Writes go
+through the ORM, so ETags, the changes outbox and ``/api/stream`` follow.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Sequence
+from typing import Literal, NamedTuple
+
+import httpx
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import select, text
+
+from app.core.config import get_settings
+from app.db import base  # noqa: F401 - ensures models are registered
+from app.db import session as db_session
+from app.db.models.system_status import SystemStatus
+
+logger = logging.getLogger("app.health")
+
+OPERATIONAL = "Operational"
+
+
+class ProbeConfig(BaseModel):
+    """One health check feeding the ``SystemStatus`` row named ``service``."""
+
+    service: str
+    kind: Literal["http", "tcp", "sql", "file"]
+    target: str = Field(default="", description="URL, host:port, SQL statement or file path")
+    interval: float = Field(default=60.0, gt=0)
+    timeout: float = Field(default=5.0, gt=0)
+    degraded_after: float | None = Field(default=None, description="Seconds after which a successful check is a warning")
+    max_age: float | None = Field(default=None, description="Maximum file age in seconds (file probes)")
+
+
+class ProbeResult(NamedTuple):
+    status: str
+    message: str
+
+
+def load_probes(raw: Sequence[dict] | None = None) -> list[ProbeConfig]:
+    """Validate the configured probes (``HEALTH_PROBES`` by default)."""
+
+    return TypeAdapter(list[ProbeConfig]).validate_python(get_settings().health_probes if raw is None else raw)
+
+
+async def _check_http(probe: ProbeConfig, client: httpx.AsyncClient) -> ProbeResult:
+    response = await client.get(probe.target)
+    if response.status_code >= 400:
+        return ProbeResult("down", f"HTTP {response.status_code}")
+    return ProbeResult("ok", OPERATIONAL)
+
+
+async def _check_tcp(probe: ProbeConfig) -> ProbeResult:
+    host, _, port = probe.target.rpartition(":")
+    _reader, writer = await asyncio.open_connection(host, int(port))
+    writer.close()
+    await writer.wait_closed()
+    return ProbeResult("ok", OPERATIONAL)
+
+
+def _check_sql(probe: ProbeConfig) -> ProbeResult:
+    with db_session.engine.connect() as connection:
+        connection.execute(text(probe.target or "SELECT 1")).all()
+    return ProbeResult("ok", OPERATIONAL)
+
+
+def _check_file(probe: ProbeConfig) -> ProbeResult:
+    try:
+        age = time.time() - os.stat(probe.target).st_mtime
+    except FileNotFoundError:
+        return ProbeResult("down", "File missing")
+    if probe.max_age is not None and age > probe.max_age:
+        return ProbeResult("warning", f"Older than {_duration(probe.max_age)}")
+    return ProbeResult("ok", OPERATIONAL)
+
+
+def _duration(seconds: float) -> str:
+    for unit, size in (("h", 3600), ("min", 60)):
+        if seconds >= size:
+            return f"{seconds / size:g} {unit}"
+    return f"{seconds:g} s"
+
+
+class HealthPoller:
+    """Runs the probes concurrently and records state changes in ``system_status``."""
+
+    def __init__(self, probes: Sequence[ProbeConfig], concurrency: int) -> None:
+        self.probes = list(probes)
+        self.concurrency = concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._client: httpx.AsyncClient | None = None
+        self.checks = 0
+        self.writes = 0
+
+    async def check(self, probe: ProbeConfig) -> ProbeResult:
+        """Run one probe within its timeout; failures become ``down`` results."""
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            self.checks += 1
+            started = time.perf_counter()
+            try:
+                async with asyncio.timeout(probe.timeout):
+                    if probe.kind == "http":
+                        if self._client is None:
+                            self._client = httpx.AsyncClient(follow_redirects=True)
+                        result = await _check_http(probe, self._client)
+                    elif probe.kind == "tcp":
+                        result = await _check_tcp(probe)
+                    elif probe.kind == "sql":
+                        result = await asyncio.to_thread(_check_sql, probe)
+                    else:
+                        result = await asyncio.to_thread(_check_file, probe)
+            except TimeoutError:
+                return ProbeResult("down", f"No answer within {_duration(probe.timeout)}")
+            except Exception as exc:
+                message = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+                return ProbeResult("down", message[:200])
+        if result.status == "ok" and probe.degraded_after is not None and time.perf_counter() - started > probe.degraded_after:
+            return ProbeResult("warning", f"Slower than {_duration(probe.degraded_after)}")
+        return result
+
+    def _apply(self, service: str, result: ProbeResult) -> Literal["written", "unchanged", "planned"]:
+        with db_session.SessionLocal() as session:
+            entry = session.scalar(select(SystemStatus).where(SystemStatus.service == service))
+            if entry is None:
+                entry = SystemStatus(service=service)
+                session.add(entry)
+            elif entry.status == "planned":
+                return "planned"
+            elif (entry.status, entry.message) == result:
+                return "unchanged"
+            entry.status, entry.message = result
+            session.commit()
+        return "written"
+
+    async def record(self, service: str, result: ProbeResult) -> bool:
+        """Store ``result`` unless the row already says so or is in maintenance; return whether it was written.
+
+        The comparison is against the stored row, so manual edits and
+        recreated rows are corrected by the next check.
+        """
+
+        if await asyncio.to_thread(self._apply, service, result) != "written":
+            return False
+        self.writes += 1
+        logger.info("%s is %s: %s", service, result.status, result.message)
+        return True
+
+    async def poll_once(self) -> dict[str, ProbeResult]:
+        """Run every probe once, concurrently, and record the results."""
+
+        results = await asyncio.gather(*(self.check(probe) for probe in self.probes))
+        for probe, result in zip(self.probes, results):
+            await self.record(probe.service, result)
+        return {probe.service: result for probe, result in zip(self.probes, results)}
+
+    async def _poll_forever(self, probe: ProbeConfig) -> None:
+        while True:
+            try:
+                await self.record(probe.service, await self.check(probe))
+            except Exception:
+                logger.exception("Recording the health of %s failed", probe.service)
+            await asyncio.sleep(probe.interval)
+
+    async def run(self) -> None:
+        """Poll every probe on its own interval until cancelled."""
+
+        try:
+            await asyncio.gather(*(self._poll_forever(probe) for probe in self.probes))
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,101 @@
+"""Write-behind buffer for bulk metric updates.
+
+With ``METRIC_WRITE_BEHIND_SECONDS`` above zero, ``POST /api/metrics/bulk``
+only keeps the newest value per metric name in memory, and a background
+task writes whatever is pending with one upsert per interval. Rapid updates
+of the same metric then cost one write per interval instead of one per
+request. The price is up to one interval of delay, the intermediate values
+(they never become series samples) and, if the process dies, the pending
+values. The buffer is per process; shutdown flushes it.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Sequence
+
+from app.core.config import get_settings
+from app.db import session as db_session
+from app.db.metric_ingest import MetricRecord, coalesce_records, upsert_metrics
+
+logger = logging.getLogger("app.metrics")
+
+
+class MetricWriteBuffer:
+    """Newest pending record per metric name, flushed in one transaction."""
+
+    def __init__(self, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._pending: dict[str, MetricRecord] = {}
+        self._lock = threading.Lock()
+        self.received = 0
+        self.written = 0
+        self.flushes = 0
+
+    def add(self, records: Sequence[MetricRecord]) -> bool:
+        """Queue ``records``; queue nothing and return ``False`` when they would exceed ``max_pending`` names."""
+
+        with self._lock:
+            new_names = {record.name for record in records} - self._pending.keys()
+            if len(self._pending) + len(new_names) > self.max_pending:
+                return False
+            coalesce_records(records, into=self._pending)
+            self.received += len(records)
+        return True
+
+    def drain(self) -> list[MetricRecord]:
+        """Take all pending records out of the buffer."""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return list(pending.values())
+
+    def flush(self) -> int:
+        """Write the pending records in one transaction; return rows written.
+
+        On failure the records go back into the buffer (newer values that
+        arrived meanwhile win) and the error propagates.
+        """
+
+        records = self.drain()
+        if not records:
+            return 0
+        try:
+            with db_session.SessionLocal() as session:
+                written = upsert_metrics(session, records)
+                session.commit()
+        except Exception:
+            with self._lock:
+                self._pending = coalesce_records(self._pending.values(), into={record.name: record for record in records})
+            raise
+        self.written += written
+        self.flushes += 1
+        return written
+
+    async def flush_forever(self, interval: float) -> None:
+        """Flush every ``interval`` seconds on the threadpool until cancelled."""
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Metric write-behind flush failed; retrying in %s s", interval)
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for diagnostics."""
+
+        with self._lock:
+            return {"pending": len(self._pending), "received": self.received, "written": self.written, "flushes": self.flushes}
+
+
+_metric_buffer: MetricWriteBuffer | None = None
+
+
+def get_metric_buffer() -> MetricWriteBuffer:
+    """Return the process-wide write-behind buffer."""
+
+    global _metric_buffer
+    if _metric_buffer is None:
+        _metric_buffer = MetricWriteBuffer(get_settings().metric_write_behind_max_pending)
+    return _metric_buffer
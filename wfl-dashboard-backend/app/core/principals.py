@@ -0,0 +1,190 @@
+"""Authenticated principals and the in-process cache that avoids per-request user lookups."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.config import get_settings
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of the authenticated user, safe to share across sessions."""
+
+    id: int
+    email: str
+    role: str
+    name: str | None = None
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        """Build a principal from a ``User`` row."""
+
+        return cls(id=user.id, name=user.name, email=user.email, role=user.role, created_at=user.created_at)
+
+
+class PrincipalCache:
+    """Bounded LRU cache of principals keyed by bearer token.
+
+    Entries never outlive the token they were created for. Invalidation is
+    per process, so with several workers the TTL bounds how long another
+    worker may serve a stale principal.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+        self._tokens_by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Principal | None:
+        """Return the cached principal for ``token`` or None on a miss."""
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= now:
+                self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: Principal, token_expires_at: float | None = None) -> None:
+        """Cache ``principal`` for ``token`` until the TTL or the token's ``exp`` (epoch seconds)."""
+
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (principal, time.monotonic() + ttl)
+            self._tokens_by_user.setdefault(principal.id, set()).add(token)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached token belonging to ``user_id``."""
+
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all entries; counters are kept."""
+
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return counters for monitoring; every hit is one user query saved."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "db_queries_saved": self.hits,
+            }
+
+    def _remove(self, token: str) -> None:
+        principal, _ = self._entries.pop(token)
+        tokens = self._tokens_by_user.get(principal.id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[principal.id]
+
+
+class TokenVersionCache:
+    """Short-lived map of user id to current token version for claim-based authorization."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._versions: dict[int, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> int | None:
+        """Return the cached version or None when unknown or expired."""
+
+        with self._lock:
+            entry = self._versions.get(user_id)
+            if entry is None:
+                return None
+            version, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._versions[user_id]
+                return None
+            return version
+
+    def put(self, user_id: int, version: int) -> None:
+        """Remember the current version for ``user_id``."""
+
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._versions[user_id] = (version, time.monotonic() + self.ttl_seconds)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget ``user_id`` so the next check reloads its version."""
+
+        with self._lock:
+            self._versions.pop(user_id, None)
+
+
+_principal_cache: PrincipalCache | None = None
+_token_version_cache: TokenVersionCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Return the process-wide principal cache, creating it from settings."""
+
+    global _principal_cache
+    if _principal_cache is None:
+        settings = get_settings()
+        ttl = min(settings.principal_cache_ttl_seconds, settings.access_token_expire_minutes * 60)
+        _principal_cache = PrincipalCache(max_size=settings.principal_cache_size, ttl_seconds=ttl)
+    return _principal_cache
+
+
+def get_token_version_cache() -> TokenVersionCache:
+    """Return the process-wide token version cache."""
+
+    global _token_version_cache
+    if _token_version_cache is None:
+        _token_version_cache = TokenVersionCache(ttl_seconds=get_settings().token_version_cache_ttl_seconds)
+    return _token_version_cache
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop every cached authentication artefact of ``user_id`` after it changed."""
+
+    get_principal_cache().invalidate_user(user_id)
+    get_token_version_cache().invalidate_user(user_id)
@@ -1,7 +1,13 @@
 """Security utilities for hashing passwords and creating JWT tokens."""
 
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
@@ -9,6 +15,8 @@ from app.core.config import get_settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Return True when the supplied password matches the stored hash."""
@@ -22,12 +30,123 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
-    """Create a signed JWT for the given subject."""
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the password hashing pool cannot accept more work."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Password hashing capacity exhausted")
+        self.retry_after = retry_after
+
+
+class PasswordHasherPool:
+    """Bounded process pool that keeps bcrypt off the shared request threadpool."""
+
+    def __init__(self, workers: int, max_pending: int, retry_after: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of hashing jobs currently queued or running."""
+
+        return self._pending
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusy(self.retry_after)
+            self._pending += 1
+
+    def _release(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        """Run a hashing function in the pool, failing fast when it is saturated."""
+
+        self._acquire()
+        if self.workers <= 0:
+            try:
+                return await run_in_threadpool(func, *args)
+            finally:
+                self._release()
+
+        try:
+            future = self._get_executor().submit(func, *args)
+        except Exception:
+            self._release()
+            raise
+        # Release on completion rather than on await so cancelled requests still count until the worker is done
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop worker processes; a new executor is created on next use."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_hasher_pool: PasswordHasherPool | None = None
+
+
+def get_password_hasher_pool() -> PasswordHasherPool:
+    """Return the process-wide password hasher pool, creating it from settings."""
+
+    global _hasher_pool
+    if _hasher_pool is None:
+        settings = get_settings()
+        _hasher_pool = PasswordHasherPool(
+            workers=settings.password_hash_workers,
+            max_pending=settings.password_hash_max_pending,
+            retry_after=settings.password_hash_retry_after,
+        )
+    return _hasher_pool
+
+
+def shutdown_password_hasher_pool() -> None:
+    """Dispose of the password hasher pool (used on application shutdown)."""
+
+    global _hasher_pool
+    if _hasher_pool is not None:
+        _hasher_pool.shutdown()
+        _hasher_pool = None
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+
+    return await get_password_hasher_pool().run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+
+    return await get_password_hasher_pool().run(get_password_hash, password)
+
+
+def create_access_token(
+    subject: str,
+    expires_delta: timedelta | None = None,
+    extra_claims: dict[str, str | int] | None = None,
+) -> str:
+    """Create a signed JWT for the given subject, optionally carrying extra claims."""
 
     settings = get_settings()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode = {"sub": subject, "exp": expire}
+    to_encode = {**(extra_claims or {}), "sub": subject, "exp": expire}
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
@@ -0,0 +1,64 @@
+"""Validate-once JSON responses for read endpoints.
+
+Handlers keep ``response_model=`` for the OpenAPI schema but return
+``json_response``: ORM rows are validated into the response schema in one
+``TypeAdapter`` pass and encoded straight to bytes by pydantic-core. FastAPI
+passes a returned ``Response`` through untouched, so the second validation
+and encoding pass of ``response_model`` is skipped.
+"""
+
+from functools import lru_cache
+from typing import Any, get_args, get_origin
+
+from fastapi import Response
+from pydantic import ConfigDict, TypeAdapter, create_model
+
+from app.core.config import get_settings
+
+
+@lru_cache(maxsize=None)
+def response_adapter(schema: Any) -> TypeAdapter:
+    """Return the cached adapter for a response schema such as ``list[EventRead]``."""
+
+    return TypeAdapter(schema)
+
+
+@lru_cache(maxsize=None)
+def narrow_schema(schema: Any, fields: tuple[str, ...]) -> Any:
+    """Return ``schema`` (a model or ``list`` of one) reduced to ``fields``."""
+
+    if get_origin(schema) is list:
+        return list[narrow_schema(get_args(schema)[0], fields)]
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+def json_response(
+    schema: Any,
+    content: Any,
+    response: Response | None = None,
+    status_code: int = 200,
+    fields: tuple[str, ...] | None = None,
+) -> Any:
+    """Validate ``content`` (ORM rows or dicts) against ``schema`` once and return it as JSON.
+
+    Headers already set on the injected ``response`` (pagination links) are
+    carried over. ``fields`` renders only those fields of the schema (see
+    :mod:`app.fields`). With ``fast_json_responses`` disabled full responses
+    are returned as validated models and FastAPI serializes them through
+    ``response_model``.
+    """
+
+    if fields is not None:
+        schema = narrow_schema(schema, fields)
+    adapter = response_adapter(schema)
+    value = adapter.validate_python(content, from_attributes=True)
+    if fields is None and not get_settings().fast_json_responses:
+        return value
+    rendered = Response(content=adapter.dump_json(value), status_code=status_code, media_type="application/json")
+    if response is not None:
+        rendered.headers.raw.extend(response.headers.raw)
+    return rendered
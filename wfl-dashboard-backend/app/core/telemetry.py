@@ -0,0 +1,266 @@
+"""Request and database telemetry in the Prometheus text format.
+
+:class:`TelemetryMiddleware` is plain ASGI, so streaming responses pass
+through untouched. Per route template, method and status it counts
+requests and observes latency and response-size histograms; it also tracks
+the requests in flight. :func:`instrument_engine` hooks every cursor
+execution of an engine and adds its duration to the current request (found
+through a context variable, which the threadpool and the async driver's
+greenlets inherit) and to process-wide totals. ``GET /metrics`` renders
+everything with :meth:`Telemetry.render`.
+
+Recording costs a few dict lookups and ``bisect`` calls per request and
+per query; ``benchmarks/telemetry_overhead.py`` checks that it stays within
+the budget of 50 µs per request.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative-on-render histogram over fixed upper bounds."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: str) -> Iterable[str]:
+        """Yield the ``_bucket``, ``_sum`` and ``_count`` lines; ``labels`` is ``'a="b",'`` or empty."""
+
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            yield f'{name}_bucket{{{labels}le="{bound:g}"}} {total}'
+        total += self.counts[-1]
+        yield f'{name}_bucket{{{labels}le="+Inf"}} {total}'
+        suffix = f"{{{labels.rstrip(',')}}}" if labels else ""
+        yield f"{name}_sum{suffix} {self.sum:.6f}"
+        yield f"{name}_count{suffix} {total}"
+
+
+class RequestStats:
+    """Database work done on behalf of one request."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class Telemetry:
+    """Process-wide request and query metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self._requests: dict[tuple[str, str, int], int] = {}
+        self._routes: dict[tuple[str, str], tuple[Histogram, Histogram, Histogram, Histogram]] = {}
+        self._queries = Histogram(QUERY_BUCKETS)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, size: int, stats: RequestStats) -> None:
+        key = (method, route)
+        with self._lock:
+            self._requests[(method, route, status)] = self._requests.get((method, route, status), 0) + 1
+            histograms = self._routes.get(key)
+            if histograms is None:
+                histograms = self._routes[key] = (
+                    Histogram(LATENCY_BUCKETS),
+                    Histogram(SIZE_BUCKETS),
+                    Histogram(QUERY_COUNT_BUCKETS),
+                    Histogram(LATENCY_BUCKETS),
+                )
+            latency, size_hist, query_count, query_time = histograms
+            latency.observe(seconds)
+            size_hist.observe(size)
+            query_count.observe(stats.queries)
+            query_time.observe(stats.seconds)
+
+    def observe_query(self, seconds: float) -> None:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += seconds
+        with self._lock:
+            self._queries.observe(seconds)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+
+        with self._lock:
+            requests = sorted(self._requests.items())
+            routes = sorted((key, tuple(_copy(h) for h in histograms)) for key, histograms in self._routes.items())
+            queries = _copy(self._queries)
+            in_flight = self.in_flight
+
+        lines = [
+            "# HELP http_requests_total Requests handled, by method, route template and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        lines += [
+            f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}'
+            for (method, route, status), count in requests
+        ]
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being handled.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+        ]
+        families = (
+            ("http_request_duration_seconds", "Time until the response body was sent."),
+            ("http_response_size_bytes", "Response body size."),
+            ("http_request_db_queries", "Database queries executed per request."),
+            ("http_request_db_duration_seconds", "Time spent in database queries per request."),
+        )
+        for index, (name, help_text) in enumerate(families):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, route), histograms in routes:
+                lines += histograms[index].samples(name, f'method="{method}",route="{_escape(route)}",')
+        lines += [
+            "# HELP db_query_duration_seconds Duration of every database query, inside requests or not.",
+            "# TYPE db_query_duration_seconds histogram",
+            *queries.samples("db_query_duration_seconds", ""),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _copy(histogram: Histogram) -> Histogram:
+    snapshot = Histogram(histogram.bounds)
+    snapshot.counts = list(histogram.counts)
+    snapshot.sum = histogram.sum
+    return snapshot
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+_telemetry: Telemetry | None = None
+
+
+def get_telemetry() -> Telemetry:
+    """Return the process-wide telemetry registry."""
+
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = Telemetry()
+    return _telemetry
+
+
+def route_template(scope: dict[str, Any]) -> str:
+    """Return the matched route's path template, e.g. ``/api/metrics/{metric_id}``.
+
+    Routers included into others keep templates relative to their prefix;
+    the prefix is whatever precedes as many segments of the request path
+    (nothing when the router flattened the template).
+    Label values stay bounded: unmatched paths share one label.
+    """
+
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    return scope["path"].rsplit("/", template.count("/"))[0] + template
+
+
+class TelemetryMiddleware:
+    """ASGI middleware recording per-route request metrics."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        telemetry = get_telemetry()
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        telemetry.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            telemetry.in_flight -= 1
+            _request_stats.reset(token)
+            telemetry.observe_request(scope["method"], route_template(scope), status, elapsed, size, stats)
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Time every cursor execution of ``sync_engine`` when telemetry is enabled.
+
+    Hooks the dialect's ``do_execute*`` events and delegates to the dialect:
+    any ``before/after_cursor_execute`` listener moves SQLAlchemy off its
+    fast path and costs about 15 µs per query, these cost about 3 µs.
+    """
+
+    if not get_settings().telemetry_enabled:
+        return
+
+    @event.listens_for(sync_engine, "do_execute")
+    def _execute(cursor, statement, parameters, context) -> bool:
+        started = time.perf_counter()
+        try:
+            context.dialect.do_execute(cursor, statement, parameters, context)
+        finally:
+            get_telemetry().observe_query(time.perf_counter() - started)
+        return True
+
+    @event.listens_for(sync_engine, "do_executemany")
+    def _executemany(cursor, statement, parameters, context) -> bool:
+        started = time.perf_counter()
+        try:
+            context.dialect.do_executemany(cursor, statement, parameters, context)
+        finally:
+            get_telemetry().observe_query(time.perf_counter() - started)
+        return True
+
+    @event.listens_for(sync_engine, "do_execute_no_params")
+    def _execute_no_params(cursor, statement, context) -> bool:
+        started = time.perf_counter()
+        try:
+            context.dialect.do_execute_no_params(cursor, statement, context)
+        finally:
+            get_telemetry().observe_query(time.perf_counter() - started)
+        return True
@@ -0,0 +1,172 @@
+"""Cached read models with write-driven invalidation and single-flight refresh."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+
+CHANGED_TABLES_KEY = "view_cache_changed_tables"
+
+
+class ViewCache:
+    """Computed views cached per key until a watched table changes.
+
+    Any ORM commit touching one of ``tables`` invalidates every entry. Entries
+    also expire at their own deadline: the TTL, or an earlier moment supplied
+    by the computation (e.g. when the next listed event starts). Concurrent
+    misses for the same key share one computation. Invalidation is per
+    process, so with several workers the TTL bounds staleness.
+    """
+
+    def __init__(self, name: str, tables: Iterable[str], ttl_seconds: float, queries_per_compute: int = 1) -> None:
+        self.name = name
+        self.tables = frozenset(tables)
+        self.ttl_seconds = ttl_seconds
+        self.queries_per_compute = queries_per_compute
+        self._entries: dict[Any, tuple[Any, float, int]] = {}
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    async def get_or_compute(self, key: Any, compute: Callable[[], Awaitable[tuple[Any, float | None]]]) -> Any:
+        """Return the cached value for ``key`` or run ``compute`` once for all waiting callers.
+
+        ``compute`` returns ``(value, valid_for)``; ``valid_for`` (seconds) caps
+        the TTL for this value, ``None`` keeps the TTL.
+        """
+
+        if self.ttl_seconds <= 0:
+            self.misses += 1
+            value, _valid_for = await compute()
+            return value
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now and entry[2] == self._generation:
+                self.hits += 1
+                return entry[0]
+            generation = self._generation
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The computing request was cancelled; compute on behalf of this one
+
+        self.misses += 1
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value, valid_for = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an exception nobody awaited is not logged
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        ttl = self.ttl_seconds if valid_for is None else max(0.0, min(self.ttl_seconds, valid_for))
+        with self._lock:
+            # A commit during the computation may not be reflected in the value; serve it once, do not cache it
+            if generation == self._generation and ttl > 0:
+                self._entries[key] = (value, time.monotonic() + ttl, generation)
+        future.set_result(value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry; computations already running will not be cached."""
+
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, int | float]:
+        """Return counters for monitoring."""
+
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            served = self.hits + self.coalesced
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_ratio": served / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "db_queries_saved": served * self.queries_per_compute,
+            }
+
+
+_status_summary_cache: ViewCache | None = None
+
+
+def get_status_summary_cache() -> ViewCache:
+    """Return the process-wide cache of the dashboard summary."""
+
+    global _status_summary_cache
+    if _status_summary_cache is None:
+        _status_summary_cache = ViewCache(
+            "status_summary",
+            tables=("projects", "events", "news"),
+            ttl_seconds=get_settings().status_summary_cache_ttl_seconds,
+            queries_per_compute=3,
+        )
+    return _status_summary_cache
+
+
+def view_caches() -> list[ViewCache]:
+    """Return the view caches created so far."""
+
+    return [cache for cache in (_status_summary_cache,) if cache is not None]
+
+
+def mark_tables_changed(session: Session, tables: Iterable[str]) -> None:
+    """Invalidate the caches over ``tables`` when ``session`` commits (for bulk Core writes)."""
+
+    session.info.setdefault(CHANGED_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session: Session, _flush_context) -> None:
+    mark_tables_changed(
+        session,
+        (table for obj in chain(session.new, session.dirty, session.deleted) if (table := getattr(obj, "__tablename__", None)) is not None),
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_view_caches(session: Session) -> None:
+    changed = session.info.pop(CHANGED_TABLES_KEY, None)
+    if not changed:
+        return
+    for cache in view_caches():
+        if cache.tables & changed:
+            cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_tables(session: Session) -> None:
+    session.info.pop(CHANGED_TABLES_KEY, None)
@@ -8,4 +8,5 @@ class Base(DeclarativeBase):
 
 
 # Import models here so Alembic and SQLAlchemy know about them
-from app.db.models import user, project, news, room, event, task, metric, system_status  # noqa: E402,F401
+from app.db.models import user, project, project_counter, news, room, event, task, metric, system_status, table_version, change  # noqa: E402,F401
+from app.db import changes, counters, metric_series, news_tags, search, status_history, versions  # noqa: E402,F401
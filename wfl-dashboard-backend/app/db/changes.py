@@ -0,0 +1,152 @@
+"""Transactional outbox of committed writes and its incremental readers.
+
+Every ORM flush that creates, updates or deletes rows of the tables behind
+the route modules appends one ``changes`` row per touched row, in the same
+transaction: the entry commits and rolls back with the write it describes.
+Consumers (other workers, caches, search indexes, external tools) remember
+the last ``seq`` they processed and pull what came after it, through
+``GET /api/changes?after=`` or :class:`ChangeReader`, instead of rereading
+whole tables.
+
+Sequence numbers come from SQLite's AUTOINCREMENT and writes are serialized,
+so they are gap-free and appear in commit order. ``compact_changes`` drops
+entries past the retention window; a consumer whose position was compacted
+away gets :class:`ChangesCompacted` and has to reload before resuming from
+the current head. Bulk Core statements bypass the hook and call
+:func:`append_changes` themselves.
+"""
+
+from collections.abc import Collection, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Connection, Row, Select, delete, event, func, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.models.change import Change
+
+OUTBOX_TABLES = ("events", "metrics", "news", "projects", "rooms", "system_status", "tasks", "users")
+
+FlushedChange = tuple[str, Any, str, tuple[str, ...]]
+
+
+class ChangesCompacted(Exception):
+    """Entries after the requested position were removed by compaction."""
+
+    def __init__(self, after: int, head: int) -> None:
+        super().__init__(f"Changes after {after} were compacted; reload and resume from {head}")
+        self.after = after
+        self.head = head
+
+
+def _row_id(obj: Any) -> Any:
+    values = inspect(obj).mapper.primary_key_from_instance(obj)
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def _changed_fields(obj: Any) -> tuple[str, ...]:
+    state = inspect(obj)
+    return tuple(attr.key for attr in state.mapper.column_attrs if state.attrs[attr.key].history.has_changes())
+
+
+def flushed_changes(session: Session, tables: Collection[str]) -> list[FlushedChange]:
+    """Return ``(table, id, operation, changed fields)`` for the rows of ``tables`` in the current flush.
+
+    Only valid inside ``after_flush``, while the session still holds the
+    pre-flush state; updates that did not change a column are skipped.
+    """
+
+    def of(objects) -> list[Any]:
+        return [obj for obj in objects if getattr(obj, "__tablename__", None) in tables]
+
+    changes: list[FlushedChange] = [(obj.__tablename__, _row_id(obj), "create", ()) for obj in of(session.new)]
+    changes += [
+        (obj.__tablename__, _row_id(obj), "update", fields) for obj in of(session.dirty) if (fields := _changed_fields(obj))
+    ]
+    changes += [(obj.__tablename__, _row_id(obj), "delete", ()) for obj in of(session.deleted)]
+    return changes
+
+
+def changes_query(after: int, limit: int, entities: Collection[str] | None = None) -> Select:
+    """Entries after ``after`` in sequence order, optionally of some entity types only."""
+
+    query = select(*Change.__table__.columns).where(Change.seq > after).order_by(Change.seq.asc()).limit(limit)
+    if entities:
+        query = query.where(Change.entity.in_(entities))
+    return query
+
+
+def bounds_query() -> Select:
+    """Oldest retained and newest sequence number (both ``None`` while the outbox is empty)."""
+
+    return select(func.min(Change.seq), func.max(Change.seq))
+
+
+def check_position(after: int, oldest: int | None, head: int | None) -> None:
+    """Raise :class:`ChangesCompacted` when entries right after ``after`` no longer exist."""
+
+    if oldest is not None and after < oldest - 1:
+        raise ChangesCompacted(after, head or 0)
+
+
+class ChangeReader:
+    """Batched outbox reader for in-process consumers.
+
+    Keeps its position between calls; persist :attr:`position` to resume
+    after a restart.
+    """
+
+    def __init__(self, after: int = 0, batch_size: int = 500, entities: Collection[str] | None = None) -> None:
+        self.position = after
+        self.batch_size = batch_size
+        self.entities = tuple(entities) if entities else None
+
+    def read(self, connection: Connection | Session) -> list[Row]:
+        """Return the next batch (empty when caught up) and advance past it."""
+
+        check_position(self.position, *connection.execute(bounds_query()).one())
+        rows = connection.execute(changes_query(self.position, self.batch_size, self.entities)).all()
+        if rows:
+            self.position = rows[-1].seq
+        return rows
+
+    def batches(self, connection: Connection | Session) -> Iterator[list[Row]]:
+        """Yield batches until the reader has caught up with the outbox."""
+
+        while batch := self.read(connection):
+            yield batch
+
+
+def compact_changes(connection: Connection, retention_days: int, now: datetime | None = None) -> int:
+    """Delete the entries up to the last one older than ``retention_days``; return rows removed.
+
+    Always removes a prefix of the sequence, so "oldest retained seq" tells
+    readers exactly which positions are gone, and keeps the newest entry so
+    the head stays known.
+    """
+
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+    last_expired = connection.scalar(select(func.max(Change.seq)).where(Change.created_at < cutoff))
+    if last_expired is None:
+        return 0
+    newest = select(func.max(Change.seq)).scalar_subquery()
+    return connection.execute(delete(Change).where(Change.seq <= last_expired, Change.seq < newest)).rowcount
+
+
+def append_changes(connection: Connection, changes: Collection[FlushedChange]) -> None:
+    """Append outbox entries for ``changes`` in the current transaction (for bulk Core writes)."""
+
+    connection.execute(
+        insert(Change),
+        [
+            {"entity": entity, "entity_id": entity_id, "operation": operation, "fields": list(fields) if operation == "update" else None}
+            for entity, entity_id, operation, fields in changes
+        ],
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _append_changes(session: Session, _flush_context) -> None:
+    changes = flushed_changes(session, OUTBOX_TABLES)
+    if changes:
+        append_changes(session.connection(), changes)
@@ -0,0 +1,208 @@
+"""Per-project task and news counters: computation, storage and the write hook.
+
+With ``project_counters_enabled`` every ORM flush that adds, removes or moves
+a task or news entry, or changes a task's status or due date, recomputes the
+counters of the touched projects in the same transaction. Recomputing
+(instead of applying deltas) keeps the rows exact under any mix of writes;
+it costs one grouped count per touched project. ``python -m app.cli counters``
+rebuilds every row, e.g. after enabling the feature on existing data.
+"""
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from itertools import chain
+
+from sqlalchemy import Connection, Engine, case, delete, event, func, insert, inspect, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.models.news import News
+from app.db.models.project import Project
+from app.db.models.project_counter import ProjectCounter
+from app.db.models.task import Task
+
+TASK_STATUSES = ("open", "in_progress", "done")
+# Task columns whose change can move a task between counters
+TASK_COUNTED_FIELDS = ("project_id", "status", "due_date")
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectCounts:
+    """Task counts by status, overdue tasks and news entries of one project."""
+
+    tasks: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TASK_STATUSES, 0))
+    overdue: int = 0
+    news: int = 0
+
+
+def utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def compute_counts(connection: Connection, project_ids: Collection[int] | None, today: date) -> dict[int, ProjectCounts]:
+    """Count tasks and news per project with one GROUP BY each; ``None`` counts every project."""
+
+    overdue = func.sum(case((Task.due_date < today, 1), else_=0))
+    task_query = select(Task.project_id, Task.status, func.count(), overdue).group_by(Task.project_id, Task.status)
+    news_query = select(News.project_id, func.count()).group_by(News.project_id)
+    if project_ids is not None:
+        task_query = task_query.where(Task.project_id.in_(project_ids))
+        news_query = news_query.where(News.project_id.in_(project_ids))
+    else:
+        task_query = task_query.where(Task.project_id.is_not(None))
+        news_query = news_query.where(News.project_id.is_not(None))
+
+    tasks: dict[int, dict[str, int]] = {}
+    overdue_counts: dict[int, int] = {}
+    for project_id, status, count, overdue_count in connection.execute(task_query):
+        tasks.setdefault(project_id, dict.fromkeys(TASK_STATUSES, 0))[status] = count
+        if status != "done":
+            overdue_counts[project_id] = overdue_counts.get(project_id, 0) + int(overdue_count or 0)
+    news = dict(connection.execute(news_query).all())
+
+    return {
+        project_id: ProjectCounts(
+            tasks=tasks.get(project_id, dict.fromkeys(TASK_STATUSES, 0)),
+            overdue=overdue_counts.get(project_id, 0),
+            news=news.get(project_id, 0),
+        )
+        for project_id in set(tasks) | set(news)
+    }
+
+
+def refresh_project_counters(connection: Connection, project_ids: Collection[int] | None = None, today: date | None = None) -> int:
+    """Recompute and store the counters of ``project_ids`` (all projects when ``None``); return rows written."""
+
+    today = today or utc_today()
+    existing = select(Project.id)
+    if project_ids is not None:
+        if not project_ids:
+            return 0
+        existing = existing.where(Project.id.in_(project_ids))
+    ids = list(connection.execute(existing).scalars())
+    counts = compute_counts(connection, ids if project_ids is not None else None, today)
+
+    stale = delete(ProjectCounter)
+    if project_ids is not None:
+        stale = stale.where(ProjectCounter.project_id.in_(project_ids))
+    connection.execute(stale)
+    rows = _counter_rows({project_id: counts.get(project_id, ProjectCounts()) for project_id in ids}, today)
+    if rows:
+        connection.execute(insert(ProjectCounter), rows)
+    return len(rows)
+
+
+def _counter_rows(counts: dict[int, ProjectCounts], today: date) -> list[dict]:
+    return [
+        {
+            "project_id": project_id,
+            "tasks_open": values.tasks["open"],
+            "tasks_in_progress": values.tasks["in_progress"],
+            "tasks_done": values.tasks["done"],
+            "tasks_overdue": values.overdue,
+            "news_count": values.news,
+            "counted_on": today,
+        }
+        for project_id, values in counts.items()
+    ]
+
+
+def _row_counts(row) -> ProjectCounts:
+    return ProjectCounts(
+        tasks={"open": row.tasks_open, "in_progress": row.tasks_in_progress, "done": row.tasks_done},
+        overdue=row.tasks_overdue,
+        news=row.news_count,
+    )
+
+
+def _store_counts(bind: Engine, counts: dict[int, ProjectCounts], today: date) -> None:
+    """Replace outdated counter rows with ``counts`` in a transaction of their own; best effort.
+
+    Rows a writer already counted today are kept: the insert then conflicts
+    and nothing is stored, and the next read retries the rest.
+    """
+
+    try:
+        with bind.begin() as connection:
+            connection.execute(
+                delete(ProjectCounter).where(ProjectCounter.project_id.in_(counts), ProjectCounter.counted_on < today)
+            )
+            connection.execute(insert(ProjectCounter), _counter_rows(counts, today))
+    except (IntegrityError, OperationalError):
+        pass
+
+
+def load_counts(session: Session, project_ids: Collection[int]) -> dict[int, ProjectCounts]:
+    """Return the counts of ``project_ids`` with a fixed number of queries.
+
+    Reads the counter rows when counters are enabled. Projects whose row is
+    missing or was counted on an earlier day are counted with GROUP BY
+    queries in one pass, and the fresh rows are stored outside ``session``:
+    committing the request's session would expire the objects the caller
+    has loaded. With counters disabled every project is counted that way.
+    Projects without tasks or news map to zero counts.
+    """
+
+    today = utc_today()
+    ids = list(project_ids)
+    if not ids:
+        return {}
+    connection = session.connection()
+    if not get_settings().project_counters_enabled:
+        counts = compute_counts(connection, ids, today)
+        return {project_id: counts.get(project_id, ProjectCounts()) for project_id in ids}
+
+    rows_query = select(ProjectCounter.__table__).where(ProjectCounter.project_id.in_(ids))
+    rows = {row.project_id: row for row in connection.execute(rows_query)}
+    stale = [project_id for project_id in ids if project_id not in rows or rows[project_id].counted_on != today]
+    if not stale:
+        return {project_id: _row_counts(rows[project_id]) for project_id in ids}
+    counted = compute_counts(connection, stale, today)
+    fresh = {project_id: counted.get(project_id, ProjectCounts()) for project_id in stale}
+    _store_counts(session.get_bind(), fresh, today)
+    return {project_id: fresh[project_id] if project_id in fresh else _row_counts(rows[project_id]) for project_id in ids}
+
+
+def load_project_counts(session: Session, project_id: int) -> ProjectCounts:
+    """Return the counts of one project; a primary-key lookup when counters are enabled."""
+
+    return load_counts(session, [project_id])[project_id]
+
+
+def _project_ids(obj: object, fields: Collection[str]) -> set[int]:
+    """Current and previous project ids of ``obj`` if any of ``fields`` changed."""
+
+    attrs = inspect(obj).attrs
+    if not any(getattr(attrs, name).history.has_changes() for name in fields):
+        return set()
+    return set(attrs.project_id.history.sum())
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_touched_counters(session: Session, _flush_context) -> None:
+    if not get_settings().project_counters_enabled:
+        return
+
+    touched: set[int | None] = set()
+    removed_projects: set[int] = set()
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, (Task, News)):
+            touched |= set(inspect(obj).attrs.project_id.history.sum())
+    for obj in session.dirty:
+        if isinstance(obj, Task):
+            touched |= _project_ids(obj, TASK_COUNTED_FIELDS)
+        elif isinstance(obj, News):
+            touched |= _project_ids(obj, ("project_id",))
+    for obj in session.deleted:
+        if isinstance(obj, Project):
+            removed_projects.add(obj.id)
+
+    connection = session.connection()
+    if removed_projects:
+        connection.execute(delete(ProjectCounter).where(ProjectCounter.project_id.in_(removed_projects)))
+    touched -= removed_projects
+    touched.discard(None)
+    if touched:
+        refresh_project_counters(connection, touched)
@@ -0,0 +1,88 @@
+"""Bulk upsert of metric values by name.
+
+External jobs report dozens of metrics at once. :func:`upsert_metrics`
+writes a batch with one ``INSERT ... ON CONFLICT (name) DO UPDATE``
+instead of one ORM round trip and commit per metric. The statement bypasses
+the session hooks, so it maintains their derived data itself: the series
+samples, the ``changes`` outbox, the ``metrics`` table version, the SSE
+feed and the view caches.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.core.change_feed import queue_changes
+from app.core.view_cache import mark_tables_changed
+from app.db.changes import FlushedChange, append_changes
+from app.db.metric_series import dialect_insert, epoch, record_samples
+from app.db.models.metric import Metric
+from app.db.versions import bump_versions
+
+
+class MetricRecord(NamedTuple):
+    """One reported value; ``updated_at`` is naive UTC like the ``metrics`` column."""
+
+    name: str
+    value: float
+    updated_at: datetime
+
+
+def coalesce_records(records: Iterable[MetricRecord], into: dict[str, MetricRecord] | None = None) -> dict[str, MetricRecord]:
+    """Keep the newest record per name (later records win ties), optionally merging into ``into``."""
+
+    newest = {} if into is None else into
+    for record in records:
+        current = newest.get(record.name)
+        if current is None or record.updated_at >= current.updated_at:
+            newest[record.name] = record
+    return newest
+
+
+def upsert_metrics(session: Session, records: Sequence[MetricRecord]) -> int:
+    """Create or update metrics by name in the session's transaction; return how many rows were written.
+
+    A record older than the stored ``updated_at`` leaves the metric as it is
+    but still becomes a sample of its series.
+    """
+
+    if not records:
+        return 0
+    newest = coalesce_records(records)
+    connection = session.connection()
+    existing = {
+        row.name: row for row in connection.execute(select(Metric.id, Metric.name, Metric.value).where(Metric.name.in_(newest)))
+    }
+
+    # Executed with a parameter list, SQLAlchemy sends the rows as one multi-row INSERT (pages of 1000)
+    # from a cached compilation instead of compiling a statement with thousands of literal VALUES
+    upsert = dialect_insert(connection, Metric.__table__)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"value": upsert.excluded.value, "updated_at": upsert.excluded.updated_at},
+        where=or_(Metric.updated_at.is_(None), Metric.updated_at <= upsert.excluded.updated_at),
+    ).returning(Metric.id, Metric.name)
+    written = connection.execute(
+        upsert, [{"name": record.name, "value": record.value, "updated_at": record.updated_at} for record in newest.values()]
+    ).all()
+
+    ids = {name: row.id for name, row in existing.items()} | {name: metric_id for metric_id, name in written}
+    record_samples(connection, [(ids[record.name], epoch(record.updated_at), record.value) for record in records])
+
+    changes: list[FlushedChange] = []
+    for metric_id, name in written:
+        before = existing.get(name)
+        if before is None:
+            changes.append(("metrics", metric_id, "create", ()))
+        else:
+            fields = ("value", "updated_at") if before.value != newest[name].value else ("updated_at",)
+            changes.append(("metrics", metric_id, "update", fields))
+    if changes:
+        append_changes(connection, changes)
+        bump_versions(connection, ["metrics"])
+        queue_changes(session, changes)
+        mark_tables_changed(session, ["metrics"])
+    return len(written)
@@ -0,0 +1,334 @@
+"""Metric time series: raw samples, background rollups and range reads.
+
+Every sample lands in ``metric_points`` (one row per metric and second) and
+marks its hour in ``metric_dirty_hours``. Writes to ``Metric.value`` through
+the ORM record a sample at ``updated_at``; the ingest endpoint writes batches
+directly. :func:`run_rollups` periodically folds the dirty hours into
+1-minute buckets from the raw rows, those into 1-hour buckets and those into
+1-day buckets, always recomputing whole buckets, so late or overwritten
+samples end up exact. :func:`apply_retention` then drops raw samples and
+rollups past their resolution's retention.
+
+Range reads return the finest resolution whose number of points fits the
+requested maximum and whose retention still covers the range start; the
+minutes since the last rollup run are only visible in the raw samples.
+"""
+
+import asyncio
+import calendar
+import logging
+import math
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Connection, Engine, Select, and_, delete, event, func, inspect, literal, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.db.models.metric import Metric, MetricDirtyHour, MetricPoint, MetricRollup
+
+logger = logging.getLogger("app.metrics")
+
+RAW = 0
+RESOLUTIONS = (60, 3600, 86400)
+RESOLUTION_NAMES = {RAW: "raw", 60: "1m", 3600: "1h", 86400: "1d"}
+HOUR = 3600
+
+
+def epoch(moment: datetime) -> int:
+    """Unix seconds of ``moment``; naive datetimes are taken as UTC like the rest of the schema."""
+
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return calendar.timegm(moment.timetuple())
+
+
+def retention_seconds(resolution: int, settings: Settings | None = None) -> int | None:
+    """How long samples of ``resolution`` are kept; ``None`` keeps them forever."""
+
+    settings = settings or get_settings()
+    days = {
+        RAW: settings.metric_raw_retention_days,
+        60: settings.metric_minute_retention_days,
+        3600: settings.metric_hour_retention_days,
+        86400: settings.metric_day_retention_days,
+    }[resolution]
+    return days * 86400 if days > 0 else None
+
+
+def dialect_insert(connection: Connection, model: Any):
+    """``INSERT`` with the ``ON CONFLICT`` clauses of the connection's dialect."""
+
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
+def record_samples(connection: Connection, samples: Sequence[tuple[int, int, float]]) -> None:
+    """Store ``(metric_id, ts, value)`` samples (a sample at an existing second replaces it)."""
+
+    if not samples:
+        return
+    upsert = dialect_insert(connection, MetricPoint)
+    connection.execute(
+        upsert.on_conflict_do_update(index_elements=["metric_id", "ts"], set_={"value": upsert.excluded.value}),
+        [{"metric_id": metric_id, "ts": ts, "value": value} for metric_id, ts, value in samples],
+    )
+    hours = {(metric_id, ts - ts % HOUR) for metric_id, ts, _value in samples}
+    connection.execute(
+        dialect_insert(connection, MetricDirtyHour).on_conflict_do_nothing(index_elements=["metric_id", "hour"]),
+        [{"metric_id": metric_id, "hour": hour} for metric_id, hour in sorted(hours)],
+    )
+
+
+def record_points(connection: Connection, metric_id: int, points: Sequence[tuple[int, float]]) -> None:
+    """Store ``(ts, value)`` samples of one metric."""
+
+    record_samples(connection, [(metric_id, ts, value) for ts, value in points])
+
+
+def _upsert_rollups(connection: Connection, grouped: Select, resolution: int, last_lookup) -> None:
+    """Insert ``grouped`` buckets at ``resolution``, taking ``last`` from the source row holding ``last_ts``."""
+
+    buckets = grouped.subquery()
+    rows = select(
+        buckets.c.metric_id,
+        literal(resolution).label("resolution"),
+        buckets.c.bucket,
+        buckets.c.min,
+        buckets.c.max,
+        buckets.c.sum,
+        buckets.c.count,
+        last_lookup(buckets).label("last"),
+        buckets.c.last_ts,
+    ).where(true())  # SQLite needs a WHERE to parse INSERT ... SELECT ... ON CONFLICT
+    upsert = dialect_insert(connection, MetricRollup).from_select(
+        ["metric_id", "resolution", "bucket", "min", "max", "sum", "count", "last", "last_ts"], rows
+    )
+    connection.execute(
+        upsert.on_conflict_do_update(
+            index_elements=["metric_id", "resolution", "bucket"],
+            set_={name: getattr(upsert.excluded, name) for name in ("min", "max", "sum", "count", "last", "last_ts")},
+        )
+    )
+
+
+def _rollup_minutes(connection: Connection, spans: Any) -> None:
+    point = MetricPoint
+    bucket = point.ts - point.ts % 60
+    grouped = (
+        select(
+            point.metric_id,
+            bucket.label("bucket"),
+            func.min(point.value).label("min"),
+            func.max(point.value).label("max"),
+            func.sum(point.value).label("sum"),
+            func.count().label("count"),
+            func.max(point.ts).label("last_ts"),
+        )
+        .select_from(spans)
+        .join(point, and_(point.metric_id == spans.c.metric_id, point.ts >= spans.c.start, point.ts < spans.c.start + spans.c.width))
+        .group_by(point.metric_id, bucket)
+    )
+
+    def last_value(buckets):
+        return (
+            select(MetricPoint.value)
+            .where(MetricPoint.metric_id == buckets.c.metric_id, MetricPoint.ts == buckets.c.last_ts)
+            .scalar_subquery()
+        )
+
+    _upsert_rollups(connection, grouped, 60, last_value)
+
+
+def _rollup_merge(connection: Connection, spans: Any, source: int, target: int) -> None:
+    rollup = MetricRollup
+    bucket = rollup.bucket - rollup.bucket % target
+    grouped = (
+        select(
+            rollup.metric_id,
+            bucket.label("bucket"),
+            func.min(rollup.min).label("min"),
+            func.max(rollup.max).label("max"),
+            func.sum(rollup.sum).label("sum"),
+            func.sum(rollup.count).label("count"),
+            func.max(rollup.last_ts).label("last_ts"),
+        )
+        .select_from(spans)
+        .join(
+            rollup,
+            and_(
+                rollup.metric_id == spans.c.metric_id,
+                rollup.resolution == source,
+                rollup.bucket >= spans.c.start,
+                rollup.bucket < spans.c.start + spans.c.width,
+            ),
+        )
+        .group_by(rollup.metric_id, bucket)
+    )
+
+    def last_value(buckets):
+        return (
+            select(MetricRollup.last)
+            .where(
+                MetricRollup.metric_id == buckets.c.metric_id,
+                MetricRollup.resolution == source,
+                MetricRollup.bucket == buckets.c.last_ts - buckets.c.last_ts % source,
+            )
+            .scalar_subquery()
+        )
+
+    _upsert_rollups(connection, grouped, target, last_value)
+
+
+def rollup_batch(connection: Connection, max_hours: int) -> int:
+    """Fold up to ``max_hours`` dirty metric-hours into all resolutions; return how many were processed."""
+
+    bound = connection.scalar(
+        select(func.max(MetricDirtyHour.id)).where(
+            MetricDirtyHour.id.in_(select(MetricDirtyHour.id).order_by(MetricDirtyHour.id).limit(max_hours))
+        )
+    )
+    if bound is None:
+        return 0
+    claimed = MetricDirtyHour.id <= bound
+    hours = (
+        select(MetricDirtyHour.metric_id, MetricDirtyHour.hour.label("start"), literal(HOUR).label("width"))
+        .where(claimed)
+        .subquery()
+    )
+    day = MetricDirtyHour.hour - MetricDirtyHour.hour % 86400
+    days = (
+        select(MetricDirtyHour.metric_id, day.label("start"), literal(86400).label("width"))
+        .where(claimed)
+        .group_by(MetricDirtyHour.metric_id, day)
+        .subquery()
+    )
+    _rollup_minutes(connection, hours)
+    _rollup_merge(connection, hours, 60, 3600)
+    _rollup_merge(connection, days, 3600, 86400)
+    return connection.execute(delete(MetricDirtyHour).where(claimed)).rowcount
+
+
+def apply_retention(connection: Connection, now: int) -> dict[str, int]:
+    """Drop raw samples and rollups older than their retention; return rows removed per resolution."""
+
+    removed: dict[str, int] = {}
+    metric_ids = select(Metric.id).scalar_subquery()
+    raw = retention_seconds(RAW)
+    if raw is not None:
+        removed["raw"] = connection.execute(
+            delete(MetricPoint).where(MetricPoint.metric_id.in_(metric_ids), MetricPoint.ts < now - raw)
+        ).rowcount
+    for resolution in RESOLUTIONS:
+        keep = retention_seconds(resolution)
+        if keep is not None:
+            removed[RESOLUTION_NAMES[resolution]] = connection.execute(
+                delete(MetricRollup).where(
+                    MetricRollup.metric_id.in_(metric_ids),
+                    MetricRollup.resolution == resolution,
+                    MetricRollup.bucket < now - keep,
+                )
+            ).rowcount
+    return removed
+
+
+def run_rollups(engine: Engine, batch_hours: int | None = None) -> int:
+    """Roll up every dirty hour (one transaction per batch), then apply retention; return hours processed."""
+
+    batch_hours = batch_hours or get_settings().metric_rollup_batch_hours
+    processed = 0
+    while True:
+        with engine.begin() as connection:
+            done = rollup_batch(connection, batch_hours)
+        processed += done
+        if done < batch_hours:
+            break
+    with engine.begin() as connection:
+        apply_retention(connection, epoch(datetime.now(timezone.utc)))
+    return processed
+
+
+async def rollup_forever(engine_factory, interval: float) -> None:
+    """Run :func:`run_rollups` every ``interval`` seconds on the threadpool until cancelled."""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run_rollups, engine_factory())
+        except Exception:
+            logger.exception("Metric rollup failed; retrying in %s s", interval)
+
+
+def _series_query(metric_id: int, resolution: int, start: int, end: int) -> Select:
+    if resolution == RAW:
+        point = MetricPoint
+        return (
+            select(
+                point.ts,
+                point.value.label("min"),
+                point.value.label("max"),
+                point.value.label("avg"),
+                literal(1).label("count"),
+                point.value.label("last"),
+            )
+            .where(point.metric_id == metric_id, point.ts >= start, point.ts < end)
+            .order_by(point.ts)
+        )
+    rollup = MetricRollup
+    return (
+        select(
+            rollup.bucket.label("ts"),
+            rollup.min,
+            rollup.max,
+            (rollup.sum / rollup.count).label("avg"),
+            rollup.count,
+            rollup.last,
+        )
+        .where(rollup.metric_id == metric_id, rollup.resolution == resolution, rollup.bucket >= start, rollup.bucket < end)
+        .order_by(rollup.bucket)
+    )
+
+
+async def read_series(db, metric_id: int, start: int, end: int, max_points: int, now: int) -> tuple[int, list[Any]]:
+    """Return ``(resolution, rows)`` for ``[start, end)`` with at most ``max_points`` rows.
+
+    Rows carry ``ts`` (bucket start), ``min``, ``max``, ``avg``, ``count`` and ``last``.
+    """
+
+    resolution = RESOLUTIONS[-1]
+    for candidate in (RAW, *RESOLUTIONS[:-1]):
+        keep = retention_seconds(candidate)
+        if keep is not None and start < now - keep:
+            continue
+        if candidate == RAW:
+            sample = (
+                select(MetricPoint.ts)
+                .where(MetricPoint.metric_id == metric_id, MetricPoint.ts >= start, MetricPoint.ts < end)
+                .limit(max_points + 1)
+            )
+            fits = await db.scalar(select(func.count()).select_from(sample.subquery())) <= max_points
+        else:
+            fits = math.ceil((end - start) / candidate) <= max_points
+        if fits:
+            resolution = candidate
+            break
+    rows = (await db.execute(_series_query(metric_id, resolution, start, end).limit(max_points))).all()
+    return resolution, rows
+
+
+@event.listens_for(Session, "after_flush")
+def _record_metric_writes(session: Session, _flush_context) -> None:
+    """Record a sample whenever a metric is created or its value changes; drop the series of deleted metrics."""
+
+    samples = [obj for obj in session.new if isinstance(obj, Metric)]
+    samples += [obj for obj in session.dirty if isinstance(obj, Metric) and inspect(obj).attrs.value.history.has_changes()]
+    removed = [obj.id for obj in session.deleted if isinstance(obj, Metric)]
+    if not samples and not removed:
+        return
+    connection = session.connection()
+    record_samples(connection, [(metric.id, epoch(metric.updated_at or datetime.utcnow()), metric.value) for metric in samples])
+    if removed:
+        for model in (MetricPoint, MetricRollup, MetricDirtyHour):
+            connection.execute(delete(model).where(model.metric_id.in_(removed)))
@@ -0,0 +1,75 @@
+"""Alembic helpers used at startup and by the CLI."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+# What to do with a database created by ``create_all`` before migrations existed
+UNVERSIONED_HINT = (
+    "Database has tables but no migration revision; "
+    "run `python -m app.cli stamp 0001_initial_schema`, then `python -m app.cli migrate`"
+)
+
+
+@dataclass(frozen=True)
+class SchemaState:
+    """Current and expected migration revision of a database."""
+
+    current: str | None
+    head: str
+    has_tables: bool
+
+    @property
+    def is_current(self) -> bool:
+        return self.current == self.head
+
+    @property
+    def is_unversioned(self) -> bool:
+        """True for databases created by ``create_all`` before migrations existed."""
+
+        return self.current is None and self.has_tables
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    """Return the Alembic config, optionally bound to an existing connection."""
+
+    config = Config(str(ALEMBIC_INI))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def head_revision() -> str:
+    """Return the newest migration revision shipped with the code."""
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def schema_state(engine: Engine) -> SchemaState:
+    """Compare the database's migration revision with the head revision in one round trip."""
+
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+        has_tables = bool(current) or bool(inspect(connection).get_table_names())
+    return SchemaState(current=current, head=head_revision(), has_tables=has_tables)
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """Apply migrations up to ``revision`` on ``engine``."""
+
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), revision)
+
+
+def stamp_database(engine: Engine, revision: str = "head") -> None:
+    """Mark the database as being at ``revision`` without running migrations."""
+
+    with engine.begin() as connection:
+        command.stamp(alembic_config(connection), revision)
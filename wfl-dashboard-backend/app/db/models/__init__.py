@@ -1,21 +1,33 @@
 """Expose ORM models for import convenience."""
 
+from app.db.models.change import Change
 from app.db.models.event import Event
-from app.db.models.metric import Metric
-from app.db.models.news import News
+from app.db.models.metric import Metric, MetricDirtyHour, MetricPoint, MetricRollup
+from app.db.models.news import News, NewsTag
 from app.db.models.project import Project
+from app.db.models.project_counter import ProjectCounter
 from app.db.models.room import Room
-from app.db.models.system_status import SystemStatus
+from app.db.models.system_status import SystemStatus, SystemStatusDay, SystemStatusTransition
+from app.db.models.table_version import TableVersion
 from app.db.models.task import Task
 from app.db.models.user import User
 
 __all__ = [
     "User",
     "Project",
+    "ProjectCounter",
     "News",
+    "NewsTag",
     "Room",
     "Event",
     "Task",
     "Metric",
+    "MetricPoint",
+    "MetricRollup",
+    "MetricDirtyHour",
     "SystemStatus",
+    "SystemStatusTransition",
+    "SystemStatusDay",
+    "TableVersion",
+    "Change",
 ]
@@ -0,0 +1,30 @@
+"""Append-only outbox of committed writes."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+from app.db.base import Base
+
+
+class Change(Base):
+    """One create, update or delete of a row, appended in the transaction that wrote it."""
+
+    __tablename__ = "changes"
+
+    seq = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    operation = Column(String, nullable=False)
+    # Changed columns of an update; NULL for creates and deletes
+    fields = Column(JSON, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # /changes?entity=: one entity type in sequence order
+        Index("ix_changes_entity_seq", "entity", "seq"),
+        # compaction: drop entries older than the retention window
+        Index("ix_changes_created_at", "created_at"),
+        # Never reuse a sequence number, not even after compaction emptied the table
+        {"sqlite_autoincrement": True},
+    )
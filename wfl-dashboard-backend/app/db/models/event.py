@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -26,3 +26,14 @@ class Event(Base):
     room = relationship("Room", back_populates="events")
     project = relationship("Project", back_populates="events")
     creator = relationship("User", back_populates="events_created")
+
+    __table_args__ = (
+        # list_events / dashboard summary: range on start, ordered by start
+        Index("ix_events_start", "start"),
+        # list_events?room_id=: equality on room, ordered by start
+        Index("ix_events_room_start", "room_id", "start"),
+        # booking conflicts and room availability: events of a room still running after a moment
+        Index("ix_events_room_end_start", "room_id", "end", "start"),
+        # project summary: upcoming events of one project
+        Index("ix_events_project_start", "project_id", "start"),
+    )
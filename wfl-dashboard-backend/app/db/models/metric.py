@@ -1,8 +1,8 @@
-"""SQLAlchemy model for simple key-value metrics."""
+"""SQLAlchemy models for dashboard metrics and their time series."""
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
 
 from app.db.base import Base
 
@@ -16,3 +16,50 @@ class Metric(Base):
     name = Column(String, nullable=False, unique=True)
     value = Column(Float, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class MetricPoint(Base):
+    """One raw sample of a metric; ``ts`` is in Unix seconds (UTC) to keep rows small."""
+
+    __tablename__ = "metric_points"
+
+    metric_id = Column(Integer, ForeignKey("metrics.id", ondelete="CASCADE"), primary_key=True)
+    ts = Column(Integer, primary_key=True)
+    value = Column(Float, nullable=False)
+
+    # Rows live in the primary-key B-tree: range reads of one metric are sequential, no rowid index
+    __table_args__ = ({"sqlite_with_rowid": False},)
+
+
+class MetricRollup(Base):
+    """Aggregate of one metric over a 1-minute, 1-hour or 1-day bucket.
+
+    Sum and count instead of the average, and the timestamp of the last
+    sample, let coarser buckets be merged exactly from finer ones.
+    """
+
+    __tablename__ = "metric_rollups"
+
+    metric_id = Column(Integer, ForeignKey("metrics.id", ondelete="CASCADE"), primary_key=True)
+    resolution = Column(Integer, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    min = Column(Float, nullable=False)
+    max = Column(Float, nullable=False)
+    sum = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+    last = Column(Float, nullable=False)
+    last_ts = Column(Integer, nullable=False)
+
+    __table_args__ = ({"sqlite_with_rowid": False},)
+
+
+class MetricDirtyHour(Base):
+    """An hour of one metric that received samples since the last rollup run."""
+
+    __tablename__ = "metric_dirty_hours"
+
+    id = Column(Integer, primary_key=True)
+    metric_id = Column(Integer, nullable=False)
+    hour = Column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_metric_dirty_hours_metric_hour", "metric_id", "hour", unique=True),)
@@ -1,8 +1,8 @@
-"""SQLAlchemy model representing internal news posts."""
+"""SQLAlchemy models for internal news posts and their normalized tags."""
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, JSON, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -24,3 +24,28 @@ class News(Base):
 
     project = relationship("Project", back_populates="news_entries")
     author = relationship("User", back_populates="news_entries")
+
+    __table_args__ = (
+        # list_news / dashboard summary: newest first, optional since filter
+        Index("ix_news_created_at", "created_at"),
+        # list_news?is_public=: visibility filter, newest first
+        Index("ix_news_public_created", "is_public", "created_at"),
+        # project summary: recent news of one project
+        Index("ix_news_project_created", "project_id", "created_at"),
+    )
+
+
+class NewsTag(Base):
+    """One row per tag of a news entry, mirroring ``News.tags`` for indexed filtering."""
+
+    __tablename__ = "news_tags"
+
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    # Copy of news.created_at so a tag's entries are read newest first straight from the index
+    created_at = Column(DateTime)
+
+    __table_args__ = (
+        # list_news?tag=: one tag, newest first; facet counts group on the leading column
+        Index("ix_news_tags_tag_created", "tag", "created_at", "news_id"),
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -27,4 +27,8 @@ class Project(Base):
 
     __table_args__ = (
         CheckConstraint("status IN ('green','yellow','red')", name="ck_projects_status"),
+        # list_projects / dashboard summary: newest first
+        Index("ix_projects_created_at", "created_at"),
+        # list_projects?status=: status filter, newest first
+        Index("ix_projects_status_created", "status", "created_at"),
     )
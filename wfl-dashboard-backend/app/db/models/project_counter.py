@@ -0,0 +1,23 @@
+"""Denormalized per-project counters backing the project summary."""
+
+from sqlalchemy import Column, Date, ForeignKey, Integer
+
+from app.db.base import Base
+
+
+class ProjectCounter(Base):
+    """Task and news counts of one project, kept current by the ORM write hooks.
+
+    ``tasks_overdue`` depends on the calendar day; ``counted_on`` records the
+    day it refers to so readers can refresh rows counted on an earlier day.
+    """
+
+    __tablename__ = "project_counters"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    tasks_open = Column(Integer, nullable=False, default=0)
+    tasks_in_progress = Column(Integer, nullable=False, default=0)
+    tasks_done = Column(Integer, nullable=False, default=0)
+    tasks_overdue = Column(Integer, nullable=False, default=0)
+    news_count = Column(Integer, nullable=False, default=0)
+    counted_on = Column(Date, nullable=False)
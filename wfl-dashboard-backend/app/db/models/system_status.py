@@ -1,8 +1,8 @@
-"""SQLAlchemy model storing service health information."""
+"""SQLAlchemy models storing service health information and its history."""
 
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, Integer, String, Text
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, Integer, String, Text
 
 from app.db.base import Base
 
@@ -21,3 +21,41 @@ class SystemStatus(Base):
     __table_args__ = (
         CheckConstraint("status IN ('ok','warning','down','planned')", name="ck_system_status_state"),
     )
+
+
+class SystemStatusTransition(Base):
+    """A service entering a status at ``ts`` (Unix seconds, UTC); append-only.
+
+    ``status`` is ``NULL`` from the moment a service's entry was deleted.
+    """
+
+    __tablename__ = "system_status_history"
+
+    id = Column(Integer, primary_key=True)
+    service = Column(String, nullable=False)
+    status = Column(String)
+    message = Column(Text)
+    ts = Column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_system_status_history_service_ts", "service", "ts"),)
+
+
+class SystemStatusDay(Base):
+    """Seconds per status, incidents and repairs of one service over one UTC day.
+
+    A repair counts on the day the incident ended, with its full duration.
+    """
+
+    __tablename__ = "system_status_daily"
+
+    service = Column(String, primary_key=True)
+    day = Column(Integer, primary_key=True)
+    ok_seconds = Column(Integer, nullable=False, default=0)
+    warning_seconds = Column(Integer, nullable=False, default=0)
+    down_seconds = Column(Integer, nullable=False, default=0)
+    planned_seconds = Column(Integer, nullable=False, default=0)
+    incidents = Column(Integer, nullable=False, default=0)
+    recoveries = Column(Integer, nullable=False, default=0)
+    repair_seconds = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = ({"sqlite_with_rowid": False},)
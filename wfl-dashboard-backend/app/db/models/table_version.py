@@ -0,0 +1,14 @@
+"""Per-table change counters backing conditional GETs."""
+
+from sqlalchemy import Column, Integer, String
+
+from app.db.base import Base
+
+
+class TableVersion(Base):
+    """Monotonic change version of one table, bumped in the transaction that writes it."""
+
+    __tablename__ = "table_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
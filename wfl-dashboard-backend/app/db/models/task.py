@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text, desc
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -29,4 +29,12 @@ class Task(Base):
 
     __table_args__ = (
         CheckConstraint("status IN ('open','in_progress','done')", name="ck_tasks_status"),
+        # project summary/counter GROUP BY (covering, incl. overdue) and list_tasks?project_id=&status=
+        Index("ix_tasks_project_status_due", "project_id", "status", "due_date"),
+        # list_tasks?assignee_id=: ordered by due date
+        Index("ix_tasks_assignee_due", "assignee_id", "due_date"),
+        # list_tasks?status=: ordered by due date
+        Index("ix_tasks_status_due", "status", "due_date"),
+        # list_tasks without filters: due_date ASC, created_at DESC
+        Index("ix_tasks_due_created", "due_date", desc("created_at")),
     )
@@ -0,0 +1,50 @@
+"""The ``news_tags`` mirror of ``News.tags`` and its write hook.
+
+Every ORM flush that adds or deletes a news entry, or changes its tags or
+``created_at``, rewrites that entry's ``news_tags`` rows in the same
+transaction, so tag filters and facets can read the index instead of
+decoding the JSON column. The ``0004_news_tags`` migration backfilled rows
+written before the table existed.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import delete, event, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.db.models.news import News, NewsTag
+
+
+def normalize_tags(tags: Iterable[str] | None) -> list[str]:
+    """Return ``tags`` without blanks and duplicates, keeping their order."""
+
+    return list(dict.fromkeys(tag for tag in tags or () if tag))
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_news_tags(session: Session, _flush_context) -> None:
+    """Rewrite ``news_tags`` for news rows whose tags or timestamp changed in this flush."""
+
+    changed: list[News] = []
+    for obj in session.new:
+        if isinstance(obj, News):
+            changed.append(obj)
+    for obj in session.dirty:
+        if isinstance(obj, News):
+            attrs = inspect(obj).attrs
+            if attrs.tags.history.has_changes() or attrs.created_at.history.has_changes():
+                changed.append(obj)
+    removed = [obj.id for obj in session.deleted if isinstance(obj, News)]
+
+    stale = [obj.id for obj in changed] + removed
+    if not stale:
+        return
+    connection = session.connection()
+    connection.execute(delete(NewsTag).where(NewsTag.news_id.in_(stale)))
+    rows = [
+        {"news_id": obj.id, "tag": tag, "created_at": obj.created_at}
+        for obj in changed
+        for tag in normalize_tags(obj.tags)
+    ]
+    if rows:
+        connection.execute(insert(NewsTag), rows)
@@ -0,0 +1,53 @@
+"""Room booking conflicts and free slots.
+
+Events occupy their room for ``[start, end)``, so back-to-back bookings do
+not conflict. :func:`overlapping_events` finds the bookings a new or moved
+event would collide with. It reads ``ix_events_room_end_start`` from the
+event's start onwards, which touches only the events of the room that are
+still running then, not the room's past.
+
+:func:`free_slots` computes the gaps of many rooms from one result set.
+Bookings sorted by room and start are swept once, carrying the end of the
+busy stretch so far, so overlapping legacy bookings merge correctly.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from operator import itemgetter
+
+from sqlalchemy import Select, select
+
+from app.db.models.event import Event
+
+
+def overlapping_events(room_id: int, start: datetime, end: datetime, exclude_id: int | None = None) -> Select:
+    """Select the ids of events in ``room_id`` that overlap ``[start, end)``, earliest first."""
+
+    query = select(Event.id).where(Event.room_id == room_id, Event.end > start, Event.start < end)
+    if exclude_id is not None:
+        query = query.where(Event.id != exclude_id)
+    return query.order_by(Event.end)
+
+
+def bookings_query(room_ids: Sequence[int], start: datetime, end: datetime) -> Select:
+    """Select ``(room_id, start, end)`` of the events in ``room_ids`` overlapping ``[start, end)``."""
+
+    return select(Event.room_id, Event.start, Event.end).where(Event.room_id.in_(room_ids), Event.end > start, Event.start < end)
+
+
+def free_slots(
+    room_ids: Iterable[int], bookings: Iterable[tuple[int, datetime, datetime]], start: datetime, end: datetime
+) -> dict[int, list[tuple[datetime, datetime]]]:
+    """Return the free ``(start, end)`` slots within ``[start, end)`` per room, in order."""
+
+    slots: dict[int, list[tuple[datetime, datetime]]] = {room_id: [] for room_id in room_ids}
+    cursors = dict.fromkeys(slots, start)
+    for room_id, booked_from, booked_to in sorted(bookings, key=itemgetter(0, 1)):
+        cursor = cursors[room_id]
+        if booked_from > cursor:
+            slots[room_id].append((cursor, booked_from))
+        cursors[room_id] = max(cursor, booked_to)
+    for room_id, cursor in cursors.items():
+        if cursor < end:
+            slots[room_id].append((cursor, end))
+    return slots
@@ -0,0 +1,123 @@
+"""SQLite FTS5 full-text index over news, projects, tasks and events.
+
+All four sources share one FTS5 table so a query is ranked by BM25 across
+types in a single MATCH. The rowid encodes the source row as
+``id * ROWID_STRIDE + code``, which lets triggers replace an entry by rowid
+instead of scanning for it. Triggers on the source tables keep the index in
+sync for every write path, including bulk Core inserts.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, event
+
+from app.db.base import Base
+
+SEARCH_TABLE = "search_index"
+ROWID_STRIDE = 4
+# Title matches weigh ten times as much as body matches
+RANK_FUNCTION = "bm25(10.0, 1.0)"
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSource:
+    """A table feeding the index: which columns become title, body and project."""
+
+    kind: str
+    table: str
+    code: int
+    title: str
+    body: str
+    project: str
+
+
+SOURCES = (
+    SearchSource("news", "news", 0, "title", "body", "project_id"),
+    SearchSource("project", "projects", 1, "title", "description", "id"),
+    SearchSource("task", "tasks", 2, "title", "description", "project_id"),
+    SearchSource("event", "events", 3, "title", "description", "project_id"),
+)
+KINDS = {source.code: source.kind for source in SOURCES}
+KIND_CODES = {source.kind: source.code for source in SOURCES}
+
+
+def _entry(source: SearchSource, row: str) -> str:
+    return (
+        f"{row}.id * {ROWID_STRIDE} + {source.code}, {row}.{source.title}, "
+        f"coalesce({row}.{source.body}, ''), {row}.{source.project}"
+    )
+
+
+def create_statements() -> list[str]:
+    """DDL for the FTS table, its rank configuration and the sync triggers."""
+
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "title, body, project_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+        f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rank) VALUES ('rank', '{RANK_FUNCTION}')",
+    ]
+    for source in SOURCES:
+        insert = f"INSERT INTO {SEARCH_TABLE}(rowid, title, body, project_id) VALUES ({_entry(source, 'new')});"
+        delete = f"DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * {ROWID_STRIDE} + {source.code};"
+        columns = ", ".join(dict.fromkeys(c for c in (source.title, source.body, source.project) if c != "id"))
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {source.table}_search_ai AFTER INSERT ON {source.table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {source.table}_search_ad AFTER DELETE ON {source.table} BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {source.table}_search_au AFTER UPDATE OF {columns} ON {source.table} "
+            f"BEGIN {delete} {insert} END",
+        ]
+    return statements
+
+
+def rebuild_statements() -> list[str]:
+    """Statements that refill the index from the source tables."""
+
+    statements = [f"DELETE FROM {SEARCH_TABLE}"]
+    for source in SOURCES:
+        statements.append(
+            f"INSERT INTO {SEARCH_TABLE}(rowid, title, body, project_id) "
+            f"SELECT {_entry(source, source.table)} FROM {source.table}"
+        )
+    statements.append(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    return statements
+
+
+def drop_statements() -> list[str]:
+    statements = [
+        f"DROP TRIGGER IF EXISTS {source.table}_search_{suffix}" for source in SOURCES for suffix in ("ai", "ad", "au")
+    ]
+    return statements + [f"DROP TABLE IF EXISTS {SEARCH_TABLE}"]
+
+
+def match_expression(text: str) -> str | None:
+    """Turn free user input into a safe FTS5 query.
+
+    Words are quoted so FTS5 operators in the input are taken literally, all
+    words must match, and the last word matches as a prefix for
+    search-as-you-type. Returns ``None`` when the input has no words.
+    """
+
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def _run(connection: Connection, statements: list[str]) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(_metadata, connection: Connection, **_kw) -> None:
+    _run(connection, create_statements())
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_index(_metadata, connection: Connection, **_kw) -> None:
+    _run(connection, drop_statements())
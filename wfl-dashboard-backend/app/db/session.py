@@ -1,23 +1,210 @@
 """Database session and engine configuration."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, ScalarResult, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.core.telemetry import instrument_engine
+
+T = TypeVar("T")
+
+# Rows are fetched inside the worker thread so the event loop never touches the cursor
+_PREBUFFER = {"prebuffer_rows": True}
+
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def _connect_args(database_url: str) -> dict[str, Any]:
+    return {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+
+
+def _is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(database_url: str, settings: Settings) -> dict[str, Any]:
+    options: dict[str, Any] = {"connect_args": _connect_args(database_url)}
+    if not _is_memory_sqlite(database_url):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    """Return the PRAGMA statements of the configured SQLite performance profile."""
+
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+    ]
+
+
+def apply_sqlite_profile(sync_engine: Engine, settings: Settings) -> None:
+    """Run the SQLite performance PRAGMAs on every new connection of ``sync_engine``."""
+
+    if sync_engine.dialect.name != "sqlite" or not settings.sqlite_profile_enabled:
+        return
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_url: str, settings: Settings | None = None) -> Engine:
+    """Create the sync engine with pool settings and the SQLite profile applied."""
+
+    settings = settings or get_settings()
+    sync_engine = create_engine(database_url, **_engine_options(database_url, settings))
+    apply_sqlite_profile(sync_engine, settings)
+    instrument_engine(sync_engine)
+    return sync_engine
+
+
+def async_database_url(database_url: str) -> str:
+    """Return ``database_url`` rewritten for its asyncio driver (aiosqlite / asyncpg)."""
+
+    url = make_url(database_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or url.drivername in _ASYNC_DRIVERS.values():
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_sessionmaker(database_url: str, settings: Settings | None = None) -> async_sessionmaker[AsyncSession]:
+    """Build an ``AsyncEngine`` and session factory for ``database_url``."""
+
+    settings = settings or get_settings()
+    async_engine = create_async_engine(async_database_url(database_url), **_engine_options(database_url, settings))
+    apply_sqlite_profile(async_engine.sync_engine, settings)
+    instrument_engine(async_engine.sync_engine)
+    return async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+class ThreadedSession:
+    """``AsyncSession``-compatible facade that runs a sync ``Session`` on the threadpool.
+
+    Route handlers are written once against the ``AsyncSession`` API; in sync
+    mode each database call hops to the anyio threadpool as before.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+
+    def add(self, instance: object) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances: Iterable[object]) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, params=None, *, execution_options=None, **kw):
+        options = {**_PREBUFFER, **(execution_options or {})}
+        return await run_in_threadpool(
+            self.sync_session.execute, statement, params, execution_options=options, **kw
+        )
+
+    async def scalar(self, statement, params=None, **kw):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kw)
+
+    async def scalars(self, statement, params=None, *, execution_options=None, **kw):
+        options = {**_PREBUFFER, **(execution_options or {})}
+        return await run_in_threadpool(
+            self.sync_session.scalars, statement, params, execution_options=options, **kw
+        )
+
+    async def stream_scalars(self, statement, params=None, *, execution_options=None, **kw) -> "ThreadedScalarStream":
+        """Unbuffered counterpart of ``scalars``; rows are fetched as the stream is consumed."""
+
+        result = await run_in_threadpool(
+            self.sync_session.scalars, statement, params, execution_options=execution_options or {}, **kw
+        )
+        return ThreadedScalarStream(result)
+
+    async def get(self, entity, ident, **kw):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kw)
+
+    async def delete(self, instance: object) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def refresh(self, instance: object, attribute_names: Iterable[str] | None = None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kw: Any) -> T:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kw)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedScalarStream:
+    """``AsyncScalarResult``-compatible wrapper fetching each partition on the threadpool."""
+
+    def __init__(self, result: ScalarResult) -> None:
+        self._result = result
+
+    async def partitions(self, size: int | None = None) -> AsyncIterator[Sequence[Any]]:
+        partitions = self._result.partitions(size)
+        while (partition := await run_in_threadpool(next, partitions, None)) is not None:
+            yield partition
+
+    async def close(self) -> None:
+        await run_in_threadpool(self._result.close)
 
-from app.core.config import get_settings
 
 _settings = get_settings()
-engine = create_engine(
-    _settings.database_url,
-    connect_args={"check_same_thread": False} if _settings.database_url.startswith("sqlite") else {},
-)
+engine = create_db_engine(_settings.database_url, _settings)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = create_async_sessionmaker(_settings.database_url) if _settings.database_async else None
+
 
+@asynccontextmanager
+async def open_db() -> AsyncIterator[AsyncSession]:
+    """Open a database session for the configured mode and close it on exit."""
 
-def get_db():
-    """Yield a database session that closes after use."""
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
 
-    db = SessionLocal()
+    session = ThreadedSession(SessionLocal())
     try:
-        yield db
+        yield session
     finally:
-        db.close()
+        await session.close()
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Yield a database session for the configured mode that closes after use."""
+
+    async with open_db() as session:
+        yield session
@@ -0,0 +1,228 @@
+"""Status history of system services, daily rollups and uptime over windows.
+
+Every status change of a ``SystemStatus`` entry made through the ORM
+appends a row to ``system_status_history`` (deleting the entry appends a
+``NULL`` status). Message-only updates are not transitions. Only the
+history is needed for correctness. :func:`run_status_rollups` folds each
+complete UTC day into one ``system_status_daily`` row per service, so
+:func:`compute_uptime` sums at most one row per day of the window. It reads
+transitions only for the partial days at the window's edges, plus any days
+the rollup job has not reached yet.
+
+Time before a service's first transition or after its deletion counts as
+unobserved. ``planned`` (maintenance) time is observed but is not part of
+the uptime base. An incident is a transition into ``down``; it counts on
+the day it starts. Its repair time counts on the day it ends, so the
+MTTR over a window covers the incidents that ended within it.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from sqlalchemy import Connection, Engine, delete, event, func, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.metric_series import epoch
+from app.db.models.system_status import SystemStatus, SystemStatusDay, SystemStatusTransition
+
+logger = logging.getLogger("app.health")
+
+DAY = 86400
+
+# Status held since a timestamp; ``(None, None)`` before the first transition
+State = tuple[str | None, int | None]
+
+
+@dataclass(slots=True)
+class UptimeTotals:
+    """Seconds per status, incidents and repairs over a span; summable across spans."""
+
+    ok_seconds: int = 0
+    warning_seconds: int = 0
+    down_seconds: int = 0
+    planned_seconds: int = 0
+    incidents: int = 0
+    recoveries: int = 0
+    repair_seconds: int = 0
+
+    def add(self, other: "UptimeTotals") -> None:
+        for name in _TOTAL_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def uptime_ratio(self) -> float | None:
+        """Share of ``ok``/``warning`` time in the observed time outside maintenance."""
+
+        base = self.ok_seconds + self.warning_seconds + self.down_seconds
+        return (self.ok_seconds + self.warning_seconds) / base if base else None
+
+    @property
+    def mttr_seconds(self) -> float | None:
+        return self.repair_seconds / self.recoveries if self.recoveries else None
+
+
+_TOTAL_FIELDS = tuple(field.name for field in fields(UptimeTotals))
+_STATUS_SECONDS = {"ok": "ok_seconds", "warning": "warning_seconds", "down": "down_seconds", "planned": "planned_seconds"}
+
+
+def accumulate(totals: UptimeTotals, state: State, transitions: Iterable[tuple[str | None, int]], start: int, end: int) -> State:
+    """Add ``[start, end)`` to ``totals`` and return the state at ``end``.
+
+    ``state`` is the status in effect at ``start`` and since when.
+    ``transitions`` are the ``(status, ts)`` changes in the span, in order.
+    """
+
+    status, since = state
+    cursor = start
+    for new_status, ts in transitions:
+        if status is not None:
+            column = _STATUS_SECONDS[status]
+            setattr(totals, column, getattr(totals, column) + ts - cursor)
+        cursor = ts
+        if new_status == status:
+            continue
+        if status == "down":
+            totals.recoveries += 1
+            totals.repair_seconds += ts - since
+        if new_status == "down":
+            totals.incidents += 1
+        status, since = new_status, ts
+    if status is not None:
+        column = _STATUS_SECONDS[status]
+        setattr(totals, column, getattr(totals, column) + end - cursor)
+    return status, since
+
+
+def state_at(connection: Connection, service: str, ts: int) -> State:
+    """Return the status of ``service`` just before ``ts`` and when it began."""
+
+    row = connection.execute(
+        select(SystemStatusTransition.status, SystemStatusTransition.ts)
+        .where(SystemStatusTransition.service == service, SystemStatusTransition.ts < ts)
+        .order_by(SystemStatusTransition.ts.desc(), SystemStatusTransition.id.desc())
+        .limit(1)
+    ).first()
+    return (None, None) if row is None else (row.status, row.ts)
+
+
+def transitions_query(service: str, start: int, end: int):
+    return (
+        select(SystemStatusTransition.status, SystemStatusTransition.ts)
+        .where(SystemStatusTransition.service == service, SystemStatusTransition.ts >= start, SystemStatusTransition.ts < end)
+        .order_by(SystemStatusTransition.ts, SystemStatusTransition.id)
+    )
+
+
+def _from_history(connection: Connection, totals: UptimeTotals, service: str, start: int, end: int) -> None:
+    if start < end:
+        accumulate(totals, state_at(connection, service, start), connection.execute(transitions_query(service, start, end)), start, end)
+
+
+def rollup_service(connection: Connection, service: str, until: int, max_days: int) -> int:
+    """Roll up to ``max_days`` complete days of ``service`` before ``until``; return how many were written."""
+
+    frontier = connection.scalar(select(func.max(SystemStatusDay.day)).where(SystemStatusDay.service == service))
+    if frontier is None:
+        first = connection.scalar(select(func.min(SystemStatusTransition.ts)).where(SystemStatusTransition.service == service))
+        if first is None:
+            return 0
+        start = first - first % DAY
+    else:
+        start = frontier + DAY
+    end = min(start + max_days * DAY, until - until % DAY)
+    if start >= end:
+        return 0
+
+    state = state_at(connection, service, start)
+    pending = iter(connection.execute(transitions_query(service, start, end)).all())
+    upcoming = next(pending, None)
+    rows = []
+    for day in range(start, end, DAY):
+        today = []
+        while upcoming is not None and upcoming.ts < day + DAY:
+            today.append(upcoming)
+            upcoming = next(pending, None)
+        totals = UptimeTotals()
+        state = accumulate(totals, state, today, day, day + DAY)
+        rows.append({"service": service, "day": day, **{name: getattr(totals, name) for name in _TOTAL_FIELDS}})
+    connection.execute(insert(SystemStatusDay), rows)
+    return len(rows)
+
+
+def run_status_rollups(engine: Engine, batch_days: int | None = None, now: int | None = None) -> int:
+    """Roll up every complete day of every service (one transaction per batch); return days written."""
+
+    batch_days = batch_days or get_settings().status_rollup_batch_days
+    now = now if now is not None else epoch(datetime.utcnow())
+    with engine.connect() as connection:
+        services = connection.scalars(select(SystemStatusTransition.service).distinct()).all()
+    written = 0
+    for service in services:
+        while True:
+            with engine.begin() as connection:
+                done = rollup_service(connection, service, now, batch_days)
+            written += done
+            if done < batch_days:
+                break
+    return written
+
+
+async def status_rollup_forever(engine_factory, interval: float) -> None:
+    """Run :func:`run_status_rollups` every ``interval`` seconds on the threadpool until cancelled."""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run_status_rollups, engine_factory())
+        except Exception:
+            logger.exception("Status rollup failed; retrying in %s s", interval)
+
+
+def compute_uptime(connection: Connection, service: str, start: int, end: int) -> UptimeTotals:
+    """Return the totals of ``service`` over ``[start, end)``.
+
+    Whole days up to the rollup frontier come from ``system_status_daily``,
+    the rest from the history.
+    """
+
+    totals = UptimeTotals()
+    frontier = connection.scalar(select(func.max(SystemStatusDay.day)).where(SystemStatusDay.service == service))
+    low = min(-(-start // DAY) * DAY, end)
+    high = low if frontier is None else max(low, min(end - end % DAY, frontier + DAY))
+    if low < high:
+        row = connection.execute(
+            select(*(func.coalesce(func.sum(getattr(SystemStatusDay, name)), 0) for name in _TOTAL_FIELDS)).where(
+                SystemStatusDay.service == service, SystemStatusDay.day >= low, SystemStatusDay.day < high
+            )
+        ).one()
+        totals.add(UptimeTotals(*row))
+    _from_history(connection, totals, service, start, low)
+    _from_history(connection, totals, service, high, end)
+    return totals
+
+
+def _record_transition(connection: Connection, service: str, status: str | None, message: str | None, ts: int) -> None:
+    connection.execute(insert(SystemStatusTransition).values(service=service, status=status, message=message, ts=ts))
+    # Rollups of the day the transition falls into (and later ones) are no longer complete
+    connection.execute(delete(SystemStatusDay).where(SystemStatusDay.service == service, SystemStatusDay.day >= ts - ts % DAY))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_status_transitions(session: Session, _flush_context) -> None:
+    """Append a history row whenever an entry is created, changes status or is deleted."""
+
+    changed = [obj for obj in session.new if isinstance(obj, SystemStatus)]
+    changed += [obj for obj in session.dirty if isinstance(obj, SystemStatus) and inspect(obj).attrs.status.history.has_changes()]
+    removed = [obj for obj in session.deleted if isinstance(obj, SystemStatus)]
+    if not changed and not removed:
+        return
+    connection = session.connection()
+    now = epoch(datetime.utcnow())
+    for entry in changed:
+        _record_transition(connection, entry.service, entry.status, entry.message, epoch(entry.updated_at) if entry.updated_at else now)
+    for entry in removed:
+        _record_transition(connection, entry.service, None, None, now)
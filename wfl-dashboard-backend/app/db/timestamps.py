@@ -0,0 +1,9 @@
+"""Datetime conversion to the form the schema stores: naive UTC."""
+
+from datetime import datetime, timezone
+
+
+def naive_utc(moment: datetime) -> datetime:
+    """Return ``moment`` as naive UTC; naive values are taken as UTC already."""
+
+    return moment if moment.tzinfo is None else moment.astimezone(timezone.utc).replace(tzinfo=None)
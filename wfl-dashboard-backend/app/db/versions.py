@@ -0,0 +1,51 @@
+"""Per-table change versions for ETags on polled list endpoints.
+
+Every ORM flush that adds, changes or deletes rows of a versioned table bumps
+that table's row in ``table_versions`` inside the same transaction, so the
+version moves exactly when committed data does, for every worker process.
+Bulk Core statements bypass the hook; code that writes versioned tables
+that way has to call :func:`bump_versions` itself.
+"""
+
+from collections.abc import Collection, Iterable
+from itertools import chain
+
+from sqlalchemy import Connection, event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.table_version import TableVersion
+
+VERSIONED_TABLES = ("events", "metrics", "news", "projects", "system_status")
+
+
+def bump_versions(connection: Connection, tables: Collection[str]) -> None:
+    """Increment the change version of ``tables`` in the current transaction."""
+
+    connection.execute(
+        update(TableVersion).where(TableVersion.table_name.in_(tables)).values(version=TableVersion.version + 1)
+    )
+
+
+async def read_versions(db, tables: Iterable[str]) -> dict[str, int]:
+    """Return the current version of each of ``tables`` (one primary-key lookup)."""
+
+    tables = list(tables)
+    rows = (await db.execute(select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(tables)))).all()
+    versions = dict(rows)
+    return {table: versions.get(table, 0) for table in tables}
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_versions(target, connection: Connection, **_kw) -> None:
+    connection.execute(insert(TableVersion), [{"table_name": table, "version": 0} for table in VERSIONED_TABLES])
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_written_tables(session: Session, _flush_context) -> None:
+    changed = {
+        obj.__tablename__
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if getattr(obj, "__tablename__", None) in VERSIONED_TABLES
+    }
+    if changed:
+        bump_versions(session.connection(), changed)
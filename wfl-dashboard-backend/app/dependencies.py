@@ -3,8 +3,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principals import Principal, get_principal_cache, get_token_version_cache
 from app.core.security import decode_access_token
 from app.db.models.user import User
 from app.db.session import get_db
@@ -12,30 +14,83 @@ from app.db.session import get_db
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """Decode JWT token and load the associated user."""
-
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> dict[str, str | int]:
     try:
         payload = decode_access_token(token)
-        subject = payload.get("sub") if isinstance(payload, dict) else None
-        if subject is None:
-            raise credentials_exception
     except JWTError as exc:
-        raise credentials_exception from exc
+        raise _credentials_exception() from exc
+    if not isinstance(payload, dict) or payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> Principal:
+    """Decode JWT token and load the associated user, served from the principal cache when possible."""
+
+    principal = get_principal_cache().get(token)
+    if principal is not None:
+        return principal
+    return await _load_principal(token, _decode_token(token), db)
+
+
+async def _load_principal(token: str, payload: dict[str, str | int], db: AsyncSession) -> Principal:
+    """Look up the user of a decoded token and cache the principal under ``token``."""
 
-    user = db.query(User).filter(User.email == subject).first()
+    user = await db.scalar(select(User).where(User.email == payload["sub"]))
     if user is None:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    if "ver" in payload and payload["ver"] != user.token_version:
+        raise _credentials_exception()
+    principal = Principal.from_user(user)
+    expires_at = payload.get("exp")
+    get_principal_cache().put(token, principal, token_expires_at=float(expires_at) if expires_at is not None else None)
+    return principal
+
+
+async def get_claims_principal(payload: dict[str, str | int], db: AsyncSession) -> Principal | None:
+    """Authorize from the uid/role/ver claims of a decoded token; returns None for tokens without them.
+
+    The token version is checked against a short-lived in-process cache, so
+    the database is only consulted on the first request per user and TTL.
+    """
+
+    if "uid" not in payload or "role" not in payload or "ver" not in payload:
+        return None
+
+    user_id = int(payload["uid"])
+    versions = get_token_version_cache()
+    current_version = versions.get(user_id)
+    if current_version is None:
+        current_version = await db.scalar(select(User.token_version).where(User.id == user_id))
+        if current_version is None:
+            raise _credentials_exception()
+        versions.put(user_id, current_version)
+    if payload["ver"] != current_version:
+        raise _credentials_exception()
+    return Principal(id=user_id, email=str(payload["sub"]), role=str(payload["role"]))
+
+
 def require_roles(*roles: str):
-    """Dependency that ensures current user has one of the given roles."""
+    """Dependency that ensures current user has one of the given roles.
+
+    Cached principals are served without decoding the token; otherwise the
+    token is decoded once and authorized from its claims or, for tokens
+    without them, by a user lookup.
+    """
 
-    def dependency(current_user: User = Depends(get_current_user)) -> User:
+    async def dependency(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> Principal:
+        current_user = get_principal_cache().get(token)
+        if current_user is None:
+            payload = _decode_token(token)
+            current_user = await get_claims_principal(payload, db) or await _load_principal(token, payload, db)
         if roles and current_user.role not in roles:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
         return current_user
@@ -0,0 +1,49 @@
+"""Sparse fieldsets (``?fields=title,start``) for read endpoints.
+
+The requested names are checked against the endpoint's ``*Read`` schema.
+:func:`load_fields` narrows the SQL projection to the matching columns, plus
+the sort keys pagination reads back for the cursor, and
+``json_response(..., fields=...)`` renders only those fields. ``id`` is
+always returned.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.pagination import SortKey
+
+
+def field_params(schema: type[BaseModel]) -> Callable[..., tuple[str, ...] | None]:
+    """Build the ``fields`` query dependency for an endpoint returning ``schema``."""
+
+    allowed = tuple(schema.model_fields)
+    description = f"Comma-separated fields to return ({', '.join(allowed)}); id is always included"
+
+    def dependency(fields: str | None = Query(default=None, description=description)) -> tuple[str, ...] | None:
+        if fields is None:
+            return None
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unknown field(s): {', '.join(unknown)}"
+            )
+        return tuple(dict.fromkeys(["id", *names]))
+
+    return dependency
+
+
+def load_fields(model: Any, fields: tuple[str, ...] | None, keys: Sequence[SortKey] = ()) -> list[ORMOption]:
+    """Loader options restricting ``model`` to ``fields`` and the sort-key attributes; none without a selection."""
+
+    if fields is None:
+        return []
+    names = dict.fromkeys([*fields, *(key.attribute or key.column.key for key in keys)])
+    return [load_only(*(getattr(model, name) for name in names))]
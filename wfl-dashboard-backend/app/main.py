@@ -1,19 +1,66 @@
 """FastAPI application entrypoint for the WfL dashboard backend."""
 
-from fastapi import FastAPI
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings
+from app.core.health_poller import HealthPoller, load_probes
+from app.core.metric_buffer import get_metric_buffer
+from app.core.security import PasswordHasherBusy, shutdown_password_hasher_pool
+from app.core.telemetry import TelemetryMiddleware
 from app.db import base  # noqa: F401 - ensures models are registered
-from app.db.session import engine
+from app.db import session as db_session
+from app.db.metric_series import rollup_forever
+from app.db.migrations import UNVERSIONED_HINT, schema_state, upgrade_database
+from app.db.status_history import status_rollup_forever
 from app.routes import register_routes
 
+logger = logging.getLogger("app.startup")
+
+
+@contextmanager
+def _timed_phase(timings: dict[str, float], name: str) -> Iterator[None]:
+	started = time.perf_counter()
+	try:
+		yield
+	finally:
+		timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def prepare_database(auto_migrate: bool, timings: dict[str, float]) -> None:
+	"""Check the schema revision once and only run DDL when it is behind."""
+
+	engine = db_session.engine
+	with _timed_phase(timings, "schema_check_ms"):
+		state = schema_state(engine)
+	if state.is_current:
+		return
+	if state.is_unversioned:
+		raise RuntimeError(UNVERSIONED_HINT)
+	if not auto_migrate:
+		raise RuntimeError(
+			f"Database schema is at {state.current or 'empty'}, expected {state.head}; "
+			"run `python -m app.cli migrate` before starting the app"
+		)
+	with _timed_phase(timings, "migrate_ms"):
+		upgrade_database(engine)
+
 
 def create_app() -> FastAPI:
 	"""Create and configure the FastAPI instance."""
 
 	settings = get_settings()
+	timings: dict[str, float] = {}
+	setup_started = time.perf_counter()
 	app = FastAPI(title=settings.app_name, version="1.0.0")
+	app.state.startup_timings = timings
 
 	app.add_middleware(
 		CORSMiddleware,
@@ -21,13 +68,60 @@ def create_app() -> FastAPI:
 		allow_credentials=True,
 		allow_methods=["*"],
 		allow_headers=["*"],
+		expose_headers=["X-Next-Cursor", "Link", "ETag", "X-Changes-Head"],
 	)
+	if settings.telemetry_enabled:
+		app.add_middleware(TelemetryMiddleware)
 
 	@app.on_event("startup")
 	def _on_startup() -> None:
-		base.Base.metadata.create_all(bind=engine)
+		with _timed_phase(timings, "startup_ms"):
+			prepare_database(settings.db_auto_migrate, timings)
+		logger.info("Startup phases: %s", ", ".join(f"{name}={value}" for name, value in timings.items()))
+
+	@app.on_event("startup")
+	async def _start_background_tasks() -> None:
+		if settings.metric_rollup_interval_seconds > 0:
+			app.state.metric_rollups = asyncio.create_task(
+				rollup_forever(lambda: db_session.engine, settings.metric_rollup_interval_seconds)
+			)
+		if settings.status_rollup_interval_seconds > 0:
+			app.state.status_rollups = asyncio.create_task(
+				status_rollup_forever(lambda: db_session.engine, settings.status_rollup_interval_seconds)
+			)
+		if settings.metric_write_behind_seconds > 0:
+			app.state.metric_write_behind = asyncio.create_task(
+				get_metric_buffer().flush_forever(settings.metric_write_behind_seconds)
+			)
+		if settings.health_probes:
+			app.state.health_poller = asyncio.create_task(
+				HealthPoller(load_probes(), settings.health_poll_concurrency).run()
+			)
+
+	@app.on_event("shutdown")
+	async def _stop_background_tasks() -> None:
+		for name in ("metric_rollups", "status_rollups", "metric_write_behind", "health_poller"):
+			task = getattr(app.state, name, None)
+			if task is not None:
+				task.cancel()
+		if settings.metric_write_behind_seconds > 0:
+			# Values still in the write-behind buffer would be lost with the process
+			await asyncio.to_thread(get_metric_buffer().flush)
+
+	@app.on_event("shutdown")
+	def _on_shutdown() -> None:
+		shutdown_password_hasher_pool()
+
+	@app.exception_handler(PasswordHasherBusy)
+	async def _password_hasher_busy(_request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+			content={"detail": "Authentication is busy, please retry shortly"},
+			headers={"Retry-After": str(exc.retry_after)},
+		)
 
 	register_routes(app)
+	timings["app_setup_ms"] = round((time.perf_counter() - setup_started) * 1000, 2)
 
 	return app
 
@@ -0,0 +1,214 @@
+"""Keyset (cursor) pagination shared by the list endpoints.
+
+Every list endpoint declares its sort order as a tuple of :class:`SortKey`
+entries ending in a unique column. A page is fetched by seeking past the
+last row of the previous page instead of using OFFSET, so the cost of a
+page is independent of how deep into the result it lies. Cursors are opaque
+to clients: base64url encoded JSON of the last row's key values.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import HTTPException, Query, Request, Response, status
+from sqlalchemy import Select, and_, false, or_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import get_settings
+
+INVALID_CURSOR = "Invalid cursor"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True, slots=True)
+class SortKey:
+    """One column of a keyset sort order.
+
+    ``nulls_first`` is ``None`` for NOT NULL columns. For nullable columns it
+    states where NULLs sort; pick the placement the backing index delivers
+    natively so the ORDER BY is served without a sort step. ``attribute``
+    names the row attribute holding the value when the key is a column of a
+    joined table (e.g. a denormalized copy).
+    """
+
+    column: InstrumentedAttribute
+    descending: bool = False
+    nulls_first: bool | None = None
+    attribute: str | None = None
+
+    def order_by(self) -> ColumnElement:
+        clause = self.column.desc() if self.descending else self.column.asc()
+        if self.nulls_first is None:
+            return clause
+        return clause.nulls_first() if self.nulls_first else clause.nulls_last()
+
+    def after(self, value: Any) -> ColumnElement:
+        """Rows sorting strictly after ``value`` for this key alone."""
+
+        if value is None:
+            # Everything non-NULL follows when NULLs lead; nothing does when they trail.
+            return self.column.is_not(None) if self.nulls_first else false()
+        clause = self.column < value if self.descending else self.column > value
+        if self.nulls_first is False:
+            clause = or_(clause, self.column.is_(None))
+        return clause
+
+    def equal(self, value: Any) -> ColumnElement:
+        return self.column.is_(None) if value is None else self.column == value
+
+    def seek(self, value: Any) -> ColumnElement | None:
+        """Range condition on the leading key that lets the planner seek the index."""
+
+        if value is None or self.nulls_first is False:
+            return None
+        return self.column <= value if self.descending else self.column >= value
+
+
+@dataclass(frozen=True, slots=True)
+class PageParams:
+    """Pagination query parameters of a list request."""
+
+    cursor: str | None
+    limit: int | None
+    url: Any = None
+
+    @property
+    def requested(self) -> bool:
+        return self.cursor is not None or self.limit is not None
+
+
+def page_params(
+    request: Request,
+    cursor: str | None = Query(default=None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int | None = Query(default=None, ge=1, description="Page size (capped by the server maximum)"),
+) -> PageParams:
+    """Collect ``cursor``/``limit`` query parameters for :func:`paginate`."""
+
+    return PageParams(cursor=cursor, limit=limit, url=request.url)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        if key.nulls_first is None:
+            raise ValueError("unexpected null")
+        return value
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise ValueError("unexpected type")
+    return value
+
+
+def pack_cursor(values: Sequence[Any]) -> str:
+    """Encode JSON-serializable key values as an opaque cursor."""
+
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def unpack_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a :func:`pack_cursor` value holding ``size`` entries; raise ``ValueError`` when malformed."""
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("undecodable cursor") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("cursor shape mismatch")
+    return values
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR)
+
+
+def encode_cursor(keys: Sequence[SortKey], row: Any) -> str:
+    """Encode the sort-key values of ``row`` as an opaque cursor."""
+
+    return pack_cursor([getattr(row, key.attribute or key.column.key) for key in keys])
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor`; raise 400 when malformed."""
+
+    try:
+        values = unpack_cursor(cursor, len(keys))
+        return [_decode_value(key, value) for key, value in zip(keys, values)]
+    except (TypeError, ValueError) as exc:
+        raise invalid_cursor() from exc
+
+
+def keyset_predicate(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """WHERE clause selecting rows that sort strictly after ``values``.
+
+    Expands ``(k1, k2, ...) > (v1, v2, ...)`` into the portable OR-of-ANDs
+    form (mixed directions rule out row-value comparison) and prefixes a
+    range condition on the leading key so the index is entered by a seek.
+    """
+
+    branches = []
+    for position, key in enumerate(keys):
+        prefix = [keys[index].equal(values[index]) for index in range(position)]
+        branches.append(and_(*prefix, key.after(values[position])))
+    predicate = or_(*branches)
+    seek = keys[0].seek(values[0])
+    return predicate if seek is None else and_(seek, predicate)
+
+
+async def paginate(db: Any, query: Select, keys: Sequence[SortKey], page: PageParams, response: Response) -> Sequence[Any]:
+    """Execute ``query`` ordered by ``keys`` and return one page of ORM rows.
+
+    Without ``cursor``/``limit`` and with ``pagination_legacy_unbounded`` set,
+    the full result is returned as before. Otherwise at most ``limit`` rows are
+    returned and, when more exist, the next cursor is exposed through the
+    ``X-Next-Cursor`` and ``Link: rel="next"`` headers; the body stays a plain
+    JSON array.
+    """
+
+    query = query.order_by(*(key.order_by() for key in keys))
+    if not page.requested and get_settings().pagination_legacy_unbounded:
+        return (await db.scalars(query)).all()
+
+    limit = page_limit(page)
+    if page.cursor is not None:
+        query = query.where(keyset_predicate(keys, decode_cursor(keys, page.cursor)))
+    rows = (await db.scalars(query.limit(limit + 1))).all()
+    if len(rows) <= limit:
+        return rows
+
+    rows = rows[:limit]
+    set_next_page(response, page, encode_cursor(keys, rows[-1]), limit)
+    return rows
+
+
+def page_limit(page: PageParams) -> int:
+    """Requested page size, defaulted and capped by the settings."""
+
+    settings = get_settings()
+    return min(page.limit or settings.pagination_default_page_size, settings.pagination_max_page_size)
+
+
+def set_next_page(response: Response, page: PageParams, cursor: str, limit: int) -> None:
+    """Expose the cursor of the following page via ``X-Next-Cursor`` and ``Link``."""
+
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    if page.url is not None:
+        next_url = page.url.include_query_params(cursor=cursor, limit=limit)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
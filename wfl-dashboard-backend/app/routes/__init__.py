@@ -2,7 +2,23 @@
 
 from fastapi import APIRouter, FastAPI
 
-from app.routes import auth, events, metrics, news, projects, rooms, status, system_status, tasks, users
+from app.core.config import get_settings
+from app.routes import (
+    auth,
+    changes,
+    events,
+    metrics,
+    news,
+    projects,
+    rooms,
+    search,
+    status,
+    stream,
+    system_status,
+    tasks,
+    telemetry,
+    users,
+)
 
 api_router = APIRouter(prefix="/api")
 
@@ -16,12 +32,17 @@ api_router.include_router(tasks.router)
 api_router.include_router(metrics.router)
 api_router.include_router(system_status.router)
 api_router.include_router(users.router)
+api_router.include_router(search.router)
+api_router.include_router(stream.router)
+api_router.include_router(changes.router)
 
 
 def register_routes(app: FastAPI) -> None:
     """Attach all API routers to the given app."""
 
     app.include_router(api_router)
+    if get_settings().telemetry_enabled:
+        app.include_router(telemetry.router)
 
 
 __all__ = ["register_routes"]
@@ -0,0 +1,59 @@
+"""Incremental pull API over the ``changes`` outbox."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.serialization import json_response
+from app.db.changes import OUTBOX_TABLES, ChangesCompacted, bounds_query, changes_query, check_position
+from app.db.session import get_db
+from app.dependencies import require_roles
+from app.schemas.change import ChangeRead
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+def entity_filter(
+    entity: str | None = Query(default=None, description=f"Comma-separated entity types ({', '.join(OUTBOX_TABLES)})"),
+) -> tuple[str, ...] | None:
+    """Parse the ``entity`` filter; unknown names are rejected."""
+
+    names = tuple(dict.fromkeys(name.strip() for name in (entity or "").split(",") if name.strip()))
+    unknown = sorted(set(names) - set(OUTBOX_TABLES))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unknown entity type(s): {', '.join(unknown)}"
+        )
+    return names or None
+
+
+@router.get(
+    "",
+    response_model=list[ChangeRead],
+    summary="Changes after a sequence number",
+    responses={status.HTTP_410_GONE: {"description": "Entries after `after` were compacted; reload, then resume from X-Changes-Head"}},
+)
+async def list_changes(
+    response: Response,
+    after: int = Query(default=0, ge=0, description="Last sequence number already processed"),
+    limit: int | None = Query(default=None, ge=1, description="Batch size (capped by the server maximum)"),
+    entities: tuple[str, ...] | None = Depends(entity_filter),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_roles("admin", "vorstand")),
+) -> Response:
+    """Return committed creates, updates and deletes after ``after``, oldest first.
+
+    Pass the ``seq`` of the last entry as the next ``after``. ``X-Changes-Head``
+    holds the newest sequence number.
+    """
+
+    settings = get_settings()
+    limit = min(limit or settings.pagination_default_page_size, settings.pagination_max_page_size)
+    oldest, head = (await db.execute(bounds_query())).one()
+    try:
+        check_position(after, oldest, head)
+    except ChangesCompacted as exc:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(exc), headers={"X-Changes-Head": str(exc.head)}) from exc
+    response.headers["X-Changes-Head"] = str(head or 0)
+    rows = (await db.execute(changes_query(after, limit, entities))).all()
+    return json_response(list[ChangeRead], rows, response)
@@ -2,87 +2,145 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.conditional import conditional_get
+from app.core.serialization import json_response
 from app.dependencies import require_roles
 from app.db.models.event import Event
+from app.db.room_bookings import overlapping_events
 from app.db.session import get_db
+from app.export import ExportFormat, export_response
+from app.fields import field_params, load_fields
+from app.pagination import PageParams, SortKey, page_params, paginate
 from app.schemas.event import EventCreate, EventRead, EventUpdate
 
 EVENT_NOT_FOUND = "Event not found"
+EVENT_ENDS_BEFORE_START = "end must be after start"
+
+EVENT_SORT = (SortKey(Event.start), SortKey(Event.id))
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-@router.get("", response_model=list[EventRead], summary="List events")
-def list_events(
+def event_list_query(start_from: datetime | None, start_to: datetime | None, room_id: int | None) -> Select:
+    """Build the list_events statement (without ordering) from its filters."""
+
+    query = select(Event)
+    if start_from:
+        query = query.where(Event.start >= start_from)
+    if start_to:
+        query = query.where(Event.start <= start_to)
+    if room_id:
+        query = query.where(Event.room_id == room_id)
+    return query
+
+
+async def _ensure_room_free(db: AsyncSession, event: Event) -> None:
+    """Flush ``event`` and reject it with 409 when it overlaps another booking of its room.
+
+    Checking after the flush means the transaction already holds SQLite's
+    write lock, so two requests cannot book the same slot concurrently.
+    """
+
+    if event.end <= event.start:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=EVENT_ENDS_BEFORE_START)
+    await db.flush()
+    conflicts = (await db.scalars(overlapping_events(event.room_id, event.start, event.end, exclude_id=event.id).limit(5))).all()
+    if conflicts:
+        detail = f"Room {event.room_id} is already booked at that time (events {', '.join(map(str, conflicts))})"
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+@router.get(
+    "",
+    response_model=list[EventRead],
+    summary="List events",
+    dependencies=[Depends(conditional_get("events"))],
+)
+async def list_events(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
     start_from: datetime | None = Query(default=None, description="Filter events starting after timestamp"),
     start_to: datetime | None = Query(default=None, description="Filter events starting before timestamp"),
     room_id: int | None = Query(default=None, description="Filter by room"),
-) -> list[EventRead]:
+    fields: tuple[str, ...] | None = Depends(field_params(EventRead)),
+) -> Response:
     """Return events matching the provided filters."""
 
-    query = db.query(Event)
-    if start_from:
-        query = query.filter(Event.start >= start_from)
-    if start_to:
-        query = query.filter(Event.start <= start_to)
-    if room_id:
-        query = query.filter(Event.room_id == room_id)
-    events = query.order_by(Event.start.asc()).all()
-    return [EventRead.model_validate(event) for event in events]
+    query = event_list_query(start_from, start_to, room_id).options(*load_fields(Event, fields, EVENT_SORT))
+    events = await paginate(db, query, EVENT_SORT, page, response)
+    return json_response(list[EventRead], events, response, fields=fields)
+
+
+@router.get("/export", summary="Export events as NDJSON or CSV")
+async def export_events(
+    *,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    start_from: datetime | None = Query(default=None, description="Filter events starting after timestamp"),
+    start_to: datetime | None = Query(default=None, description="Filter events starting before timestamp"),
+    room_id: int | None = Query(default=None, description="Filter by room"),
+) -> StreamingResponse:
+    """Stream all events matching the list filters, one row at a time."""
+
+    return export_response(event_list_query(start_from, start_to, room_id), EVENT_SORT, EventRead, export_format, "events")
 
 
 @router.post("", response_model=EventRead, status_code=status.HTTP_201_CREATED, summary="Create event")
-def create_event(
+async def create_event(
     payload: EventCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> EventRead:
-    """Create a new event."""
+    """Create a new event; bookings overlapping another event in the same room are rejected."""
 
     data = payload.model_dump(exclude_unset=True)
     data["created_by"] = payload.created_by or current_user.id
     event = Event(**data)
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    await _ensure_room_free(db, event)
+    await db.commit()
+    await db.refresh(event)
     return EventRead.model_validate(event)
 
 
 @router.put("/{event_id}", response_model=EventRead, summary="Update event")
-def update_event(
+async def update_event(
     event_id: int,
     payload: EventUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> EventRead:
-    """Update event details."""
+    """Update event details; moves into an occupied slot of the room are rejected."""
 
-    event = db.get(Event, event_id)
+    event = await db.get(Event, event_id)
     if event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=EVENT_NOT_FOUND)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(event, field, value)
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    await _ensure_room_free(db, event)
+    await db.commit()
+    await db.refresh(event)
     return EventRead.model_validate(event)
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete event")
-def delete_event(
+async def delete_event(
     event_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
     """Delete an event."""
 
-    event = db.get(Event, event_id)
+    event = await db.get(Event, event_id)
     if event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=EVENT_NOT_FOUND)
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
@@ -1,71 +1,223 @@
 """Metric management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
 
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.conditional import conditional_get
+from app.core.config import Settings, get_settings
+from app.core.metric_buffer import get_metric_buffer
+from app.core.serialization import json_response
 from app.dependencies import require_roles
+from app.db.metric_ingest import MetricRecord, upsert_metrics
+from app.db.metric_series import RAW, RESOLUTION_NAMES, epoch, read_series, record_points, retention_seconds
 from app.db.models.metric import Metric
 from app.db.session import get_db
-from app.schemas.metric import MetricCreate, MetricRead, MetricUpdate
+from app.db.timestamps import naive_utc
+from app.pagination import PageParams, SortKey, page_params, paginate
+from app.schemas.metric import (
+    MetricBulkItem,
+    MetricBulkResult,
+    MetricCreate,
+    MetricPointIn,
+    MetricRead,
+    MetricSeries,
+    MetricUpdate,
+)
 
 METRIC_NOT_FOUND = "Metric not found"
 
+METRIC_SORT = (SortKey(Metric.name), SortKey(Metric.id))
+
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 
-@router.get("", response_model=list[MetricRead], summary="List metrics")
-def list_metrics(db: Session = Depends(get_db)) -> list[MetricRead]:
+def _check_sample_window(oldest: int, newest: int, now: int, settings: Settings) -> None:
+    """Reject Unix times before the raw retention or more than the allowed skew past ``now`` (422).
+
+    Future times would become a metric's ``updated_at`` and, being newer,
+    shut out every current value until the clock catches up.
+    """
+
+    keep = retention_seconds(RAW, settings)
+    if keep is not None and oldest < now - keep:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Timestamps older than the raw retention")
+    if newest > now + settings.metric_max_future_seconds:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Timestamps in the future")
+
+
+@router.get(
+    "",
+    response_model=list[MetricRead],
+    summary="List metrics",
+    dependencies=[Depends(conditional_get("metrics"))],
+)
+async def list_metrics(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params),
+) -> Response:
     """Return all metrics."""
 
-    metrics = db.query(Metric).order_by(Metric.name.asc()).all()
-    return [MetricRead.model_validate(metric) for metric in metrics]
+    metrics = await paginate(db, select(Metric), METRIC_SORT, page, response)
+    return json_response(list[MetricRead], metrics, response)
 
 
 @router.post("", response_model=MetricRead, status_code=status.HTTP_201_CREATED, summary="Create metric")
-def create_metric(
+async def create_metric(
     payload: MetricCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> MetricRead:
     """Create or overwrite a metric entry."""
 
     metric = Metric(**payload.model_dump())
     db.add(metric)
-    db.commit()
-    db.refresh(metric)
+    await db.commit()
+    await db.refresh(metric)
     return MetricRead.model_validate(metric)
 
 
+@router.post(
+    "/bulk",
+    response_model=MetricBulkResult,
+    summary="Upsert many metrics by name",
+    responses={status.HTTP_202_ACCEPTED: {"model": MetricBulkResult, "description": "Queued for the write-behind buffer"}},
+)
+async def bulk_upsert_metrics(
+    response: Response,
+    payload: list[MetricBulkItem] = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_roles("admin", "vorstand")),
+) -> MetricBulkResult:
+    """Create or update metrics by name in one statement.
+
+    Records older than a metric's ``updated_at`` do not overwrite it but are
+    kept in its series; records older than the raw retention or dated in the
+    future are rejected, as on ``/points``. With the write-behind buffer enabled the records are
+    queued (202) and rapid updates of the same metric are coalesced.
+    """
+
+    settings = get_settings()
+    if not payload or len(payload) > settings.metric_bulk_max_records:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Send between 1 and {settings.metric_bulk_max_records} records",
+        )
+    now = datetime.utcnow()
+    records = [MetricRecord(item.name, item.value, now if item.timestamp is None else naive_utc(item.timestamp)) for item in payload]
+    stamps = [epoch(record.updated_at) for record in records]
+    _check_sample_window(min(stamps), max(stamps), epoch(now), settings)
+    if settings.metric_write_behind_seconds > 0 and get_metric_buffer().add(records):
+        response.status_code = status.HTTP_202_ACCEPTED
+        return MetricBulkResult(received=len(records), written=0, queued=len(records))
+
+    written = await db.run_sync(lambda session: upsert_metrics(session, records))
+    await db.commit()
+    return MetricBulkResult(received=len(records), written=written, queued=0)
+
+
 @router.patch("/{metric_id}", response_model=MetricRead, summary="Update metric")
-def update_metric(
+async def update_metric(
     metric_id: int,
     payload: MetricUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> MetricRead:
     """Update metric values."""
 
-    metric = db.get(Metric, metric_id)
+    metric = await db.get(Metric, metric_id)
     if metric is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=METRIC_NOT_FOUND)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(metric, field, value)
     db.add(metric)
-    db.commit()
-    db.refresh(metric)
+    await db.commit()
+    await db.refresh(metric)
     return MetricRead.model_validate(metric)
 
 
 @router.delete("/{metric_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete metric")
-def delete_metric(
+async def delete_metric(
     metric_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
     """Delete a metric entry."""
 
-    metric = db.get(Metric, metric_id)
+    metric = await db.get(Metric, metric_id)
     if metric is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=METRIC_NOT_FOUND)
-    db.delete(metric)
-    db.commit()
+    await db.delete(metric)
+    await db.commit()
+
+
+@router.post("/{metric_id}/points", response_model=MetricRead, summary="Ingest metric samples")
+async def ingest_metric_points(
+    metric_id: int,
+    payload: list[MetricPointIn] = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_roles("admin", "vorstand")),
+) -> MetricRead:
+    """Store a batch of samples; the newest one becomes the metric's current value.
+
+    A sample at a second that already has one replaces it. Samples older than
+    the raw retention or more than ``metric_max_future_seconds`` ahead are
+    rejected.
+    """
+
+    settings = get_settings()
+    if not payload or len(payload) > settings.metric_ingest_max_points:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Send between 1 and {settings.metric_ingest_max_points} points",
+        )
+    metric = await db.get(Metric, metric_id)
+    if metric is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=METRIC_NOT_FOUND)
+
+    now = epoch(datetime.now(timezone.utc))
+    points = [(now if point.ts is None else epoch(point.ts), point.value) for point in payload]
+    _check_sample_window(min(ts for ts, _value in points), max(ts for ts, _value in points), now, settings)
+    await db.run_sync(lambda session: record_points(session.connection(), metric_id, points))
+
+    # Later samples at the same second win, as in the upsert above
+    newest_ts, newest_value = max(reversed(points), key=lambda point: point[0])
+    if metric.updated_at is None or newest_ts >= epoch(metric.updated_at):
+        metric.value = newest_value
+        metric.updated_at = datetime.fromtimestamp(newest_ts, timezone.utc).replace(tzinfo=None)
+    await db.commit()
+    await db.refresh(metric)
+    return MetricRead.model_validate(metric)
+
+
+@router.get("/{metric_id}/series", response_model=MetricSeries, summary="Metric time series")
+async def get_metric_series(
+    metric_id: int,
+    start: datetime | None = Query(default=None, description="Range start (default: one day before `end`)"),
+    end: datetime | None = Query(default=None, description="Range end, exclusive (default: now)"),
+    points: int = Query(default=300, ge=1, description="Maximum number of points (capped by the server maximum)"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return the samples of a metric in ``[start, end)``.
+
+    Uses the finest resolution (raw, 1m, 1h, 1d) that yields at most
+    ``points`` points and is still retained for ``start``; rollup buckets
+    carry min, max, avg, count and the last sample.
+    """
+
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=1)
+    range_start, range_end = epoch(start), epoch(end)
+    if range_start >= range_end:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="start must be before end")
+    if await db.get(Metric, metric_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=METRIC_NOT_FOUND)
+
+    limit = min(points, get_settings().metric_series_max_points)
+    now = epoch(datetime.now(timezone.utc))
+    resolution, rows = await read_series(db, metric_id, range_start, range_end, limit, now)
+    series = {"metric_id": metric_id, "resolution": RESOLUTION_NAMES[resolution], "start": start, "end": end, "points": rows}
+    return json_response(MetricSeries, series)
@@ -1,60 +1,156 @@
 """REST endpoints for managing news entries."""
 
 from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.conditional import conditional_get
+from app.core.serialization import json_response
 from app.dependencies import require_roles
-from app.db.models.news import News
+from app.db.models.news import News, NewsTag
+from app.db.news_tags import normalize_tags
 from app.db.session import get_db
-from app.schemas.news import NewsCreate, NewsRead, NewsUpdate
+from app.export import ExportFormat, export_response
+from app.fields import field_params, load_fields
+from app.pagination import PageParams, SortKey, page_params, paginate
+from app.schemas.news import NewsCreate, NewsRead, NewsTagCount, NewsUpdate
 
 NOT_FOUND_MESSAGE = "News item not found"
 
+NEWS_SORT = (SortKey(News.created_at, descending=True, nulls_first=True), SortKey(News.id, descending=True))
+# Tag pages walk ix_news_tags_tag_created; cursor values are read back from the news row
+TAGGED_NEWS_SORT = (
+	SortKey(NewsTag.created_at, descending=True, nulls_first=True, attribute="created_at"),
+	SortKey(NewsTag.news_id, descending=True, attribute="id"),
+)
+
 
 router = APIRouter(prefix="/news", tags=["news"])
 
 
-@router.get("", response_model=list[NewsRead], summary="List news items")
-def list_news(
+def news_list_query(
+	tags: list[str] | None,
+	tag_mode: str,
+	is_public: bool | None,
+	since: datetime | None,
+) -> tuple[Select, tuple[SortKey, ...]]:
+	"""Build the list_news statement and its sort order with all filters in SQL.
+
+	A single tag, or the first tag of an ``all`` match, drives the query through
+	``news_tags`` in index order; further ``all`` tags are semi-joins. ``any``
+	over several tags walks the news index and probes the matching ids.
+	"""
+
+	tags = normalize_tags(tags)
+	query = select(News)
+	keys = NEWS_SORT
+	created_at = News.created_at
+	if len(tags) == 1 or (tags and tag_mode == "all"):
+		query = query.join(NewsTag, NewsTag.news_id == News.id).where(NewsTag.tag == tags[0])
+		for tag in tags[1:]:
+			tagged = aliased(NewsTag)
+			query = query.where(News.id.in_(select(tagged.news_id).where(tagged.tag == tag)))
+		keys = TAGGED_NEWS_SORT
+		created_at = NewsTag.created_at
+	elif tags:
+		query = query.where(News.id.in_(select(NewsTag.news_id).where(NewsTag.tag.in_(tags))))
+
+	if is_public is not None:
+		query = query.where(News.is_public == is_public)
+	if since is not None:
+		query = query.where(created_at >= since)
+	return query, keys
+
+
+@router.get(
+	"",
+	response_model=list[NewsRead],
+	summary="List news items",
+	dependencies=[Depends(conditional_get("news"))],
+)
+async def list_news(
 	*,
-	db: Session = Depends(get_db),
-	tag: str | None = Query(default=None, description="Filter by tag"),
+	db: AsyncSession = Depends(get_db),
+	response: Response,
+	page: PageParams = Depends(page_params),
+	tag: list[str] | None = Query(default=None, description="Filter by tag; repeat for several tags"),
+	tag_mode: Literal["any", "all"] = Query(default="any", description="Match any or all of the given tags"),
 	is_public: bool | None = Query(default=None, description="Restrict to public/private"),
 	since: datetime | None = Query(default=None, description="Return entries created after timestamp"),
-	limit: int | None = Query(default=None, ge=1, le=100, description="Maximum number of entries"),
-) -> list[NewsRead]:
+	fields: tuple[str, ...] | None = Depends(field_params(NewsRead)),
+) -> Response:
 	"""Return news entries filtered by optional criteria."""
 
-	query = db.query(News)
-	if is_public is not None:
-		query = query.filter(News.is_public == is_public)
-	if since is not None:
-		query = query.filter(News.created_at >= since)
+	query, keys = news_list_query(tag, tag_mode, is_public, since)
+	query = query.options(*load_fields(News, fields, keys))
+	news_entries = await paginate(db, query, keys, page, response)
+	return json_response(list[NewsRead], news_entries, response, fields=fields)
 
-	news_entries = query.order_by(News.created_at.desc()).all()
-	if tag:
-		news_entries = [item for item in news_entries if item.tags and tag in item.tags]
+
+@router.get("/export", summary="Export news as NDJSON or CSV")
+async def export_news(
+	*,
+	export_format: ExportFormat = Query(default="ndjson", alias="format"),
+	tag: list[str] | None = Query(default=None, description="Filter by tag; repeat for several tags"),
+	tag_mode: Literal["any", "all"] = Query(default="any", description="Match any or all of the given tags"),
+	is_public: bool | None = Query(default=None, description="Restrict to public/private"),
+	since: datetime | None = Query(default=None, description="Return entries created after timestamp"),
+) -> StreamingResponse:
+	"""Stream all news entries matching the list filters, one row at a time."""
+
+	query, keys = news_list_query(tag, tag_mode, is_public, since)
+	return export_response(query, keys, NewsRead, export_format, "news")
+
+
+@router.get(
+	"/tags",
+	response_model=list[NewsTagCount],
+	summary="Tag facet counts",
+	dependencies=[Depends(conditional_get("news"))],
+)
+async def list_news_tags(
+	*,
+	db: AsyncSession = Depends(get_db),
+	is_public: bool | None = Query(default=None, description="Count only public/private entries"),
+	limit: int | None = Query(default=None, ge=1, description="Return only the most used tags"),
+) -> list[NewsTagCount]:
+	"""Return each tag with the number of news entries carrying it, most used first."""
+
+	count = func.count().label("count")
+	query = select(NewsTag.tag, count).group_by(NewsTag.tag).order_by(count.desc(), NewsTag.tag.asc())
+	if is_public is not None:
+		query = query.join(News, News.id == NewsTag.news_id).where(News.is_public == is_public)
 	if limit is not None:
-		news_entries = news_entries[:limit]
-	return [NewsRead.model_validate(item) for item in news_entries]
+		query = query.limit(limit)
+	rows = (await db.execute(query)).all()
+	return [NewsTagCount(tag=tag, count=total) for tag, total in rows]
 
 
 @router.get("/{news_id}", response_model=NewsRead, summary="Retrieve single news entry")
-def get_news(news_id: int, db: Session = Depends(get_db)) -> NewsRead:
+async def get_news(
+	news_id: int,
+	db: AsyncSession = Depends(get_db),
+	fields: tuple[str, ...] | None = Depends(field_params(NewsRead)),
+) -> NewsRead:
 	"""Fetch a single news entry by identifier."""
 
-	news_entry = db.get(News, news_id)
+	news_entry = await db.get(News, news_id, options=load_fields(News, fields))
 	if news_entry is None:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_MESSAGE)
+	if fields is not None:
+		return json_response(NewsRead, news_entry, fields=fields)
 	return NewsRead.model_validate(news_entry)
 
 
 @router.post("", response_model=NewsRead, status_code=status.HTTP_201_CREATED, summary="Create news entry")
-def create_news(
+async def create_news(
 	payload: NewsCreate,
-	db: Session = Depends(get_db),
+	db: AsyncSession = Depends(get_db),
 	current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> NewsRead:
 	"""Persist a new news entry."""
@@ -69,42 +165,42 @@ def create_news(
 		author_id=author_id,
 	)
 	db.add(news_entry)
-	db.commit()
-	db.refresh(news_entry)
+	await db.commit()
+	await db.refresh(news_entry)
 	return NewsRead.model_validate(news_entry)
 
 
 @router.put("/{news_id}", response_model=NewsRead, summary="Update news entry")
-def update_news(
+async def update_news(
 	news_id: int,
 	payload: NewsUpdate,
-	db: Session = Depends(get_db),
+	db: AsyncSession = Depends(get_db),
 	current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> NewsRead:
 	"""Update news entry content."""
 
-	news_entry = db.get(News, news_id)
+	news_entry = await db.get(News, news_id)
 	if news_entry is None:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_MESSAGE)
 
 	for field, value in payload.model_dump(exclude_unset=True).items():
 		setattr(news_entry, field, value)
 	db.add(news_entry)
-	db.commit()
-	db.refresh(news_entry)
+	await db.commit()
+	await db.refresh(news_entry)
 	return NewsRead.model_validate(news_entry)
 
 
 @router.delete("/{news_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete news entry")
-def delete_news(
+async def delete_news(
 	news_id: int,
-	db: Session = Depends(get_db),
+	db: AsyncSession = Depends(get_db),
 	current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
 	"""Remove a news entry permanently."""
 
-	news_entry = db.get(News, news_id)
+	news_entry = await db.get(News, news_id)
 	if news_entry is None:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_MESSAGE)
-	db.delete(news_entry)
-	db.commit()
+	await db.delete(news_entry)
+	await db.commit()
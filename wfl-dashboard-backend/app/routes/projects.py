@@ -1,155 +1,252 @@
 """Project management endpoints."""
 
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.conditional import conditional_get
+from app.core.config import get_settings
+from app.core.serialization import json_response
+from app.db.counters import ProjectCounts, load_counts, load_project_counts
 from app.dependencies import require_roles
 from app.db.models.event import Event
 from app.db.models.news import News
 from app.db.models.project import Project
-from app.db.models.task import Task
 from app.db.session import get_db
+from app.fields import field_params, load_fields
+from app.pagination import PageParams, SortKey, page_params, paginate
 from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate, ProjectSummaryStats
 from app.schemas.summary import EventSummary, NewsSummary
 
 PROJECT_NOT_FOUND = "Project not found"
+# Upcoming events and recent news listed per project summary
+SUMMARY_ITEMS = 5
+
+PROJECT_SORT = (SortKey(Project.created_at, descending=True, nulls_first=True), SortKey(Project.id, descending=True))
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("", response_model=list[ProjectRead], summary="List projects")
-def list_projects(
+def _first_per_project(model, project_ids: Sequence[int], order_by: Sequence, *criteria) -> Select:
+    """Select the first ``SUMMARY_ITEMS`` rows of ``model`` per project, ranked by a window function."""
+
+    rank = func.row_number().over(partition_by=model.project_id, order_by=order_by).label("rank")
+    ranked = select(model, rank).where(model.project_id.in_(project_ids), *criteria).subquery()
+    entity = aliased(model, ranked)
+    return select(entity).where(ranked.c.rank <= SUMMARY_ITEMS).order_by(ranked.c.project_id, ranked.c.rank)
+
+
+def _build_summary(project: Project, counts: ProjectCounts, events: Sequence[Event], news: Sequence[News]) -> ProjectSummaryStats:
+    return ProjectSummaryStats(
+        project=ProjectRead.model_validate(project),
+        total_tasks=sum(counts.tasks.values()),
+        task_counts=counts.tasks,
+        overdue_tasks=counts.overdue,
+        news_count=counts.news,
+        upcoming_events=[
+            EventSummary(
+                id=event.id,
+                title=event.title,
+                start=event.start,
+                end=event.end,
+                room_id=event.room_id,
+            )
+            for event in events
+        ],
+        recent_news=[
+            NewsSummary(
+                id=item.id,
+                title=item.title,
+                created_at=item.created_at,
+                tags=item.tags,
+            )
+            for item in news
+        ],
+    )
+
+
+def _parse_ids(values: list[str]) -> list[int]:
+    """Accept ``ids=1&ids=2`` as well as ``ids=1,2``; keep the first occurrence of each id."""
+
+    try:
+        ids = [int(part) for value in values for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid project id") from None
+    if len(ids) > get_settings().pagination_max_page_size:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Too many project ids")
+    return list(dict.fromkeys(ids))
+
+
+@router.get(
+    "",
+    response_model=list[ProjectRead],
+    summary="List projects",
+    dependencies=[Depends(conditional_get("projects"))],
+)
+async def list_projects(
+    *,
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    status_filter: str | None = Query(default=None, alias="status"),
+    fields: tuple[str, ...] | None = Depends(field_params(ProjectRead)),
+) -> Response:
+    """Return projects newest first, optionally filtered by status."""
+
+    query = select(Project).options(*load_fields(Project, fields, PROJECT_SORT))
+    if status_filter:
+        query = query.where(Project.status == status_filter)
+    projects = await paginate(db, query, PROJECT_SORT, page, response)
+    return json_response(list[ProjectRead], projects, response, fields=fields)
+
+
+@router.get("/summaries", response_model=dict[int, ProjectSummaryStats], summary="Summaries of many projects")
+async def get_project_summaries(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    ids: list[str] = Query(default=[]),
     status_filter: str | None = Query(default=None, alias="status"),
-) -> list[ProjectRead]:
-    """Return all projects, optionally filtered by status."""
+) -> Response:
+    """Return project summaries keyed by project id, for the given ids or a page of projects.
+
+    With ``ids`` the result follows the requested order and leaves out unknown
+    ids; otherwise projects are paged like ``GET /projects``. Either way the
+    number of queries does not depend on how many projects are returned.
+    """
 
-    query = db.query(Project)
+    project_ids = _parse_ids(ids)
+    query = select(Project)
     if status_filter:
-        query = query.filter(Project.status == status_filter)
-    projects = query.order_by(Project.created_at.desc()).all()
-    return [ProjectRead.model_validate(project) for project in projects]
+        query = query.where(Project.status == status_filter)
+    if project_ids:
+        found = {project.id: project for project in (await db.scalars(query.where(Project.id.in_(project_ids)))).all()}
+        projects = [found[project_id] for project_id in project_ids if project_id in found]
+    else:
+        projects = await paginate(db, query, PROJECT_SORT, page, response)
+    if not projects:
+        return json_response(dict[int, ProjectSummaryStats], {}, response)
+
+    project_ids = [project.id for project in projects]
+    counts = await db.run_sync(load_counts, project_ids)
+    events: dict[int, list[Event]] = defaultdict(list)
+    for event in (
+        await db.scalars(
+            _first_per_project(
+                Event, project_ids, (Event.start.asc(), Event.id.asc()), Event.start >= datetime.now(timezone.utc)
+            )
+        )
+    ).all():
+        events[event.project_id].append(event)
+    news: dict[int, list[News]] = defaultdict(list)
+    for item in (await db.scalars(_first_per_project(News, project_ids, (News.created_at.desc(), News.id.desc())))).all():
+        news[item.project_id].append(item)
+
+    summaries = {
+        project.id: _build_summary(project, counts[project.id], events[project.id], news[project.id])
+        for project in projects
+    }
+    return json_response(dict[int, ProjectSummaryStats], summaries, response)
 
 
 @router.get("/{project_id}", response_model=ProjectRead, summary="Get project by id")
-def get_project(project_id: int, db: Session = Depends(get_db)) -> ProjectRead:
+async def get_project(
+    project_id: int,
+    db: AsyncSession = Depends(get_db),
+    fields: tuple[str, ...] | None = Depends(field_params(ProjectRead)),
+) -> ProjectRead:
     """Return a single project."""
 
-    project = db.get(Project, project_id)
+    project = await db.get(Project, project_id, options=load_fields(Project, fields))
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROJECT_NOT_FOUND)
+    if fields is not None:
+        return json_response(ProjectRead, project, fields=fields)
     return ProjectRead.model_validate(project)
 
 
 @router.get("/{project_id}/summary", response_model=ProjectSummaryStats, summary="Project detail summary")
-def get_project_summary(project_id: int, db: Session = Depends(get_db)) -> ProjectSummaryStats:
+async def get_project_summary(project_id: int, db: AsyncSession = Depends(get_db)) -> ProjectSummaryStats:
     """Return task counts, upcoming events, and recent news for a project."""
 
-    project = db.get(Project, project_id)
+    project = await db.get(Project, project_id)
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROJECT_NOT_FOUND)
 
-    statuses = ["open", "in_progress", "done"]
-    counts: dict[str, int] = {}
-    for status_name in statuses:
-        count = (
-            db.query(func.count(Task.id))
-            .filter(Task.project_id == project_id, Task.status == status_name)
-            .scalar()
-        )
-        counts[status_name] = int(count or 0)
+    counts = await db.run_sync(load_project_counts, project_id)
 
     now = datetime.now(timezone.utc)
     upcoming_events = (
-        db.query(Event)
-        .filter(Event.project_id == project_id, Event.start >= now)
-        .order_by(Event.start.asc())
-        .limit(5)
-        .all()
-    )
+        await db.scalars(
+            select(Event)
+            .where(Event.project_id == project_id, Event.start >= now)
+            .order_by(Event.start.asc())
+            .limit(SUMMARY_ITEMS)
+        )
+    ).all()
     recent_news = (
-        db.query(News)
-        .filter(News.project_id == project_id)
-        .order_by(News.created_at.desc())
-        .limit(5)
-        .all()
-    )
+        await db.scalars(
+            select(News)
+            .where(News.project_id == project_id)
+            .order_by(News.created_at.desc())
+            .limit(SUMMARY_ITEMS)
+        )
+    ).all()
 
-    return ProjectSummaryStats(
-        project=ProjectRead.model_validate(project),
-        total_tasks=sum(counts.values()),
-        task_counts=counts,
-        upcoming_events=[
-            EventSummary(
-                id=event.id,
-                title=event.title,
-                start=event.start,
-                end=event.end,
-                room_id=event.room_id,
-            )
-            for event in upcoming_events
-        ],
-        recent_news=[
-            NewsSummary(
-                id=item.id,
-                title=item.title,
-                created_at=item.created_at,
-                tags=item.tags,
-            )
-            for item in recent_news
-        ],
-    )
+    return _build_summary(project, counts, upcoming_events, recent_news)
 
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED, summary="Create project")
-def create_project(
+async def create_project(
     payload: ProjectCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> ProjectRead:
     """Create a new project entry."""
 
     project = Project(**payload.model_dump())
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     return ProjectRead.model_validate(project)
 
 
 @router.put("/{project_id}", response_model=ProjectRead, summary="Update project")
-def update_project(
+async def update_project(
     project_id: int,
     payload: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> ProjectRead:
     """Update a project."""
 
-    project = db.get(Project, project_id)
+    project = await db.get(Project, project_id)
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROJECT_NOT_FOUND)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(project, field, value)
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     return ProjectRead.model_validate(project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete project")
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
     """Delete a project."""
 
-    project = db.get(Project, project_id)
+    project = await db.get(Project, project_id)
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROJECT_NOT_FOUND)
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
@@ -1,71 +1,123 @@
 """Room management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.serialization import json_response
 from app.dependencies import require_roles
 from app.db.models.room import Room
+from app.db.room_bookings import bookings_query, free_slots
 from app.db.session import get_db
-from app.schemas.room import RoomCreate, RoomRead, RoomUpdate
+from app.db.timestamps import naive_utc
+from app.pagination import PageParams, SortKey, page_params, paginate
+from app.schemas.room import RoomAvailability, RoomCreate, RoomRead, RoomUpdate
 
 ROOM_NOT_FOUND = "Room not found"
 
+ROOM_SORT = (SortKey(Room.name), SortKey(Room.id))
+
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
 
 @router.get("", response_model=list[RoomRead], summary="List rooms")
-def list_rooms(db: Session = Depends(get_db)) -> list[RoomRead]:
+async def list_rooms(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params),
+) -> Response:
     """Return all rooms."""
 
-    rooms = db.query(Room).order_by(Room.name.asc()).all()
-    return [RoomRead.model_validate(room) for room in rooms]
+    rooms = await paginate(db, select(Room), ROOM_SORT, page, response)
+    return json_response(list[RoomRead], rooms, response)
+
+
+@router.get("/availability", response_model=list[RoomAvailability], summary="Free slots of all rooms")
+async def room_availability(
+    start: datetime = Query(..., alias="from", description="Range start"),
+    end: datetime = Query(..., alias="to", description="Range end, exclusive"),
+    min_capacity: int | None = Query(default=None, ge=0, description="Only rooms with at least this capacity"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return the free slots of every (sufficiently large) room in ``[from, to)``, ordered by room name.
+
+    One query fetches the bookings of all rooms in the range; the gaps are
+    found in a single sweep over them. Times are UTC.
+    """
+
+    start, end = naive_utc(start), naive_utc(end)
+    max_days = get_settings().room_availability_max_days
+    if not start < end <= start + timedelta(days=max_days):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"from must be before to, at most {max_days} days apart",
+        )
+    query = select(Room.id, Room.name, Room.capacity).order_by(*(key.order_by() for key in ROOM_SORT))
+    if min_capacity is not None:
+        query = query.where(Room.capacity >= min_capacity)
+    rooms = (await db.execute(query)).all()
+    bookings = (await db.execute(bookings_query([room.id for room in rooms], start, end))).all() if rooms else []
+    slots = free_slots([room.id for room in rooms], bookings, start, end)
+    availability = [
+        {
+            "room_id": room.id,
+            "name": room.name,
+            "capacity": room.capacity,
+            "free": [{"start": slot_start, "end": slot_end} for slot_start, slot_end in slots[room.id]],
+        }
+        for room in rooms
+    ]
+    return json_response(list[RoomAvailability], availability)
 
 
 @router.post("", response_model=RoomRead, status_code=status.HTTP_201_CREATED, summary="Create room")
-def create_room(
+async def create_room(
     payload: RoomCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> RoomRead:
     """Create a new room record."""
 
     room = Room(**payload.model_dump())
     db.add(room)
-    db.commit()
-    db.refresh(room)
+    await db.commit()
+    await db.refresh(room)
     return RoomRead.model_validate(room)
 
 
 @router.put("/{room_id}", response_model=RoomRead, summary="Update room")
-def update_room(
+async def update_room(
     room_id: int,
     payload: RoomUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> RoomRead:
     """Update an existing room."""
 
-    room = db.get(Room, room_id)
+    room = await db.get(Room, room_id)
     if room is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ROOM_NOT_FOUND)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(room, field, value)
     db.add(room)
-    db.commit()
-    db.refresh(room)
+    await db.commit()
+    await db.refresh(room)
     return RoomRead.model_validate(room)
 
 
 @router.delete("/{room_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete room")
-def delete_room(
+async def delete_room(
     room_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin")),
 ) -> None:
     """Delete a room."""
 
-    room = db.get(Room, room_id)
+    room = await db.get(Room, room_id)
     if room is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ROOM_NOT_FOUND)
-    db.delete(room)
-    db.commit()
+    await db.delete(room)
+    await db.commit()
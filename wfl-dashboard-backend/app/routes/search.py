@@ -0,0 +1,83 @@
+"""Full-text search across news, projects, tasks and events."""
+
+import html
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import session as db_session
+from app.db.search import KIND_CODES, KINDS, ROWID_STRIDE, SEARCH_TABLE, match_expression
+from app.db.session import get_db
+from app.pagination import PageParams, invalid_cursor, page_limit, page_params, pack_cursor, set_next_page, unpack_cursor
+from app.schemas.search import SearchHit, SearchKind
+
+SEARCH_UNAVAILABLE = "Full-text search requires the SQLite backend"
+
+# Control characters mark matches so the excerpt can be escaped before <mark> tags are added
+MARK_OPEN, MARK_CLOSE = "\x02", "\x03"
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(MARK_OPEN, "<mark>").replace(MARK_CLOSE, "</mark>")
+
+
+@router.get("", response_model=list[SearchHit], summary="Full-text search")
+async def search(
+    *,
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    q: str = Query(..., min_length=1, max_length=200, description="Search words; the last one matches as prefix"),
+    kinds: list[SearchKind] | None = Query(default=None, alias="type", description="Restrict to result types"),
+    project_id: int | None = Query(default=None, description="Restrict to one project and its entries"),
+) -> list[SearchHit]:
+    """Return matches ranked by BM25 (title hits first), with highlighted excerpts."""
+
+    if db_session.engine.dialect.name != "sqlite":
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=SEARCH_UNAVAILABLE)
+    match = match_expression(q)
+    if match is None:
+        return []
+
+    limit = page_limit(page)
+    conditions = [f"{SEARCH_TABLE} MATCH :match"]
+    params: dict[str, object] = {"match": match, "limit": limit + 1}
+    if kinds:
+        codes = ", ".join(str(KIND_CODES[kind]) for kind in sorted(set(kinds)))
+        conditions.append(f"rowid % {ROWID_STRIDE} IN ({codes})")
+    if project_id is not None:
+        conditions.append("project_id = :project_id")
+        params["project_id"] = project_id
+    if page.cursor is not None:
+        try:
+            rank, rowid = unpack_cursor(page.cursor, 2)
+        except ValueError as exc:
+            raise invalid_cursor() from exc
+        if not isinstance(rank, (int, float)) or not isinstance(rowid, int):
+            raise invalid_cursor()
+        conditions.append("(rank > :rank OR (rank = :rank AND rowid > :rowid))")
+        params.update(rank=rank, rowid=rowid)
+
+    statement = text(
+        f"SELECT rowid, rank, title, snippet({SEARCH_TABLE}, 1, '{MARK_OPEN}', '{MARK_CLOSE}', '…', 16), project_id "
+        f"FROM {SEARCH_TABLE} WHERE {' AND '.join(conditions)} ORDER BY rank, rowid LIMIT :limit"
+    )
+    rows = (await db.execute(statement, params)).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        set_next_page(response, page, pack_cursor([rows[-1][1], rows[-1][0]]), limit)
+    return [
+        SearchHit(
+            type=KINDS[rowid % ROWID_STRIDE],
+            id=rowid // ROWID_STRIDE,
+            project_id=project,
+            title=title,
+            snippet=_highlight(snippet),
+            score=rank,
+        )
+        for rowid, rank, title, snippet, project in rows
+    ]
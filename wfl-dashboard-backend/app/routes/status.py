@@ -2,13 +2,18 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principals import get_principal_cache
+from app.core.view_cache import get_status_summary_cache, view_caches
 from app.db.models.event import Event
 from app.db.models.news import News
 from app.db.models.project import Project
 from app.db.session import get_db
+from app.dependencies import require_roles
+from app.schemas.cache import CacheStats
 from app.schemas.summary import EventSummary, NewsSummary, ProjectSummary, StatusSummary
 
 
@@ -16,38 +21,69 @@ router = APIRouter(prefix="/status", tags=["status"])
 
 
 @router.get("/health", summary="Service health check")
-def get_health() -> dict[str, str]:
+async def get_health() -> dict[str, str]:
 	"""Return basic service health information."""
 
 	return {"status": "online", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
+@router.get("/caches", response_model=dict[str, CacheStats], summary="In-process cache statistics")
+async def get_cache_stats(current_user=Depends(require_roles("admin"))) -> dict[str, CacheStats]:
+	"""Report hit ratios and database queries saved by the in-process caches."""
+
+	stats = {"principals": CacheStats(**get_principal_cache().stats())}
+	for cache in view_caches():
+		stats[cache.name] = CacheStats(**cache.stats())
+	return stats
+
+
 @router.get("/summary", response_model=StatusSummary, summary="Dashboard overview")
-def get_summary(db: Session = Depends(get_db)) -> StatusSummary:
-	"""Aggregate projects, events, and news for dashboard start view."""
+async def get_summary(db: AsyncSession = Depends(get_db)) -> Response:
+	"""Aggregate projects, events, and news for dashboard start view.
+
+	The serialized summary is cached until projects, events or news change,
+	or until the first listed event starts and has to roll out of the list.
+	"""
+
+	body = await get_status_summary_cache().get_or_compute("summary", lambda: _build_summary(db))
+	return Response(content=body, media_type="application/json")
+
+
+async def _build_summary(db: AsyncSession) -> tuple[bytes, float | None]:
+	"""Run the summary queries; return the JSON body and how long it stays valid."""
 
 	now = datetime.now(timezone.utc)
 	projects = (
-		db.query(Project)
-		.order_by(Project.created_at.desc())
-		.limit(10)
-		.all()
-	)
+		await db.scalars(
+			select(Project)
+			.order_by(Project.created_at.desc())
+			.limit(10)
+		)
+	).all()
 	upcoming_events = (
-		db.query(Event)
-		.filter(Event.start >= now)
-		.order_by(Event.start.asc())
-		.limit(5)
-		.all()
-	)
+		await db.scalars(
+			select(Event)
+			.where(Event.start >= now)
+			.order_by(Event.start.asc())
+			.limit(5)
+		)
+	).all()
 	recent_news = (
-		db.query(News)
-		.order_by(News.created_at.desc())
-		.limit(5)
-		.all()
-	)
+		await db.scalars(
+			select(News)
+			.order_by(News.created_at.desc())
+			.limit(5)
+		)
+	).all()
+
+	valid_for = None
+	if upcoming_events:
+		first_start = upcoming_events[0].start
+		if first_start.tzinfo is None:
+			first_start = first_start.replace(tzinfo=timezone.utc)
+		valid_for = (first_start - now).total_seconds()
 
-	return StatusSummary(
+	summary = StatusSummary(
 		projects=[
 			ProjectSummary(
 				id=project.id,
@@ -77,3 +113,4 @@ def get_summary(db: Session = Depends(get_db)) -> StatusSummary:
 			for news in recent_news
 		],
 	)
+	return summary.model_dump_json().encode(), valid_for
@@ -0,0 +1,118 @@
+"""Server-Sent Events feed of committed changes, replacing dashboard polling.
+
+Every change arrives as an event named after its topic (``projects``,
+``news``, ...) whose data is ``{"entity", "id", "operation", "fields"}``;
+``fields`` lists the changed columns of an update. Clients reload the rows
+they display, so the feed never carries data a list endpoint would not
+serve. A ``ready`` event opens the stream and carries the current position
+as its id; a ``reset`` event means changes were missed (buffer overrun,
+server restart) and every view should be reloaded.
+"""
+
+import weakref
+from collections.abc import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.change_feed import STREAM_TOPICS, ChangeFeed, get_change_feed, sse_frame
+from app.core.config import get_settings
+
+# Reconnect delay suggested to EventSource clients
+RETRY_MS = 3000
+# Comment line: keeps proxies from closing an idle connection, ignored by EventSource
+HEARTBEAT = b": heartbeat\n\n"
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+
+def stream_topics(
+    topics: str | None = Query(default=None, description=f"Comma-separated topics ({', '.join(STREAM_TOPICS)}); all when omitted"),
+) -> frozenset[str]:
+    """Parse the ``topics`` subscription; unknown names are rejected."""
+
+    names = {name.strip() for name in (topics or "").split(",") if name.strip()}
+    if not names:
+        return frozenset(STREAM_TOPICS)
+    unknown = sorted(names - set(STREAM_TOPICS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unknown topic(s): {', '.join(unknown)}"
+        )
+    return frozenset(names)
+
+
+def resume_position(feed: ChangeFeed, last_event_id: str | None) -> int | None:
+    """Sequence number after which to replay, ``None`` when ``last_event_id`` was issued elsewhere."""
+
+    epoch, _, seq = (last_event_id or "").strip().partition("-")
+    if epoch != feed.epoch or not seq.isdigit() or int(seq) > feed.last_seq:
+        return None
+    return int(seq)
+
+
+async def _event_stream(
+    feed: ChangeFeed, topics: frozenset[str], cursor: int | None, release: Callable[[], None]
+) -> AsyncIterator[bytes]:
+    subscription = {"topics": sorted(topics)}
+    try:
+        opening = "ready" if cursor is not None else "reset"
+        cursor = feed.last_seq if cursor is None else cursor
+        yield f"retry: {RETRY_MS}\n".encode() + sse_frame(opening, feed.event_id(cursor), subscription)
+        while True:
+            wakeup = feed.wakeup()
+            changes = feed.since(cursor)
+            if changes is None:
+                cursor = feed.last_seq
+                yield sse_frame("reset", feed.event_id(cursor), subscription)
+            elif changes:
+                cursor = changes[-1].seq
+                frames = b"".join(change.frame for change in changes if change.entity in topics)
+                if frames:
+                    yield frames
+            else:
+                await wakeup.wait()
+                if feed.last_seq == cursor:
+                    # Woken by the heartbeat tick
+                    yield HEARTBEAT
+    finally:
+        release()
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Server-Sent Events stream"}},
+    summary="Stream committed changes",
+)
+async def stream_changes(
+    topics: frozenset[str] = Depends(stream_topics),
+    last_event_id: str | None = Header(default=None, description="Resume after this event id (sent by EventSource on reconnect)"),
+    resume: str | None = Query(default=None, description="Resume after this event id, for clients that cannot set headers"),
+) -> StreamingResponse:
+    """Push a change event whenever a write to a subscribed topic commits."""
+
+    settings = get_settings()
+    feed = get_change_feed()
+    # The slot is taken here, not when the stream starts, so a burst of connects cannot exceed the cap
+    release = feed.subscribe(settings.stream_max_subscribers)
+    if release is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many stream subscribers, please retry shortly",
+            headers={"Retry-After": str(RETRY_MS // 1000)},
+        )
+    try:
+        resume_from = last_event_id or resume
+        cursor = resume_position(feed, resume_from) if resume_from else feed.last_seq
+        body = _event_stream(feed, topics, cursor, release)
+        # A client gone before the first chunk leaves the generator unstarted, so its finally never runs
+        weakref.finalize(body, release)
+        return StreamingResponse(
+            body,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    except BaseException:
+        release()
+        raise
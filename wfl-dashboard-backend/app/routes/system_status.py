@@ -1,71 +1,168 @@
 """Endpoints to manage external system status information."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.conditional import conditional_get
+from app.core.serialization import json_response
 from app.dependencies import require_roles
-from app.db.models.system_status import SystemStatus
+from app.db.metric_series import epoch
+from app.db.models.system_status import SystemStatus, SystemStatusTransition
 from app.db.session import get_db
-from app.schemas.system_status import SystemStatusCreate, SystemStatusRead, SystemStatusUpdate
+from app.db.status_history import compute_uptime
+from app.schemas.system_status import (
+    ServiceUptime,
+    SystemStatusCreate,
+    SystemStatusRead,
+    SystemStatusTransitionRead,
+    SystemStatusUpdate,
+)
 
 STATUS_NOT_FOUND = "System status entry not found"
+HISTORY_NOT_FOUND = "Service has no status history"
+
+WINDOW_UNITS = {"h": 3600, "d": 86400, "w": 7 * 86400, "y": 365 * 86400}
+WINDOW_PATTERN = r"^[1-9][0-9]{0,5}[hdwy]$"
 
 router = APIRouter(prefix="/system/status", tags=["system-status"])
 
 
-@router.get("", response_model=list[SystemStatusRead], summary="List system statuses")
-def list_system_statuses(db: Session = Depends(get_db)) -> list[SystemStatusRead]:
+@router.get(
+    "",
+    response_model=list[SystemStatusRead],
+    summary="List system statuses",
+    dependencies=[Depends(conditional_get("system_status"))],
+)
+async def list_system_statuses(response: Response, db: AsyncSession = Depends(get_db)) -> Response:
     """Return all known system status records."""
 
-    entries = db.query(SystemStatus).order_by(SystemStatus.service.asc()).all()
-    return [SystemStatusRead.model_validate(entry) for entry in entries]
+    entries = (await db.scalars(select(SystemStatus).order_by(SystemStatus.service.asc()))).all()
+    return json_response(list[SystemStatusRead], entries, response)
 
 
 @router.post("", response_model=SystemStatusRead, status_code=status.HTTP_201_CREATED, summary="Create system status")
-def create_system_status(
+async def create_system_status(
     payload: SystemStatusCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> SystemStatusRead:
     """Create a new system status entry."""
 
     entry = SystemStatus(**payload.model_dump())
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
     return SystemStatusRead.model_validate(entry)
 
 
 @router.patch("/{entry_id}", response_model=SystemStatusRead, summary="Update system status")
-def update_system_status(
+async def update_system_status(
     entry_id: int,
     payload: SystemStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> SystemStatusRead:
     """Update an existing system status entry."""
 
-    entry = db.get(SystemStatus, entry_id)
+    entry = await db.get(SystemStatus, entry_id)
     if entry is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=STATUS_NOT_FOUND)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(entry, field, value)
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
     return SystemStatusRead.model_validate(entry)
 
 
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete system status")
-def delete_system_status(
+async def delete_system_status(
     entry_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
     """Delete a system status entry."""
 
-    entry = db.get(SystemStatus, entry_id)
+    entry = await db.get(SystemStatus, entry_id)
     if entry is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=STATUS_NOT_FOUND)
-    db.delete(entry)
-    db.commit()
+    await db.delete(entry)
+    await db.commit()
+
+
+def _window_bounds(window: str, end: datetime | None) -> tuple[int, int]:
+    """Return ``[start, end)`` in Unix seconds for a window like ``30d`` ending at ``end`` (at most now)."""
+
+    now = epoch(datetime.now(timezone.utc))
+    range_end = now if end is None else min(epoch(end), now)
+    return range_end - int(window[:-1]) * WINDOW_UNITS[window[-1]], range_end
+
+
+async def _require_history(db: AsyncSession, service: str) -> None:
+    known = await db.scalar(select(SystemStatusTransition.id).where(SystemStatusTransition.service == service).limit(1))
+    if known is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=HISTORY_NOT_FOUND)
+
+
+def _utc(ts: int) -> datetime:
+    return datetime.fromtimestamp(ts, timezone.utc)
+
+
+@router.get("/{service}/uptime", response_model=ServiceUptime, summary="Service uptime over a window")
+async def get_service_uptime(
+    service: str,
+    window: str = Query(
+        default="30d", pattern=WINDOW_PATTERN, description="Window length in hours, days, weeks or years, e.g. `24h`, `30d`, `1y`"
+    ),
+    end: datetime | None = Query(default=None, description="Window end (default and maximum: now)"),
+    db: AsyncSession = Depends(get_db),
+) -> ServiceUptime:
+    """Return uptime, time per status, incident count and MTTR of ``service``.
+
+    Complete days come from the daily rollups, so long windows cost about
+    as much as short ones.
+    """
+
+    await _require_history(db, service)
+    start, range_end = _window_bounds(window, end)
+    totals = await db.run_sync(lambda session: compute_uptime(session.connection(), service, start, range_end))
+    ratio = totals.uptime_ratio
+    return ServiceUptime(
+        service=service,
+        start=_utc(start),
+        end=_utc(range_end),
+        observed_seconds=totals.ok_seconds + totals.warning_seconds + totals.down_seconds + totals.planned_seconds,
+        ok_seconds=totals.ok_seconds,
+        warning_seconds=totals.warning_seconds,
+        down_seconds=totals.down_seconds,
+        planned_seconds=totals.planned_seconds,
+        uptime_percent=None if ratio is None else round(ratio * 100, 4),
+        incidents=totals.incidents,
+        recoveries=totals.recoveries,
+        mttr_seconds=totals.mttr_seconds,
+    )
+
+
+@router.get("/{service}/history", response_model=list[SystemStatusTransitionRead], summary="Service status history")
+async def get_service_history(
+    service: str,
+    window: str = Query(default="30d", pattern=WINDOW_PATTERN, description="Window length, e.g. `24h`, `30d`, `1y`"),
+    end: datetime | None = Query(default=None, description="Window end (default and maximum: now)"),
+    limit: int = Query(default=500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+) -> list[SystemStatusTransitionRead]:
+    """Return the status changes of ``service`` in the window (including its end), newest first."""
+
+    await _require_history(db, service)
+    start, range_end = _window_bounds(window, end)
+    transition = SystemStatusTransition
+    rows = await db.execute(
+        select(transition.status, transition.message, transition.ts)
+        .where(transition.service == service, transition.ts >= start, transition.ts <= range_end)
+        .order_by(transition.ts.desc(), transition.id.desc())
+        .limit(limit)
+    )
+    return [SystemStatusTransitionRead(status=row.status, message=row.message, at=_utc(row.ts)) for row in rows]
@@ -1,43 +1,80 @@
 """Task management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.serialization import json_response
 from app.dependencies import get_current_user, require_roles
 from app.db.models.task import Task
 from app.db.session import get_db
+from app.export import ExportFormat, export_response
+from app.fields import field_params, load_fields
+from app.pagination import PageParams, SortKey, page_params, paginate
 from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
 
 TASK_NOT_FOUND = "Task not found"
 
+# Matches ix_tasks_due_created (due_date, created_at DESC) plus the implicit ascending rowid
+TASK_SORT = (
+    SortKey(Task.due_date, nulls_first=True),
+    SortKey(Task.created_at, descending=True, nulls_first=False),
+    SortKey(Task.id),
+)
+
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
+def task_list_query(assignee_id: int | None, project_id: int | None, status_filter: str | None) -> Select:
+    """Build the list_tasks statement (without ordering) from its filters."""
+
+    query = select(Task)
+    if assignee_id is not None:
+        query = query.where(Task.assignee_id == assignee_id)
+    if project_id is not None:
+        query = query.where(Task.project_id == project_id)
+    if status_filter is not None:
+        query = query.where(Task.status == status_filter)
+    return query
+
+
 @router.get("", response_model=list[TaskRead], summary="List tasks")
-def list_tasks(
+async def list_tasks(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
     assignee_id: int | None = Query(default=None, description="Filter tasks by assignee"),
     project_id: int | None = Query(default=None, description="Filter tasks by project"),
     status_filter: str | None = Query(default=None, alias="status"),
-) -> list[TaskRead]:
+    fields: tuple[str, ...] | None = Depends(field_params(TaskRead)),
+) -> Response:
     """Return tasks matching the provided filters."""
 
-    query = db.query(Task)
-    if assignee_id is not None:
-        query = query.filter(Task.assignee_id == assignee_id)
-    if project_id is not None:
-        query = query.filter(Task.project_id == project_id)
-    if status_filter is not None:
-        query = query.filter(Task.status == status_filter)
-    tasks = query.order_by(Task.due_date.asc(), Task.created_at.desc()).all()
-    return [TaskRead.model_validate(task) for task in tasks]
+    query = task_list_query(assignee_id, project_id, status_filter).options(*load_fields(Task, fields, TASK_SORT))
+    tasks = await paginate(db, query, TASK_SORT, page, response)
+    return json_response(list[TaskRead], tasks, response, fields=fields)
+
+
+@router.get("/export", summary="Export tasks as NDJSON or CSV")
+async def export_tasks(
+    *,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    assignee_id: int | None = Query(default=None, description="Filter tasks by assignee"),
+    project_id: int | None = Query(default=None, description="Filter tasks by project"),
+    status_filter: str | None = Query(default=None, alias="status"),
+) -> StreamingResponse:
+    """Stream all tasks matching the list filters, one row at a time."""
+
+    query = task_list_query(assignee_id, project_id, status_filter)
+    return export_response(query, TASK_SORT, TaskRead, export_format, "tasks")
 
 
 @router.post("", response_model=TaskRead, status_code=status.HTTP_201_CREATED, summary="Create task")
-def create_task(
+async def create_task(
     payload: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand", "team")),
 ) -> TaskRead:
     """Create a task for the organisation."""
@@ -46,21 +83,21 @@ def create_task(
     data["created_by"] = payload.created_by or current_user.id
     task = Task(**data)
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
     return TaskRead.model_validate(task)
 
 
 @router.patch("/{task_id}", response_model=TaskRead, summary="Update task")
-def update_task(
+async def update_task(
     task_id: int,
     payload: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> TaskRead:
     """Update task fields; permissions enforced by role."""
 
-    task = db.get(Task, task_id)
+    task = await db.get(Task, task_id)
     if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=TASK_NOT_FOUND)
 
@@ -70,21 +107,21 @@ def update_task(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(task, field, value)
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
     return TaskRead.model_validate(task)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete task")
-def delete_task(
+async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(require_roles("admin", "vorstand")),
 ) -> None:
     """Delete a task."""
 
-    task = db.get(Task, task_id)
+    task = await db.get(Task, task_id)
     if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=TASK_NOT_FOUND)
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
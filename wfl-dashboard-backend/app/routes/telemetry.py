@@ -0,0 +1,20 @@
+"""Prometheus scrape endpoint for request and database telemetry."""
+
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from app.core.config import get_settings
+from app.core.telemetry import CONTENT_TYPE, get_telemetry
+
+router = APIRouter(tags=["telemetry"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_prometheus_metrics(authorization: str | None = Header(default=None)) -> Response:
+    """Render request counts, latency, response size and DB timing histograms for Prometheus."""
+
+    token = get_settings().telemetry_token
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return Response(content=get_telemetry().render(), media_type=CONTENT_TYPE)
@@ -1,66 +1,80 @@
 """User management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.principals import Principal, invalidate_user
+from app.core.security import get_password_hash_async
+from app.core.serialization import json_response
 from app.dependencies import get_current_user, require_roles
 from app.db.models.user import User
 from app.db.session import get_db
+from app.fields import field_params, load_fields
+from app.pagination import PageParams, SortKey, page_params, paginate
 from app.schemas.user import UserRead, UserUpdate, UserPasswordUpdate
 
 USER_NOT_FOUND = "User not found"
 PERMISSION_DENIED = "Insufficient permissions"
 
+USER_SORT = (SortKey(User.created_at, nulls_first=True), SortKey(User.id))
+
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("", response_model=list[UserRead], summary="List users")
-def list_users(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles("admin", "vorstand")),
-) -> list[UserRead]:
+async def list_users(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params),
+    current_user: Principal = Depends(require_roles("admin", "vorstand")),
+    fields: tuple[str, ...] | None = Depends(field_params(UserRead)),
+) -> Response:
     """Return all users ordered by creation time."""
 
-    users = db.query(User).order_by(User.created_at.asc()).all()
-    return [UserRead.model_validate(user) for user in users]
+    query = select(User).options(*load_fields(User, fields, USER_SORT))
+    users = await paginate(db, query, USER_SORT, page, response)
+    return json_response(list[UserRead], users, response, fields=fields)
 
 
 @router.get("/me", response_model=UserRead, summary="Retrieve current user")
-def get_me(current_user: User = Depends(get_current_user)) -> UserRead:
+async def get_me(current_user: Principal = Depends(get_current_user)) -> UserRead:
     """Return the authenticated user's information."""
 
     return UserRead.model_validate(current_user)
 
 
 @router.get("/{user_id}", response_model=UserRead, summary="Get user by id")
-def get_user(
+async def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    fields: tuple[str, ...] | None = Depends(field_params(UserRead)),
 ) -> UserRead:
     """Return a user if permitted."""
 
     if current_user.role not in {"admin", "vorstand"} and current_user.id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=PERMISSION_DENIED)
 
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id, options=load_fields(User, fields))
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND)
 
+    if fields is not None:
+        return json_response(UserRead, user, fields=fields)
     return UserRead.model_validate(user)
 
 
 @router.patch("/{user_id}", response_model=UserRead, summary="Update user profile")
-def update_user(
+async def update_user(
     user_id: int,
     payload: UserUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserRead:
     """Update user details respecting role constraints."""
 
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND)
 
@@ -74,11 +88,16 @@ def update_user(
     if "role" in update_data and not is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins may change roles")
 
+    if "role" in update_data and update_data["role"] != user.role:
+        # Revoke claim-based tokens that still carry the old role
+        user.token_version = (user.token_version or 0) + 1
+
     for field, value in update_data.items():
         setattr(user, field, value)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    invalidate_user(user_id)
+    await db.refresh(user)
     return UserRead.model_validate(user)
 
 
@@ -87,36 +106,38 @@ def update_user(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Update user password",
 )
-def update_password(
+async def update_password(
     user_id: int,
     payload: UserPasswordUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
     """Update a user's password; allowed for admins or the user themselves."""
 
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND)
 
     if current_user.role != "admin" and current_user.id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=PERMISSION_DENIED)
 
-    user.password_hash = get_password_hash(payload.password)
+    user.password_hash = await get_password_hash_async(payload.password)
     db.add(user)
-    db.commit()
+    await db.commit()
+    invalidate_user(user_id)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete user")
-def delete_user(
+async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles("admin")),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_roles("admin")),
 ) -> None:
     """Remove a user from the system."""
 
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND)
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    invalidate_user(user_id)
@@ -15,6 +15,9 @@ class TokenPayload(BaseModel):
 
     sub: str
     exp: int
+    uid: int | None = None
+    role: str | None = None
+    ver: int | None = None
 
 
 class LoginRequest(BaseModel):
@@ -0,0 +1,18 @@
+"""Schemas for in-process cache statistics."""
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Counters reported by an in-process cache."""
+
+    size: int = 0
+    max_size: int | None = None
+    hits: int = 0
+    misses: int = 0
+    # Requests that waited for an identical computation instead of running their own
+    coalesced: int = 0
+    hit_ratio: float = 0.0
+    evictions: int = 0
+    invalidations: int = 0
+    db_queries_saved: int = 0
@@ -0,0 +1,18 @@
+"""Pydantic schemas for the change outbox."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ChangeRead(BaseModel):
+    """One committed create, update or delete, in sequence order."""
+
+    seq: int
+    entity: str
+    entity_id: int
+    operation: str
+    fields: list[str] | None = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
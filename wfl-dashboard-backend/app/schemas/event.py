@@ -2,7 +2,9 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.db.timestamps import naive_utc
 
 
 class EventBase(BaseModel):
@@ -16,6 +18,12 @@ class EventBase(BaseModel):
     is_public: bool = False
     project_id: int | None = None
 
+    @field_validator("start", "end")
+    @classmethod
+    def _naive_utc(cls, value: datetime) -> datetime:
+        # Stored and compared as naive UTC: ``10:00+02:00`` books 08:00 for the conflict check and availability alike
+        return naive_utc(value)
+
 
 class EventCreate(EventBase):
     """Payload to create an event."""
@@ -34,6 +42,11 @@ class EventUpdate(BaseModel):
     is_public: bool | None = None
     project_id: int | None = None
 
+    @field_validator("start", "end")
+    @classmethod
+    def _naive_utc(cls, value: datetime | None) -> datetime | None:
+        return None if value is None else naive_utc(value)
+
 
 class EventRead(EventBase):
     """Event representation returned by the API."""
@@ -1,6 +1,7 @@
 """Pydantic schemas for dashboard metrics."""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel
 
@@ -29,3 +30,47 @@ class MetricRead(MetricBase):
     updated_at: datetime | None = None
 
     model_config = {"from_attributes": True}
+
+
+class MetricBulkItem(MetricBase):
+    """One record of a bulk upsert; ``timestamp`` defaults to the time of the request."""
+
+    timestamp: datetime | None = None
+
+
+class MetricBulkResult(BaseModel):
+    """Outcome of a bulk upsert: rows written now, or records queued for the write-behind buffer."""
+
+    received: int
+    written: int
+    queued: int
+
+
+class MetricPointIn(BaseModel):
+    """One sample to ingest; ``ts`` defaults to the time of the request."""
+
+    value: float
+    ts: datetime | None = None
+
+
+class MetricSeriesPoint(BaseModel):
+    """One raw sample or rollup bucket; raw samples have ``count`` 1 and equal min/max/avg/last."""
+
+    ts: datetime
+    min: float
+    max: float
+    avg: float
+    count: int
+    last: float
+
+    model_config = {"from_attributes": True}
+
+
+class MetricSeries(BaseModel):
+    """Samples of one metric over a time range at the resolution chosen for it."""
+
+    metric_id: int
+    resolution: Literal["raw", "1m", "1h", "1d"]
+    start: datetime
+    end: datetime
+    points: list[MetricSeriesPoint]
@@ -39,3 +39,10 @@ class NewsRead(NewsBase):
     created_at: datetime | None = None
 
     model_config = {"from_attributes": True}
+
+
+class NewsTagCount(BaseModel):
+    """Number of news entries carrying a tag."""
+
+    tag: str
+    count: int
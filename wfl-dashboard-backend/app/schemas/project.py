@@ -44,5 +44,8 @@ class ProjectSummaryStats(BaseModel):
     project: ProjectRead
     total_tasks: int
     task_counts: dict[str, int]
+    # Open or in-progress tasks due before today
+    overdue_tasks: int = 0
+    news_count: int = 0
     upcoming_events: list[EventSummary]
     recent_news: list[NewsSummary]
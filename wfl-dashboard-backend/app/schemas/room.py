@@ -1,5 +1,7 @@
 """Pydantic schemas for rooms."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -29,3 +31,19 @@ class RoomRead(RoomBase):
     id: int
 
     model_config = {"from_attributes": True}
+
+
+class RoomSlot(BaseModel):
+    """A free stretch of time, ``end`` exclusive."""
+
+    start: datetime
+    end: datetime
+
+
+class RoomAvailability(BaseModel):
+    """Free slots of one room within the requested range."""
+
+    room_id: int
+    name: str
+    capacity: int | None = None
+    free: list[RoomSlot]
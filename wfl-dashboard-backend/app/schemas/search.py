@@ -0,0 +1,20 @@
+"""Schemas for full-text search results."""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+SearchKind = Literal["news", "project", "task", "event"]
+
+
+class SearchHit(BaseModel):
+    """One ranked match of a full-text search."""
+
+    type: SearchKind
+    id: int
+    project_id: int | None = None
+    title: str
+    # HTML-escaped body excerpt with matches wrapped in <mark>
+    snippet: str
+    # BM25 score; lower is a better match
+    score: float
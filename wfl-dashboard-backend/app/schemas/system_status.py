@@ -31,3 +31,33 @@ class SystemStatusRead(SystemStatusBase):
     updated_at: datetime | None = None
 
     model_config = {"from_attributes": True}
+
+
+class SystemStatusTransitionRead(BaseModel):
+    """A service entering a status; ``status`` is ``None`` once its entry was deleted."""
+
+    status: str | None
+    message: str | None = None
+    at: datetime
+
+
+class ServiceUptime(BaseModel):
+    """Availability of one service over a window.
+
+    ``uptime_percent`` relates ``ok`` and ``warning`` time to all observed
+    time outside planned maintenance; ``mttr_seconds`` averages the
+    incidents that ended within the window.
+    """
+
+    service: str
+    start: datetime
+    end: datetime
+    observed_seconds: int
+    ok_seconds: int
+    warning_seconds: int
+    down_seconds: int
+    planned_seconds: int
+    uptime_percent: float | None
+    incidents: int
+    recoveries: int
+    mttr_seconds: float | None
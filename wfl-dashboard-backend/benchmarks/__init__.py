@@ -0,0 +1 @@
+"""Standalone performance benchmarks; run from the backend directory with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,115 @@
+"""Cost of the ``changes`` outbox on writes, and delta sync versus full reread.
+
+1. Commits ``--writes`` single-row project updates with the outbox hook
+   detached and attached, reporting the per-commit latency.
+2. After ``--changes`` updates on a table of ``--rows`` projects, syncs a
+   consumer twice: by rereading ``/api/projects`` in full, and by pulling
+   ``/api/changes?after=`` plus the changed rows (``/api/projects/{id}``).
+
+    python -m benchmarks.change_outbox --rows 20000 --writes 500 --changes 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+EMAIL = "bench@example.com"
+
+
+def _seed(rows: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Project, User
+    from app.db.session import engine
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": EMAIL, "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Project), [{"title": f"Projekt {i}", "description": "Beschreibung " * 10, "status": "green"} for i in range(rows)])
+
+
+def _update(index: int) -> float:
+    from app.db.models import Project
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        project = db.get(Project, index + 1)
+        project.status = "yellow" if project.status == "green" else "green"
+        started = time.perf_counter()
+        db.commit()
+        return time.perf_counter() - started
+
+
+def _write_overhead(args: argparse.Namespace) -> None:
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    from app.db.changes import _append_changes
+
+    for label, attached in (("without outbox", False), ("with outbox", True)):
+        if not attached:
+            event.remove(Session, "after_flush", _append_changes)
+        latencies = [_update(index % args.rows) for index in range(args.writes)]
+        if not attached:
+            event.listen(Session, "after_flush", _append_changes)
+        print(f"commit {label:<15} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}")
+
+
+async def _sync(app, args: argparse.Namespace) -> None:
+    import httpx
+
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(EMAIL)}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        head = int((await client.get("/api/changes", params={"limit": 1})).headers["X-Changes-Head"])
+        for index in range(args.changes):
+            await asyncio.to_thread(_update, (index * 97) % args.rows)
+
+        started = time.perf_counter()
+        resp = await client.get("/api/projects")
+        resp.raise_for_status()
+        full_time, full_bytes = time.perf_counter() - started, len(resp.content)
+
+        started = time.perf_counter()
+        delta_bytes = 0
+        changed: set[int] = set()
+        after = head
+        while True:
+            resp = await client.get("/api/changes", params={"after": after, "entity": "projects", "limit": 500})
+            resp.raise_for_status()
+            delta_bytes += len(resp.content)
+            batch = resp.json()
+            if not batch:
+                break
+            changed.update(change["entity_id"] for change in batch)
+            after = batch[-1]["seq"]
+        for project_id in changed:
+            resp = await client.get(f"/api/projects/{project_id}")
+            delta_bytes += len(resp.content)
+        delta_time = time.perf_counter() - started
+
+    print(f"full reread      {format_ms(full_time)}  bytes={full_bytes:>10}")
+    print(f"delta via outbox {format_ms(delta_time)}  bytes={delta_bytes:>10}  changed rows={len(changed)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--changes", type=int, default=50)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.rows)
+    _write_overhead(args)
+    asyncio.run(_sync(create_app(), args))
+
+
+if __name__ == "__main__":
+    main()
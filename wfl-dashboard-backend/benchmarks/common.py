@@ -0,0 +1,45 @@
+"""Helpers shared by the benchmark scripts."""
+
+import os
+import statistics
+import tempfile
+from pathlib import Path
+
+
+def configure_database(path: str | None = None) -> str:
+    """Point the application at a throwaway SQLite file; call before importing ``app``."""
+
+    if path is None:
+        path = str(Path(tempfile.mkdtemp(prefix="wfl-bench-")) / "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+    from app.core.config import get_settings
+
+    get_settings.cache_clear()
+    return os.environ["DATABASE_URL"]
+
+
+def create_schema() -> None:
+    """Create all tables on the application engine."""
+
+    from app.db import base
+    from app.db.session import engine
+
+    base.Base.metadata.create_all(bind=engine)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the given percentile (0-100) of ``values``; 0.0 for an empty list."""
+
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[min(int(pct), 99) - 1]
+
+
+def format_ms(seconds: float) -> str:
+    """Render a duration in milliseconds."""
+
+    return f"{seconds * 1000:8.2f} ms"
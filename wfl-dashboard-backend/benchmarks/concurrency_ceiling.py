@@ -0,0 +1,112 @@
+"""Concurrency ceiling of the sync (threadpool) and async (AsyncEngine) session modes.
+
+A fixed per-statement latency is injected into SQLite (via the connection
+trace callback, which runs in whichever thread executes the statement) to
+mimic a networked database. For each client concurrency level the script
+reports throughput and the peak number of statements in flight: the sync
+mode plateaus at the anyio threadpool size, the async mode at the
+connection pool size.
+
+    python -m benchmarks.concurrency_ceiling --latency-ms 20 --levels 10 40 100 200
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from benchmarks.common import configure_database, create_schema
+
+
+class InFlightCounter:
+    """Tracks statements currently sleeping in the injected latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _statement: str) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.latency)
+        with self._lock:
+            self.current -= 1
+
+
+def _install_latency(sync_engine, counter: InFlightCounter, is_async: bool) -> None:
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, _record) -> None:
+        raw = dbapi_connection.driver_connection._conn if is_async else dbapi_connection
+        raw.set_trace_callback(counter)
+
+
+async def _measure(app, concurrency: int, requests: int) -> float:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call() -> None:
+            async with semaphore:
+                (await client.get("/api/rooms")).raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--levels", type=int, nargs="+", default=[10, 40, 100, 200])
+    parser.add_argument("--requests-per-client", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=200, help="connection pool size for both modes")
+    args = parser.parse_args()
+
+    database_url = configure_database()
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db import session as db_session
+    from app.main import create_app
+
+    create_schema()
+    app = create_app()
+    connect_args = {"check_same_thread": False}
+
+    for mode in ("sync", "async"):
+        counter = InFlightCounter(args.latency_ms / 1000)
+        if mode == "sync":
+            engine = create_engine(database_url, connect_args=connect_args, pool_size=args.pool_size)
+            _install_latency(engine, counter, is_async=False)
+            db_session.SessionLocal = sessionmaker(bind=engine, autoflush=False)
+            db_session.AsyncSessionLocal = None
+        else:
+            async_engine = create_async_engine(
+                db_session.async_database_url(database_url), connect_args=connect_args, pool_size=args.pool_size
+            )
+            _install_latency(async_engine.sync_engine, counter, is_async=True)
+            db_session.AsyncSessionLocal = async_sessionmaker(
+                bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+            )
+
+        for level in args.levels:
+            counter.peak = 0
+            throughput = asyncio.run(_measure(app, level, level * args.requests_per_client))
+            print(f"{mode:<5} clients={level:4d}  req/s={throughput:8.1f}  peak in-flight statements={counter.peak:4d}")
+
+        if mode == "async":
+            asyncio.run(async_engine.dispose())
+        else:
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Dashboard polling with and without conditional GETs.
+
+``--clients`` pollers fetch the polled list endpoints ``--polls`` times each
+while a writer creates one project every ``--write-every`` polls. Reports
+requests/sec, SQL statements, list queries run and bytes sent, first with
+plain GETs and then with ``If-None-Match`` revalidation.
+
+    python -m benchmarks.etag_polling --clients 20 --polls 50 --rows 500
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import configure_database, create_schema
+
+ENDPOINTS = ("/api/projects", "/api/news", "/api/events", "/api/metrics", "/api/system/status")
+
+
+def _seed(rows: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Event, Metric, News, Project, Room, SystemStatus, User
+    from app.db.session import engine
+
+    start = datetime.utcnow() + timedelta(days=1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": "Saal"}])
+        conn.execute(insert(Project), [{"title": f"Projekt {i}", "status": "green"} for i in range(rows)])
+        conn.execute(insert(News), [{"title": f"News {i}", "body": "Text " * 40, "author_id": 1} for i in range(rows)])
+        conn.execute(
+            insert(Event),
+            [
+                {"title": f"Termin {i}", "start": start + timedelta(hours=i), "end": start + timedelta(hours=i + 1), "room_id": 1, "created_by": 1}
+                for i in range(rows)
+            ],
+        )
+        conn.execute(insert(Metric), [{"name": f"kennzahl-{i}", "value": i} for i in range(50)])
+        conn.execute(insert(SystemStatus), [{"service": f"dienst-{i}", "status": "ok"} for i in range(10)])
+
+
+async def _run(app, conditional: bool, args: argparse.Namespace) -> None:
+    import httpx
+    from sqlalchemy import event
+
+    from app.db.models import Project
+    from app.db.session import SessionLocal, engine
+
+    statements = 0
+    list_queries = 0
+
+    def _count(conn, cursor, statement, *_args) -> None:
+        nonlocal statements, list_queries
+        statements += 1
+        if "table_versions" not in statement and statement.lstrip().startswith("SELECT"):
+            list_queries += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        sent = 0
+        not_modified = 0
+
+        async def poller() -> None:
+            nonlocal sent, not_modified
+            etags: dict[str, str] = {}
+            for poll in range(args.polls):
+                for url in ENDPOINTS:
+                    headers = {"If-None-Match": etags[url]} if conditional and url in etags else {}
+                    resp = await client.get(url, headers=headers)
+                    sent += len(resp.content)
+                    if resp.status_code == 304:
+                        not_modified += 1
+                    else:
+                        resp.raise_for_status()
+                        etags[url] = resp.headers["ETag"]
+                await asyncio.sleep(0)
+
+        async def writer() -> None:
+            for index in range(args.polls // args.write_every):
+                await asyncio.sleep(0.01)
+
+                def commit() -> None:
+                    with SessionLocal() as db:
+                        db.add(Project(title=f"Neu {index}", status="green"))
+                        db.commit()
+
+                await asyncio.to_thread(commit)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        started = time.perf_counter()
+        await asyncio.gather(writer(), *(poller() for _ in range(args.clients)))
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", _count)
+
+    requests = args.clients * args.polls * len(ENDPOINTS)
+    label = "If-None-Match" if conditional else "plain GET"
+    print(
+        f"{label:<14} req/s={requests / elapsed:8.1f}  statements={statements:>6}  list queries={list_queries:>6}  "
+        f"304s={not_modified:>5}  bytes sent={sent / 1e6:8.2f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--write-every", type=int, default=10)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.rows)
+    app = create_app()
+    for conditional in (False, True):
+        asyncio.run(_run(app, conditional, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Deep-page latency of keyset pagination versus LIMIT/OFFSET.
+
+Fills the projects table to each requested size and fetches a page near the
+end of the listing, once by skipping rows with OFFSET and once by seeking past
+a cursor as ``GET /api/projects?cursor=...`` does. OFFSET cost grows with the
+table; keyset latency should stay flat.
+
+    python -m benchmarks.keyset_pagination --sizes 10000 100000 500000 --page-size 50
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchmarks.common import format_ms, percentile
+
+
+def _measure(session, statement, repeats: int) -> list[float]:
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        session.scalars(statement).all()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--depth", type=float, default=0.9, help="Position of the measured page (0-1)")
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    from app.core.config import Settings
+    from app.db.base import Base
+    from app.db.models.project import Project
+    from app.db.session import create_db_engine
+    from app.pagination import decode_cursor, encode_cursor, keyset_predicate
+    from app.routes.projects import PROJECT_SORT
+
+    database_url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='wfl-bench-')) / 'pagination.db'}"
+    engine = create_db_engine(database_url, Settings())
+    Base.metadata.create_all(bind=engine)
+    ordered = select(Project).order_by(*(key.order_by() for key in PROJECT_SORT))
+    epoch = datetime(2020, 1, 1)
+
+    rows = 0
+    with Session(engine) as session:
+        for size in sorted(args.sizes):
+            batch = [
+                {"title": f"bench-{index}", "status": "green", "created_at": epoch + timedelta(seconds=index // 3)}
+                for index in range(rows, size)
+            ]
+            if batch:
+                session.execute(insert(Project), batch)
+                session.commit()
+            rows = size
+
+            offset = int(size * args.depth)
+            anchor = session.scalars(ordered.offset(offset - 1).limit(1)).one()
+            values = decode_cursor(PROJECT_SORT, encode_cursor(PROJECT_SORT, anchor))
+            offset_page = ordered.offset(offset).limit(args.page_size)
+            keyset_page = ordered.where(keyset_predicate(PROJECT_SORT, values)).limit(args.page_size + 1)
+
+            ids = [project.id for project in session.scalars(offset_page)]
+            assert ids == [project.id for project in session.scalars(keyset_page)][: len(ids)]
+
+            offset_latencies = _measure(session, offset_page, args.repeats)
+            keyset_latencies = _measure(session, keyset_page, args.repeats)
+            print(
+                f"rows={size:8d} offset={offset:8d}  "
+                f"OFFSET p50={format_ms(percentile(offset_latencies, 50))} p99={format_ms(percentile(offset_latencies, 99))}  "
+                f"keyset p50={format_ms(percentile(keyset_latencies, 50))} p99={format_ms(percentile(keyset_latencies, 99))}"
+            )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Login throughput and GET tail latency while bcrypt work is in flight.
+
+Runs the same login storm twice: once with hashing on the request threadpool
+(``workers=0``, the previous behaviour) and once on the dedicated process pool.
+Concurrent dashboard GETs are timed during each storm.
+
+    python -m benchmarks.login_throughput --logins 200 --concurrency 64 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+PASSWORD = "benchmark-password"
+EMAIL = "bench@example.com"
+
+
+def _seed_user() -> None:
+    from app.core.security import get_password_hash
+    from app.db.models.user import User
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.add(User(name="Bench", email=EMAIL, password_hash=get_password_hash(PASSWORD), role="admin"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _run_mode(app, workers: int, args: argparse.Namespace) -> dict[str, float]:
+    import httpx
+
+    from app.core import security
+
+    security.shutdown_password_hasher_pool()
+    security._hasher_pool = security.PasswordHasherPool(
+        workers=workers, max_pending=args.logins, retry_after=1
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up worker processes so pool start-up is not billed to the first logins
+        await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        get_latencies: list[float] = []
+        storm_done = asyncio.Event()
+
+        async def login() -> int:
+            async with semaphore:
+                resp = await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+                return resp.status_code
+
+        async def poll_dashboard() -> None:
+            while not storm_done.is_set():
+                started = time.perf_counter()
+                await client.get("/api/status/summary")
+                get_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(args.get_interval)
+
+        pollers = [asyncio.create_task(poll_dashboard()) for _ in range(args.pollers)]
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        storm_done.set()
+        await asyncio.gather(*pollers)
+
+    security.shutdown_password_hasher_pool()
+    return {
+        "logins_per_sec": sum(1 for code in statuses if code == 200) / elapsed,
+        "get_p50": percentile(get_latencies, 50),
+        "get_p99": percentile(get_latencies, 99),
+        "gets": len(get_latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4, help="process pool size for the pooled run")
+    parser.add_argument("--pollers", type=int, default=8, help="concurrent dashboard GET loops")
+    parser.add_argument("--get-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed_user()
+    app = create_app()
+
+    for label, workers in (("threadpool", 0), (f"process pool ({args.workers})", args.workers)):
+        result = asyncio.run(_run_mode(app, workers, args))
+        print(
+            f"{label:<22} logins/s={result['logins_per_sec']:7.1f}  "
+            f"GET p50={format_ms(result['get_p50'])}  GET p99={format_ms(result['get_p99'])}  "
+            f"(n={result['gets']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Metric ingest: one request per value versus ``POST /api/metrics/bulk``.
+
+An external job reports ``--metrics`` metrics per round for ``--rounds``
+rounds. Records per second are measured for:
+
+1. one ``PATCH /api/metrics/{id}`` per value (commit and refresh each),
+2. one bulk request per round (a single upsert statement),
+3. bulk requests into the write-behind buffer, ``--senders`` jobs each
+   reporting every metric per round, including the final flush.
+
+    python -m benchmarks.metric_bulk --metrics 50 --rounds 40 --senders 8
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import configure_database, create_schema
+
+EMAIL = "bench@example.com"
+
+
+def _seed(metrics: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Metric, User
+    from app.db.session import engine
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": EMAIL, "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Metric), [{"name": f"job.metric.{i}", "value": 0.0} for i in range(metrics)])
+
+
+def _report(label: str, records: int, elapsed: float) -> None:
+    print(f"{label:<28} {records:>7} records in {elapsed:7.2f} s  {records / elapsed:>10.0f} records/s")
+
+
+async def _run(app, args: argparse.Namespace) -> None:
+    import httpx
+
+    from app.core.config import get_settings
+    from app.core.metric_buffer import get_metric_buffer
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(EMAIL)}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        started = time.perf_counter()
+        for round_no in range(args.rounds):
+            for metric_id in range(1, args.metrics + 1):
+                (await client.patch(f"/api/metrics/{metric_id}", json={"value": round_no})).raise_for_status()
+        _report("PATCH per value", args.rounds * args.metrics, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for round_no in range(args.rounds):
+            batch = [{"name": f"job.metric.{i}", "value": round_no} for i in range(args.metrics)]
+            (await client.post("/api/metrics/bulk", json=batch)).raise_for_status()
+        _report("bulk upsert per round", args.rounds * args.metrics, time.perf_counter() - started)
+
+        get_settings().metric_write_behind_seconds = 3600.0  # flushed explicitly below
+        buffer = get_metric_buffer()
+
+        async def sender(offset: int) -> None:
+            for round_no in range(args.rounds):
+                batch = [{"name": f"job.metric.{i}", "value": round_no + offset} for i in range(args.metrics)]
+                resp = await client.post("/api/metrics/bulk", json=batch)
+                resp.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(sender(offset) for offset in range(args.senders)))
+        queued = time.perf_counter() - started
+        flush_started = time.perf_counter()
+        written = await asyncio.to_thread(buffer.flush)
+        flushed = time.perf_counter() - flush_started
+        _report("write-behind (incl. flush)", args.rounds * args.metrics * args.senders, queued + flushed)
+        print(f"{'':<28} {written} rows written by one flush in {flushed * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metrics", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=40)
+    parser.add_argument("--senders", type=int, default=8)
+    args = parser.parse_args()
+
+    configure_database()
+    os.environ["METRIC_ROLLUP_INTERVAL_SECONDS"] = "0"
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.metrics)
+    asyncio.run(_run(create_app(), args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Metric time series: ingest rate, rollup time and range-read latency.
+
+1. Seeds ``--points`` raw samples spread over ``--metrics`` metrics (one
+   sample every few seconds, ending now, within the raw retention) and times
+   the rollup of all dirty hours into 1m/1h/1d buckets.
+2. Ingests ``--ingest`` samples into a fresh metric in ``--batch``-sized
+   ``record_points`` transactions and reports samples per second.
+3. Reads windows from one hour to thirty days with ``points=300`` through
+   ``/api/metrics/{id}/series`` and compares with bucketing the raw samples
+   with ``GROUP BY`` at the same bucket width.
+
+    python -m benchmarks.metric_series --metrics 200 --points 100000000   # the 100M case
+    python -m benchmarks.metric_series --metrics 20 --points 2000000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+WINDOWS = {"1h": 3600, "6h": 6 * 3600, "1d": 86400, "7d": 7 * 86400, "30d": 30 * 86400}
+
+
+def _seed(args: argparse.Namespace, now: int) -> None:
+    from sqlalchemy import insert, text
+
+    from app.core.config import get_settings
+    from app.db.models import Metric
+    from app.db.session import engine
+
+    per_metric = args.points // args.metrics
+    step = max(1, get_settings().metric_raw_retention_days * 86400 // per_metric - 1)
+    first = now - (per_metric - 1) * step
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(insert(Metric), [{"name": f"Metrik {i}", "value": 0.0} for i in range(args.metrics + 1)])
+        for metric_id in range(1, args.metrics + 1):
+            conn.execute(
+                text(
+                    "INSERT INTO metric_points (metric_id, ts, value) "
+                    "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i < :n - 1) "
+                    "SELECT :metric_id, :first + i * :step, abs(random() % 10000) / 10.0 FROM seq"
+                ),
+                {"n": per_metric, "metric_id": metric_id, "first": first, "step": step},
+            )
+        conn.execute(
+            text("INSERT INTO metric_dirty_hours (metric_id, hour) SELECT DISTINCT metric_id, ts - ts % 3600 FROM metric_points")
+        )
+    print(f"seeded {per_metric * args.metrics} samples ({args.metrics} metrics, every {step} s) in {time.perf_counter() - started:.1f} s")
+
+
+def _rollups() -> None:
+    from app.db.metric_series import run_rollups
+    from app.db.session import engine
+
+    started = time.perf_counter()
+    hours = run_rollups(engine)
+    print(f"rollup of {hours} metric hours   {time.perf_counter() - started:8.1f} s")
+
+
+def _ingest(args: argparse.Namespace, now: int) -> None:
+    from app.db.metric_series import record_points
+    from app.db.session import engine
+
+    metric_id = args.metrics + 1
+    first = now - args.ingest
+    latencies = []
+    started = time.perf_counter()
+    for offset in range(0, args.ingest, args.batch):
+        batch = [(first + ts, float(ts % 97)) for ts in range(offset, min(offset + args.batch, args.ingest))]
+        batch_started = time.perf_counter()
+        with engine.begin() as conn:
+            record_points(conn, metric_id, batch)
+        latencies.append(time.perf_counter() - batch_started)
+    elapsed = time.perf_counter() - started
+    print(
+        f"ingest {args.ingest} samples     {args.ingest / elapsed:10.0f} samples/s  "
+        f"batch of {args.batch} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}"
+    )
+
+
+def _raw_group_by(width: int, start: int, end: int) -> float:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+
+    bucket = max(60, -(-(end - start) // 300))
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(
+            text(
+                "SELECT ts - ts % :bucket AS bucket, min(value), max(value), avg(value), count(*) FROM metric_points "
+                "WHERE metric_id = 1 AND ts >= :start AND ts < :end GROUP BY bucket ORDER BY bucket"
+            ),
+            {"bucket": bucket, "start": start, "end": end},
+        ).all()
+    return time.perf_counter() - started
+
+
+async def _reads(app, args: argparse.Namespace, now: int) -> None:
+    from datetime import datetime, timezone
+
+    import httpx
+
+    def iso(ts: int) -> str:
+        return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, width in WINDOWS.items():
+            params = {"start": iso(now - width), "end": iso(now), "points": 300}
+            latencies, resolution, count = [], "", 0
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                resp = await client.get("/api/metrics/1/series", params=params)
+                latencies.append(time.perf_counter() - started)
+                resp.raise_for_status()
+                body = resp.json()
+                resolution, count = body["resolution"], len(body["points"])
+            baseline = [await asyncio.to_thread(_raw_group_by, width, now - width, now) for _ in range(min(args.rounds, 5))]
+            print(
+                f"window {name:>3}  series p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))} "
+                f"({resolution:>3}, {count:>3} points)   raw GROUP BY p50={format_ms(percentile(baseline, 50))}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metrics", type=int, default=20)
+    parser.add_argument("--points", type=int, default=2_000_000)
+    parser.add_argument("--ingest", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    configure_database()
+    os.environ["METRIC_ROLLUP_INTERVAL_SECONDS"] = "0"  # rollups are timed explicitly
+    from app.main import create_app
+
+    create_schema()
+    now = int(time.time())
+    _seed(args, now)
+    _rollups()
+    _ingest(args, now)
+    asyncio.run(_reads(create_app(), args, now))
+
+
+if __name__ == "__main__":
+    main()
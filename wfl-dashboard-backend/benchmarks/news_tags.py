@@ -0,0 +1,96 @@
+"""Tag-filtered news listing: Python filtering versus the ``news_tags`` index.
+
+Seeds news rows whose tags follow a skewed distribution and asks for the
+newest ``--limit`` entries of a common and a rare tag. The legacy path loads
+every news row newest first and filters ``tag in item.tags`` in Python; the
+indexed path issues the statement ``GET /api/news?tag=...&limit=...`` runs.
+
+    python -m benchmarks.news_tags --rows 100000 --limit 5
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchmarks.common import format_ms, percentile
+
+TAGS = {"allgemein": 0.4, "kultur": 0.2, "jugend": 0.1, "musik": 0.05, "archiv": 0.005}
+
+
+def _measure(run, repeats: int) -> tuple[list[float], list[int]]:
+    latencies = []
+    ids: list[int] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        ids = run()
+        latencies.append(time.perf_counter() - started)
+    return latencies, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    from app.core.config import Settings
+    from app.db.base import Base
+    from app.db.models.news import News, NewsTag
+    from app.db.session import create_db_engine
+    from app.routes.news import NEWS_SORT, news_list_query
+
+    database_url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='wfl-bench-')) / 'news_tags.db'}"
+    engine = create_db_engine(database_url, Settings())
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(7)
+    epoch = datetime(2020, 1, 1)
+    news_rows, tag_rows = [], []
+    for news_id in range(1, args.rows + 1):
+        created_at = epoch + timedelta(minutes=news_id)
+        tags = [tag for tag, share in TAGS.items() if rng.random() < share]
+        news_rows.append(
+            {"id": news_id, "title": f"News {news_id}", "body": "x" * 200, "tags": tags, "author_id": 1, "created_at": created_at}
+        )
+        tag_rows.extend({"news_id": news_id, "tag": tag, "created_at": created_at} for tag in tags)
+    with Session(engine) as session:
+        # Core inserts bypass the flush hook, so the tag rows are written alongside
+        session.execute(insert(News), news_rows)
+        session.execute(insert(NewsTag), tag_rows)
+        session.commit()
+
+    legacy_query = select(News).order_by(*(key.order_by() for key in NEWS_SORT))
+    with Session(engine) as session:
+        for tag in ("kultur", "archiv"):
+
+            def legacy() -> list[int]:
+                session.expunge_all()
+                entries = [item for item in session.scalars(legacy_query) if item.tags and tag in item.tags]
+                return [item.id for item in entries[: args.limit]]
+
+            def indexed() -> list[int]:
+                session.expunge_all()
+                query, keys = news_list_query([tag], "any", None, None)
+                query = query.order_by(*(key.order_by() for key in keys)).limit(args.limit)
+                return [item.id for item in session.scalars(query)]
+
+            legacy_latencies, legacy_ids = _measure(legacy, args.repeats)
+            indexed_latencies, indexed_ids = _measure(indexed, args.repeats)
+            assert legacy_ids == indexed_ids
+            print(
+                f"tag={tag:<8} share={TAGS[tag]:5.3f}  "
+                f"python p50={format_ms(percentile(legacy_latencies, 50))} p99={format_ms(percentile(legacy_latencies, 99))}  "
+                f"indexed p50={format_ms(percentile(indexed_latencies, 50))} p99={format_ms(percentile(indexed_latencies, 99))}"
+            )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
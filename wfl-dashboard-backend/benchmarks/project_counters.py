@@ -0,0 +1,110 @@
+"""Cost of the project summary task counts: per-status COUNTs, one GROUP BY, counter lookup.
+
+Seeds ``--projects`` projects with ``--tasks`` tasks spread over them and
+measures, for random projects, the three ways of obtaining the counts.
+Also reports the write overhead of the counter hook on a task status update
+and how long ``python -m app.cli counters`` takes for all projects.
+
+    python -m benchmarks.project_counters --projects 10000 --tasks 1000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from benchmarks.common import format_ms, percentile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--samples", type=int, default=500)
+    args = parser.parse_args()
+
+    from sqlalchemy import func, insert, select
+    from sqlalchemy.orm import Session
+
+    from app.core.config import Settings, get_settings
+    from app.db.base import Base
+    from app.db.counters import compute_counts, load_project_counts, refresh_project_counters
+    from app.db.models import Project, Task, User
+    from app.db.session import create_db_engine
+
+    database_url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='wfl-bench-')) / 'counters.db'}"
+    engine = create_db_engine(database_url, Settings())
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(3)
+    today = date.today()
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Project), [{"title": f"Projekt {i}", "status": "green"} for i in range(args.projects)])
+        batch = 50_000
+        for offset in range(0, args.tasks, batch):
+            conn.execute(
+                insert(Task),
+                [
+                    {
+                        "title": "Aufgabe",
+                        "project_id": rng.randint(1, args.projects),
+                        "status": rng.choice(("open", "in_progress", "done")),
+                        "due_date": today + timedelta(days=rng.randint(-60, 60)),
+                        "created_by": 1,
+                    }
+                    for _ in range(min(batch, args.tasks - offset))
+                ],
+            )
+    print(f"seeded {args.projects} projects / {args.tasks} tasks in {time.perf_counter() - started:.1f} s")
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        refresh_project_counters(conn)
+    print(f"counters rebuild (all projects)   {format_ms(time.perf_counter() - started)}")
+
+    sample = [rng.randint(1, args.projects) for _ in range(args.samples)]
+    settings = get_settings()
+
+    def per_status(session: Session, project_id: int) -> None:
+        for status in ("open", "in_progress", "done"):
+            session.scalar(select(func.count(Task.id)).where(Task.project_id == project_id, Task.status == status))
+
+    def grouped(session: Session, project_id: int) -> None:
+        compute_counts(session.connection(), [project_id], today)
+
+    def counters(session: Session, project_id: int) -> None:
+        load_project_counts(session, project_id)
+
+    with Session(engine) as session:
+        for label, run in (("per-status COUNT x3", per_status), ("GROUP BY", grouped), ("counter lookup", counters)):
+            settings.project_counters_enabled = label == "counter lookup"
+            latencies = []
+            for project_id in sample:
+                begun = time.perf_counter()
+                run(session, project_id)
+                latencies.append(time.perf_counter() - begun)
+            session.rollback()
+            print(f"{label:<20} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}")
+
+        for enabled in (False, True):
+            settings.project_counters_enabled = enabled
+            latencies = []
+            for project_id in sample[:100]:
+                task = session.scalars(select(Task).where(Task.project_id == project_id).limit(1)).first()
+                if task is None:
+                    continue
+                begun = time.perf_counter()
+                task.status = "done" if task.status != "done" else "open"
+                session.commit()
+                latencies.append(time.perf_counter() - begun)
+            label = "task update +hook" if enabled else "task update"
+            print(f"{label:<20} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
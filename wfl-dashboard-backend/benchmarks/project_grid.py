@@ -0,0 +1,121 @@
+"""Project overview grid: one summary request per card versus one batch request.
+
+Seeds ``--projects`` projects with tasks, upcoming events and news, then
+loads a grid of ``--cards`` projects both ways and reports wall time and the
+number of SQL statements per grid.
+
+    python -m benchmarks.project_grid --projects 2000 --cards 24 --rounds 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+
+def _seed(projects: int, per_project: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Event, News, Project, Room, Task, User
+    from app.db.session import engine
+
+    rng = random.Random(5)
+    start = datetime.utcnow() + timedelta(days=1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": "Saal"}])
+        conn.execute(insert(Project), [{"title": f"Projekt {i}", "status": "green"} for i in range(projects)])
+        ids = range(1, projects + 1)
+        conn.execute(
+            insert(Task),
+            [
+                {"title": "Aufgabe", "project_id": pid, "status": rng.choice(("open", "in_progress", "done")), "created_by": 1}
+                for pid in ids
+                for _ in range(per_project)
+            ],
+        )
+        conn.execute(
+            insert(News),
+            [{"title": "News", "body": "...", "project_id": pid, "author_id": 1} for pid in ids for _ in range(per_project)],
+        )
+        conn.execute(
+            insert(Event),
+            [
+                {
+                    "title": "Termin",
+                    "start": start + timedelta(hours=i),
+                    "end": start + timedelta(hours=i + 1),
+                    "room_id": 1,
+                    "project_id": pid,
+                    "created_by": 1,
+                }
+                for pid in ids
+                for i in range(per_project)
+            ],
+        )
+
+
+async def _run(app, args: argparse.Namespace) -> None:
+    import httpx
+    from sqlalchemy import event
+
+    from app.db.session import engine
+
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    rng = random.Random(7)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def per_card(ids: list[int]) -> None:
+            responses = await asyncio.gather(*(client.get(f"/api/projects/{pid}/summary") for pid in ids))
+            for resp in responses:
+                resp.raise_for_status()
+
+        async def batch(ids: list[int]) -> None:
+            resp = await client.get("/api/projects/summaries", params={"ids": ",".join(map(str, ids))})
+            resp.raise_for_status()
+
+        for label, load in (("per-card summaries", per_card), ("batch summaries", batch)):
+            await load(list(range(1, args.cards + 1)))
+            statements = 0
+            latencies = []
+            event.listen(engine, "before_cursor_execute", _count)
+            for _ in range(args.rounds):
+                ids = rng.sample(range(1, args.projects + 1), args.cards)
+                begun = time.perf_counter()
+                await load(ids)
+                latencies.append(time.perf_counter() - begun)
+            event.remove(engine, "before_cursor_execute", _count)
+            print(
+                f"{label:<20} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}  "
+                f"statements/grid={statements / args.rounds:.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--cards", type=int, default=24)
+    parser.add_argument("--per-project", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.projects, args.per_project)
+    app = create_app()
+    asyncio.run(_run(app, args))
+
+
+if __name__ == "__main__":
+    main()
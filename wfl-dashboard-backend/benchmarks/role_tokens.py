@@ -0,0 +1,99 @@
+"""Requests/sec on a role-gated endpoint with subject-only versus role-claim tokens.
+
+Modes:
+  subject        legacy token, principal cache disabled (one user query per request)
+  subject+cache  legacy token, principal cache enabled
+  claims         token carrying uid/role/ver, authorized without the users table
+
+    python -m benchmarks.role_tokens --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import configure_database, create_schema
+
+PASSWORD = "benchmark-password"
+EMAIL = "bench@example.com"
+ENDPOINT = "/api/status/caches"
+
+
+def _seed_admin() -> None:
+    from app.core.security import get_password_hash
+    from app.db.models.user import User
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.add(User(name="Bench", email=EMAIL, password_hash=get_password_hash(PASSWORD), role="admin"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _run_mode(app, label: str, args: argparse.Namespace) -> None:
+    import httpx
+    from sqlalchemy import event
+
+    from app.core import principals
+    from app.core.config import get_settings
+    from app.db.session import engine
+
+    settings = get_settings()
+    settings.token_role_claims = label == "claims"
+    settings.principal_cache_size = 0 if label == "subject" else 1024
+    principals._principal_cache = None
+    principals._token_version_cache = None
+
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        resp = await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+        await client.get(ENDPOINT, headers=headers)
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def call() -> None:
+            async with semaphore:
+                resp = await client.get(ENDPOINT, headers=headers)
+                resp.raise_for_status()
+
+        event.listen(engine, "before_cursor_execute", _count)
+        started = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", _count)
+
+    print(f"{label:<14} req/s={args.requests / elapsed:8.1f}  db statements/request={statements / args.requests:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed_admin()
+    app = create_app()
+
+    for label in ("subject", "subject+cache", "claims"):
+        asyncio.run(_run_mode(app, label, args))
+
+    from app.core.security import shutdown_password_hasher_pool
+
+    shutdown_password_hasher_pool()
+
+
+if __name__ == "__main__":
+    main()
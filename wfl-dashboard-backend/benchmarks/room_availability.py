@@ -0,0 +1,155 @@
+"""Booking conflict checks and room availability over a large event history.
+
+1. Seeds ``--rooms`` rooms with ``--events`` events in total: back-to-back
+   slots of one to three hours per room, most of them in the past, about a
+   tenth in the future.
+2. Times ``POST /api/events`` for free slots (the overlap check runs inside
+   the write) and for conflicting slots (409). It also times the overlap
+   query on ``ix_events_room_end_start`` against the same query forced onto
+   ``ix_events_room_start``.
+3. Times ``GET /api/rooms/availability`` for windows from one day to a
+   month. It also times its core (one query for all rooms plus the sweep)
+   against one query per room plus the same sweep.
+
+    python -m benchmarks.room_availability --rooms 50 --events 500000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+EMAIL = "bench-rooms@example.com"
+SLOT_HOURS = 4
+WINDOWS = {"1d": 1, "7d": 7, "30d": 30}
+
+
+def _seed(args: argparse.Namespace, now: datetime) -> tuple[datetime, datetime]:
+    """Return the start of the first future slot and the end of the seeded range."""
+
+    from sqlalchemy import insert, text
+
+    from app.db.models import Room, User
+    from app.db.session import engine
+
+    per_room = args.events // args.rooms
+    first = now - timedelta(hours=SLOT_HOURS * per_room * 9 // 10)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": EMAIL, "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": f"Raum {i}", "capacity": 10 + (i * 37) % 190} for i in range(args.rooms)])
+        conn.execute(
+            text(
+                "INSERT INTO events (title, start, \"end\", room_id, is_public, created_by) "
+                "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i < :n - 1) "
+                "SELECT 'Termin', "
+                "datetime(:first, '+' || ((i / :rooms) * :slot) || ' hours'), "
+                "datetime(:first, '+' || ((i / :rooms) * :slot + 1 + i % 3) || ' hours'), "
+                "i % :rooms + 1, 0, 1 FROM seq"
+            ),
+            {"n": per_room * args.rooms, "rooms": args.rooms, "slot": SLOT_HOURS, "first": first.strftime("%Y-%m-%d %H:00:00")},
+        )
+    print(f"seeded {per_room * args.rooms} events in {args.rooms} rooms in {time.perf_counter() - started:.1f} s")
+    past = per_room * 9 // 10
+    return first + timedelta(hours=SLOT_HOURS * (past + 1)), first + timedelta(hours=SLOT_HOURS * per_room)
+
+
+def _overlap_query(index: str, room_id: int, start: datetime, end: datetime) -> float:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(
+            text(f'SELECT id FROM events INDEXED BY {index} WHERE room_id = :room AND "end" > :start AND start < :end LIMIT 5'),
+            {"room": room_id, "start": start.strftime("%Y-%m-%d %H:%M:%S"), "end": end.strftime("%Y-%m-%d %H:%M:%S")},
+        ).all()
+    return time.perf_counter() - started
+
+
+def _sweep(room_ids: list[int], start: datetime, end: datetime, per_room: bool) -> float:
+    from app.db.room_bookings import bookings_query, free_slots
+    from app.db.session import engine
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        if per_room:
+            bookings = [row for room_id in room_ids for row in conn.execute(bookings_query([room_id], start, end))]
+        else:
+            bookings = conn.execute(bookings_query(room_ids, start, end)).all()
+    free_slots(room_ids, bookings, start, end)
+    return time.perf_counter() - started
+
+
+async def _run(app, args: argparse.Namespace, now: datetime, booked: datetime, horizon: datetime) -> None:
+    import httpx
+
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(EMAIL)}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, base, expected in (("free slot", horizon, 201), ("conflict", booked, 409)):
+            latencies = []
+            for index in range(args.rounds):
+                start = base + timedelta(hours=SLOT_HOURS * index)
+                payload = {
+                    "title": "Neu",
+                    "start": start.isoformat(),
+                    "end": (start + timedelta(hours=1)).isoformat(),
+                    "room_id": index % args.rooms + 1,
+                }
+                started = time.perf_counter()
+                resp = await client.post("/api/events", json=payload, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                assert resp.status_code == expected, resp.text
+            print(f"POST /api/events  {label:<10} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}")
+
+        check = now + timedelta(days=3)
+        for index in ("ix_events_room_end_start", "ix_events_room_start"):
+            latencies = [await asyncio.to_thread(_overlap_query, index, 1, check, check + timedelta(hours=1)) for _ in range(args.rounds)]
+            print(f"overlap query via {index:<25} p50={format_ms(percentile(latencies, 50))}")
+
+        room_ids = list(range(1, args.rooms + 1))
+        for name, days in WINDOWS.items():
+            start = now.replace(minute=0, second=0, microsecond=0)
+            params = {"from": start.isoformat(), "to": (start + timedelta(days=days)).isoformat()}
+            latencies, slots = [], 0
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                resp = await client.get("/api/rooms/availability", params=params)
+                latencies.append(time.perf_counter() - started)
+                resp.raise_for_status()
+                slots = sum(len(room["free"]) for room in resp.json())
+            cores = {
+                per_room: [await asyncio.to_thread(_sweep, room_ids, start, start + timedelta(days=days), per_room) for _ in range(10)]
+                for per_room in (False, True)
+            }
+            print(
+                f"availability {name:>3}  endpoint p50={format_ms(percentile(latencies, 50))} ({slots} free slots)  "
+                f"one query+sweep p50={format_ms(percentile(cores[False], 50))}  "
+                f"per-room queries+sweep p50={format_ms(percentile(cores[True], 50))}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--events", type=int, default=500_000)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    booked, horizon = _seed(args, now)
+    asyncio.run(_run(create_app(), args, now, booked, horizon))
+
+
+if __name__ == "__main__":
+    main()
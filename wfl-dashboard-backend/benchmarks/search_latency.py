@@ -0,0 +1,107 @@
+"""FTS5 search latency at a large number of indexed documents.
+
+Loads synthetic news and tasks (the insert triggers fill the index), then
+issues the statement ``GET /api/search`` runs for common, rare, prefix and
+multi-word queries and reports first-page latency percentiles.
+
+    python -m benchmarks.search_latency --documents 1000000 --page-size 20
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from itertools import accumulate
+from pathlib import Path
+
+from benchmarks.common import format_ms, percentile
+
+SYLLABLES = ["ge", "mein", "de", "chor", "or", "gel", "ju", "gend", "kon", "zert", "saal", "fest", "bau", "plan", "kul", "tur"]
+VOCABULARY_SIZE = 20_000
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    words: dict[str, None] = {}
+    while len(words) < VOCABULARY_SIZE:
+        words["".join(rng.choices(SYLLABLES, k=rng.randint(2, 5)))] = None
+    return list(words)
+
+
+def _queries(vocabulary: list[str]) -> dict[str, tuple[str, bool]]:
+    """Query label -> (text, news only); words are picked by Zipf rank."""
+
+    return {
+        "common": (vocabulary[5], False),
+        "mid": (vocabulary[500], False),
+        "rare": (vocabulary[15_000], False),
+        "prefix": (vocabulary[800][:3], False),
+        "two words": (f"{vocabulary[50]} {vocabulary[700]}", False),
+        "typed": (vocabulary[500], True),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert, text
+
+    from app.core.config import Settings
+    from app.db.base import Base
+    from app.db.models.news import News
+    from app.db.models.task import Task
+    from app.db.search import KIND_CODES, ROWID_STRIDE, SEARCH_TABLE, match_expression
+    from app.db.session import create_db_engine
+
+    database_url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='wfl-bench-')) / 'search.db'}"
+    engine = create_db_engine(database_url, Settings())
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(11)
+    vocabulary = _vocabulary(rng)
+    # Zipf-like word frequencies, as in natural language
+    weights = list(accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+
+    def words(count: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=weights, k=count))
+
+    started = time.perf_counter()
+    batch = 20_000
+    with engine.begin() as conn:
+        for offset in range(0, args.documents, batch):
+            size = min(batch, args.documents - offset)
+            news = [{"title": words(4), "body": words(40), "author_id": 1} for _ in range(size // 2)]
+            tasks = [{"title": words(4), "description": words(20), "created_by": 1} for _ in range(size - size // 2)]
+            conn.execute(insert(News), news)
+            conn.execute(insert(Task), tasks)
+        conn.exec_driver_sql(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    print(f"indexed {args.documents} documents in {time.perf_counter() - started:.1f} s")
+
+    with engine.connect() as conn:
+        for label, (query, news_only) in _queries(vocabulary).items():
+            kinds = f" AND rowid % {ROWID_STRIDE} = {KIND_CODES['news']}" if news_only else ""
+            statement = text(
+                f"SELECT rowid, rank, title, snippet({SEARCH_TABLE}, 1, '[', ']', '…', 16) FROM {SEARCH_TABLE} "
+                f"WHERE {SEARCH_TABLE} MATCH :match{kinds} ORDER BY rank, rowid LIMIT :limit"
+            )
+            params = {"match": match_expression(query), "limit": args.page_size + 1}
+            matches = conn.execute(
+                text(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match{kinds}"), params
+            ).scalar()
+            latencies = []
+            for _ in range(args.repeats):
+                started = time.perf_counter()
+                conn.execute(statement, params).all()
+                latencies.append(time.perf_counter() - started)
+            print(
+                f"{label:<10} q={query!r:<28} matches={matches:8d}  "
+                f"p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}"
+            )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Serialization time per 10k ORM rows: response_model pass versus json_response.
+
+Loads ``--rows`` tasks and events once, then serves them from two throwaway
+routes, so database time is excluded:
+
+  response_model  handler returns ``[XRead.model_validate(row) ...]``; FastAPI validates and encodes again
+  json_response   one TypeAdapter validation, encoded by pydantic-core
+
+    python -m benchmarks.serialization --rows 10000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+
+def _load_rows(count: int) -> dict[str, list]:
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    from app.db.models import Event, Room, Task, User
+    from app.db.session import engine
+
+    start = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": "Saal"}])
+        conn.execute(
+            insert(Task),
+            [
+                {"title": f"Aufgabe {i}", "description": "Bitte bis Freitag erledigen.", "due_date": start.date(), "created_by": 1}
+                for i in range(count)
+            ],
+        )
+        conn.execute(
+            insert(Event),
+            [
+                {"title": f"Termin {i}", "start": start + timedelta(hours=i), "end": start + timedelta(hours=i + 1), "room_id": 1, "created_by": 1}
+                for i in range(count)
+            ],
+        )
+    session = Session(engine, expire_on_commit=False)
+    return {"tasks": session.scalars(select(Task)).all(), "events": session.scalars(select(Event)).all()}
+
+
+def _build_app(rows: dict[str, list]):
+    from fastapi import FastAPI, Response
+
+    from app.core.serialization import json_response
+    from app.schemas.event import EventRead
+    from app.schemas.task import TaskRead
+
+    app = FastAPI()
+    schemas = {"tasks": TaskRead, "events": EventRead}
+    for name, schema in schemas.items():
+
+        @app.get(f"/response_model/{name}", response_model=list[schema])
+        async def validated(schema=schema, name=name):
+            return [schema.model_validate(row) for row in rows[name]]
+
+        @app.get(f"/json_response/{name}", response_model=list[schema])
+        async def fast(response: Response, schema=schema, name=name):
+            return json_response(list[schema], rows[name], response)
+
+    return app
+
+
+async def _run(app, args: argparse.Namespace) -> None:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in ("tasks", "events"):
+            for mode in ("response_model", "json_response"):
+                url = f"/{mode}/{name}"
+                (await client.get(url)).raise_for_status()
+                latencies = []
+                for _ in range(args.rounds):
+                    begun = time.perf_counter()
+                    resp = await client.get(url)
+                    latencies.append(time.perf_counter() - begun)
+                    resp.raise_for_status()
+                per_10k = 10_000 / args.rows
+                print(
+                    f"{name:<7} {mode:<15} p50={format_ms(percentile(latencies, 50) * per_10k)} "
+                    f"p99={format_ms(percentile(latencies, 99) * per_10k)} per 10k rows"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_database()
+    create_schema()
+    rows = _load_rows(args.rows)
+    asyncio.run(_run(_build_app(rows), args))
+
+
+if __name__ == "__main__":
+    main()
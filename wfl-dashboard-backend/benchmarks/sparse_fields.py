@@ -0,0 +1,92 @@
+"""Payload size and latency of list pages with and without ``?fields=``.
+
+Seeds news, events and tasks with realistic body/description lengths and
+requests a page of each in full and with the fields a dashboard widget
+needs (id, title and a date).
+
+    python -m benchmarks.sparse_fields --rows 20000 --page-size 500 --rounds 30
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+WIDGET_FIELDS = {
+    "/api/news": "title,created_at",
+    "/api/events": "title,start",
+    "/api/tasks": "title,due_date",
+}
+
+
+def _seed(rows: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Event, News, Room, Task, User
+    from app.db.session import engine
+
+    body = "Liebe Gemeinde, hier die Neuigkeiten aus dem Arbeitskreis. " * 20
+    description = "Bitte Stühle stellen, Technik prüfen und den Schlüssel abholen. " * 5
+    start = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": "Saal"}])
+        conn.execute(
+            insert(News),
+            [{"title": f"News {i}", "body": body, "tags": ["gemeinde"], "author_id": 1, "created_at": start + timedelta(minutes=i)} for i in range(rows)],
+        )
+        conn.execute(
+            insert(Event),
+            [
+                {"title": f"Termin {i}", "description": description, "start": start + timedelta(hours=i), "end": start + timedelta(hours=i + 1), "room_id": 1, "created_by": 1}
+                for i in range(rows)
+            ],
+        )
+        conn.execute(
+            insert(Task),
+            [{"title": f"Aufgabe {i}", "description": description, "due_date": (start + timedelta(days=i % 365)).date(), "created_by": 1} for i in range(rows)],
+        )
+
+
+async def _run(app, args: argparse.Namespace) -> None:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path, fields in WIDGET_FIELDS.items():
+            for label, params in (("full", {}), (f"fields={fields}", {"fields": fields})):
+                params = {"limit": args.page_size, **params}
+                (await client.get(path, params=params)).raise_for_status()
+                latencies = []
+                size = 0
+                for _ in range(args.rounds):
+                    begun = time.perf_counter()
+                    resp = await client.get(path, params=params)
+                    latencies.append(time.perf_counter() - begun)
+                    resp.raise_for_status()
+                    size = len(resp.content)
+                print(
+                    f"{path:<12} {label:<28} bytes={size:>8}  p50={format_ms(percentile(latencies, 50))} "
+                    f"p99={format_ms(percentile(latencies, 99))}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.rows)
+    asyncio.run(_run(create_app(), args))
+
+
+if __name__ == "__main__":
+    main()
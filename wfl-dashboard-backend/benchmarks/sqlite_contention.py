@@ -0,0 +1,110 @@
+"""Mixed read/write contention on SQLite with and without the performance profile.
+
+Reader threads run the dashboard's recent-projects query while writer threads
+insert and commit projects. Reported per run: operations, lock errors
+(``database is locked``) and read/write latency percentiles.
+
+    python -m benchmarks.sqlite_contention --readers 8 --writers 2 --seconds 5
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import format_ms, percentile
+
+
+def _run(database_url: str, profile: bool, args: argparse.Namespace) -> None:
+    from sqlalchemy import event, select
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import Settings
+    from app.db.base import Base
+    from app.db.models.project import Project
+    from app.db.session import create_db_engine
+
+    settings = Settings(
+        sqlite_profile_enabled=profile,
+        sqlite_busy_timeout_ms=args.busy_timeout_ms,
+        db_pool_size=args.readers + args.writers,
+    )
+    engine = create_db_engine(database_url, settings)
+    if not profile:
+        # Keep the busy timeout equal so only the journal mode and remaining pragmas differ
+        @event.listens_for(engine, "connect")
+        def _busy_timeout(dbapi_connection, _record) -> None:
+            dbapi_connection.execute(f"PRAGMA busy_timeout={args.busy_timeout_ms}")
+
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    deadline = time.perf_counter() + args.seconds
+    lock = threading.Lock()
+    read_latencies: list[float] = []
+    write_latencies: list[float] = []
+    errors = {"read": 0, "write": 0}
+
+    def reader() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with Session() as db:
+                    db.scalars(select(Project).order_by(Project.created_at.desc()).limit(10)).all()
+            except OperationalError:
+                with lock:
+                    errors["read"] += 1
+                continue
+            with lock:
+                read_latencies.append(time.perf_counter() - started)
+
+    def writer() -> None:
+        counter = 0
+        while time.perf_counter() < deadline:
+            counter += 1
+            started = time.perf_counter()
+            try:
+                with Session() as db:
+                    db.add(Project(title=f"bench-{threading.get_ident()}-{counter}", description="x" * 200))
+                    db.commit()
+            except OperationalError:
+                with lock:
+                    errors["write"] += 1
+                continue
+            with lock:
+                write_latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+    threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    label = "profile" if profile else "default"
+    print(
+        f"{label:<8} reads={len(read_latencies):6d} writes={len(write_latencies):6d} "
+        f"lock errors r/w={errors['read']}/{errors['write']}  "
+        f"read p50={format_ms(percentile(read_latencies, 50))} p99={format_ms(percentile(read_latencies, 99))}  "
+        f"write p50={format_ms(percentile(write_latencies, 50))} p99={format_ms(percentile(write_latencies, 99))}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--busy-timeout-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="wfl-bench-"))
+    for profile in (False, True):
+        _run(f"sqlite:///{workdir / f'contention-{int(profile)}.db'}", profile, args)
+
+
+if __name__ == "__main__":
+    main()
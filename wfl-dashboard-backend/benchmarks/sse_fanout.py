@@ -0,0 +1,197 @@
+"""Fan-out of ``/api/stream`` to thousands of idle SSE subscribers.
+
+Opens ``--subscribers`` streams against the ASGI app in-process (no sockets,
+so the numbers show the app's own cost), then commits ``--writes`` projects
+one at a time. Reports connect time, memory per idle subscriber and, per
+write, the delay until the *last* subscriber received the event. With
+``--url`` the same run goes over real HTTP against a running server; raise
+``ulimit -n`` above the subscriber count first.
+
+    python -m benchmarks.sse_fanout --subscribers 5000 --writes 20
+    python -m benchmarks.sse_fanout --subscribers 5000 --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+MARKER = b"event: projects\n"
+
+
+class Tally:
+    """Arrival times per subscriber, and an event per write set once every subscriber received it."""
+
+    def __init__(self, writes: int) -> None:
+        self.arrivals: list[list[float]] = []
+        self.reached = [0] * writes
+        self.done = [asyncio.Event() for _ in range(writes)]
+
+    def add_subscriber(self) -> list[float]:
+        self.arrivals.append([])
+        return self.arrivals[-1]
+
+    def record(self, arrivals: list[float], chunk: bytes) -> None:
+        count = chunk.count(MARKER)
+        if not count:
+            return
+        now = time.perf_counter()
+        for index in range(len(arrivals), min(len(arrivals) + count, len(self.reached))):
+            arrivals.append(now)
+            self.reached[index] += 1
+            if self.reached[index] == len(self.arrivals):
+                self.done[index].set()
+
+
+def _scope(query: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/stream",
+        "raw_path": b"/api/stream",
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [],
+        "client": ("bench", 1),
+        "server": ("bench", 80),
+    }
+
+
+async def _asgi_subscriber(app, tally: Tally, ready: asyncio.Event, stop: asyncio.Event) -> None:
+    arrivals = tally.add_subscriber()
+    requested = False
+
+    async def receive() -> dict:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await stop.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        body = message.get("body", b"")
+        if b"event: ready" in body:
+            ready.set()
+        tally.record(arrivals, body)
+
+    await app(_scope("topics=projects"), receive, send)
+
+
+async def _http_subscriber(client, url: str, tally: Tally, ready: asyncio.Event, stop: asyncio.Event) -> None:
+    arrivals = tally.add_subscriber()
+    async with client.stream("GET", f"{url}/api/stream", params={"topics": "projects"}) as resp:
+        async for chunk in resp.aiter_bytes():
+            if b"event: ready" in chunk:
+                ready.set()
+            tally.record(arrivals, chunk)
+            if stop.is_set():
+                return
+
+
+async def _run(app, args: argparse.Namespace) -> None:
+    import httpx
+
+    from app.core.change_feed import get_change_feed
+    from app.db.models import Project
+    from app.db.session import SessionLocal
+
+    stop = asyncio.Event()
+    client = None
+    if args.url:
+        limits = httpx.Limits(max_connections=args.subscribers * 2 + 10, max_keepalive_connections=0)
+        client = httpx.AsyncClient(limits=limits, timeout=None)
+
+    tally = Tally(args.writes)
+
+    async def subscribe(count: int) -> list[asyncio.Task]:
+        readies = [asyncio.Event() for _ in range(count)]
+        if client is not None:
+            subscribers = (_http_subscriber(client, args.url, tally, ready, stop) for ready in readies)
+        else:
+            subscribers = (_asgi_subscriber(app, tally, ready, stop) for ready in readies)
+        tasks = [asyncio.create_task(subscriber) for subscriber in subscribers]
+        for ready in readies:
+            await ready.wait()
+        return tasks
+
+    started = time.perf_counter()
+    tasks = await subscribe(args.subscribers)
+    connect = time.perf_counter() - started
+
+    # Memory per idle subscriber from an extra, traced batch (tracing slows everything down)
+    sample = max(1, min(500, args.subscribers // 10))
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tasks += await subscribe(sample)
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - baseline) / sample
+    tracemalloc.stop()
+    print(
+        f"subscribers={len(tally.arrivals)}  connect {args.subscribers}={format_ms(connect)}  "
+        f"memory/idle subscriber={per_subscriber / 1024:6.1f} KiB"
+    )
+
+    def commit(index: int) -> float:
+        with SessionLocal() as db:
+            db.add(Project(title=f"Neu {index}", status="green"))
+            db.flush()
+            begun = time.perf_counter()
+            db.commit()
+            return begun
+
+    fanout = []
+    for index in range(args.writes):
+        if client is not None:
+            committed = time.perf_counter()
+            resp = await client.post(f"{args.url}/api/projects", json={"title": f"Neu {index}"}, headers={"Authorization": f"Bearer {args.token}"})
+            resp.raise_for_status()
+        else:
+            committed = await asyncio.to_thread(commit, index)
+        await tally.done[index].wait()
+        fanout.append(max(received[index] for received in tally.arrivals) - committed)
+        await asyncio.sleep(args.pause)
+
+    delivered = sum(len(received) for received in tally.arrivals)
+    print(
+        f"writes={args.writes}  events delivered={delivered}  commit to last subscriber p50={format_ms(percentile(fanout, 50))} "
+        f"p99={format_ms(percentile(fanout, 99))}"
+    )
+    if client is None:
+        print(f"feed: {get_change_feed().stats()}")
+
+    stop.set()
+    if client is not None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.aclose()
+    else:
+        await asyncio.gather(*tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--writes", type=int, default=20)
+    parser.add_argument("--pause", type=float, default=0.05, help="seconds between writes")
+    parser.add_argument("--url", help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--token", default="", help="bearer token for the writes with --url (admin or vorstand)")
+    args = parser.parse_args()
+
+    app = None
+    if not args.url:
+        configure_database()
+        from app.main import create_app
+
+        create_schema()
+        app = create_app()
+    asyncio.run(_run(app, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Requests/sec of the dashboard summary with and without the view cache.
+
+Modes:
+  uncached      cache disabled, three queries per request
+  cached        cache enabled, read-only traffic
+  cached+writes cache enabled while a writer commits a project every --write-interval-ms
+
+    python -m benchmarks.status_summary --requests 3000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import configure_database, create_schema
+
+ENDPOINT = "/api/status/summary"
+
+
+def _seed(rows: int) -> None:
+    from sqlalchemy import insert
+
+    from app.db.models import Event, News, Project, Room, User
+    from app.db.session import engine
+
+    start = datetime.utcnow() + timedelta(days=1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"name": "Bench", "email": "bench@example.com", "password_hash": "-", "role": "admin"}])
+        conn.execute(insert(Room), [{"name": "Saal"}])
+        conn.execute(insert(Project), [{"title": f"Projekt {i}", "status": "green"} for i in range(rows)])
+        conn.execute(insert(News), [{"title": f"News {i}", "body": "...", "author_id": 1} for i in range(rows)])
+        conn.execute(
+            insert(Event),
+            [
+                {"title": f"Termin {i}", "start": start + timedelta(hours=i), "end": start + timedelta(hours=i + 1), "room_id": 1, "created_by": 1}
+                for i in range(rows)
+            ],
+        )
+
+
+async def _run_mode(app, label: str, args: argparse.Namespace) -> None:
+    import httpx
+    from sqlalchemy import event
+
+    from app.core import view_cache
+    from app.core.config import get_settings
+    from app.db.models import Project
+    from app.db.session import SessionLocal, engine
+
+    get_settings().status_summary_cache_ttl_seconds = 0 if label == "uncached" else 30
+    view_cache._status_summary_cache = None
+
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    done = asyncio.Event()
+
+    async def writer() -> None:
+        counter = 0
+        while not done.is_set():
+            counter += 1
+
+            def commit() -> None:
+                with SessionLocal() as db:
+                    db.add(Project(title=f"Neu {counter}", status="green"))
+                    db.commit()
+
+            await asyncio.to_thread(commit)
+            await asyncio.sleep(args.write_interval_ms / 1000)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(ENDPOINT)
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def call() -> None:
+            async with semaphore:
+                resp = await client.get(ENDPOINT)
+                resp.raise_for_status()
+
+        writer_task = asyncio.create_task(writer()) if label == "cached+writes" else None
+        event.listen(engine, "before_cursor_execute", _count)
+        started = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", _count)
+        done.set()
+        if writer_task is not None:
+            await writer_task
+
+    stats = view_cache.get_status_summary_cache().stats()
+    print(
+        f"{label:<14} req/s={args.requests / elapsed:8.1f}  db statements/request={statements / args.requests:.2f}  "
+        f"hits={stats['hits']} misses={stats['misses']} coalesced={stats['coalesced']} invalidations={stats['invalidations']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--write-interval-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    configure_database()
+    from app.main import create_app
+
+    create_schema()
+    _seed(args.rows)
+    app = create_app()
+
+    for label in ("uncached", "cached", "cached+writes"):
+        asyncio.run(_run_mode(app, label, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Uptime windows over a long status history: daily rollups versus the raw history.
+
+1. Seeds ``--years`` of one service changing status every minute (ok and
+   warning alternating, ``down`` every 97th minute), ending now.
+2. Computes windows from one day to the full history from the raw
+   transitions only.
+3. Times the rollup of every complete day, then reads the same windows
+   through ``GET /api/system/status/{service}/uptime`` and checks that the
+   totals agree.
+
+    python -m benchmarks.status_uptime --years 10   # 5.3M transitions
+    python -m benchmarks.status_uptime --years 1 --rounds 50
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+SERVICE = "Benchmark"
+WINDOWS = {"1d": 86400, "7d": 7 * 86400, "30d": 30 * 86400, "1y": 365 * 86400}
+
+
+def _seed(args: argparse.Namespace, now: int) -> int:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+
+    minutes = args.years * 365 * 1440
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO system_status_history (service, status, ts) "
+                "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i < :n - 1) "
+                "SELECT :service, CASE WHEN i % 97 = 0 THEN 'down' WHEN i % 2 = 0 THEN 'ok' ELSE 'warning' END, "
+                ":first + i * 60 FROM seq"
+            ),
+            {"n": minutes, "service": SERVICE, "first": now - minutes * 60},
+        )
+    print(f"seeded {minutes} transitions ({args.years} years, one per minute) in {time.perf_counter() - started:.1f} s")
+    return minutes * 60
+
+
+def _from_history(windows: dict[str, int], now: int, rounds: int) -> dict[str, object]:
+    from app.db.session import engine
+    from app.db.status_history import compute_uptime
+
+    totals = {}
+    for name, width in windows.items():
+        latencies = []
+        for _ in range(rounds if width <= 30 * 86400 else 1):
+            started = time.perf_counter()
+            with engine.connect() as conn:
+                totals[name] = compute_uptime(conn, SERVICE, now - width, now)
+            latencies.append(time.perf_counter() - started)
+        print(f"window {name:>4}  history only  p50={format_ms(percentile(latencies, 50))}")
+    return totals
+
+
+def _rollups(now: int) -> None:
+    from app.db.session import engine
+    from app.db.status_history import run_status_rollups
+
+    started = time.perf_counter()
+    days = run_status_rollups(engine, now=now)
+    print(f"rollup of {days} service days   {time.perf_counter() - started:8.1f} s")
+
+
+async def _reads(app, windows: dict[str, int], expected: dict[str, object], now: int, rounds: int) -> None:
+    from datetime import datetime, timezone
+
+    import httpx
+
+    end = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, width in windows.items():
+            params = {"window": f"{width // 86400}d", "end": end}
+            latencies = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                resp = await client.get(f"/api/system/status/{SERVICE}/uptime", params=params)
+                latencies.append(time.perf_counter() - started)
+                resp.raise_for_status()
+            body = resp.json()
+            reference = expected[name]
+            agrees = (body["down_seconds"], body["incidents"], body["recoveries"]) == (
+                reference.down_seconds,
+                reference.incidents,
+                reference.recoveries,
+            )
+            print(
+                f"window {name:>4}  with rollups  p50={format_ms(percentile(latencies, 50))} "
+                f"p99={format_ms(percentile(latencies, 99))}  uptime={body['uptime_percent']:.3f}% "
+                f"incidents={body['incidents']} mttr={body['mttr_seconds']:.0f} s  {'matches' if agrees else 'MISMATCH'}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_database()
+    os.environ["STATUS_ROLLUP_INTERVAL_SECONDS"] = "0"  # rollups are timed explicitly
+    os.environ["METRIC_ROLLUP_INTERVAL_SECONDS"] = "0"
+    from app.main import create_app
+
+    create_schema()
+    now = int(time.time())
+    span = _seed(args, now)
+    windows = {**WINDOWS, f"{args.years}y": span}
+    expected = _from_history(windows, now, args.rounds)
+    _rollups(now)
+    asyncio.run(_reads(create_app(), windows, expected, now, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
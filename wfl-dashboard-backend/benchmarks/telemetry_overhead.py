@@ -0,0 +1,122 @@
+"""Recording overhead of the Prometheus telemetry on the hot path.
+
+1. Drives ``TelemetryMiddleware`` around a no-op ASGI app directly and
+   reports the added time per request.
+2. Runs ``SELECT 1`` on a plain and on an instrumented engine and reports
+   the added time per query.
+3. Times ``GET /api/status/health`` and ``GET /api/metrics?limit=50``
+   through apps built with telemetry off and on.
+
+Exits non-zero when one request with ``--queries`` queries costs more than
+``--budget-us`` microseconds of recording (50 µs by default).
+
+    python -m benchmarks.telemetry_overhead --requests 20000 --queries 3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks.common import configure_database, create_schema, format_ms, percentile
+
+
+async def _noop_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _drive(app, requests: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/bench/1"}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(_message) -> None:
+        return None
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def _middleware_cost(requests: int) -> float:
+    from app.core.telemetry import TelemetryMiddleware
+
+    plain = min(asyncio.run(_drive(_noop_app, requests)) for _ in range(3))
+    wrapped = min(asyncio.run(_drive(TelemetryMiddleware(_noop_app), requests)) for _ in range(3))
+    return wrapped - plain
+
+
+def _query_cost(url: str, queries: int) -> float:
+    from sqlalchemy import create_engine, text
+
+    from app.core.telemetry import instrument_engine
+
+    def run(engine) -> float:
+        with engine.connect() as conn:
+            statement = text("SELECT 1")
+            started = time.perf_counter()
+            for _ in range(queries):
+                conn.execute(statement).scalar()
+            return (time.perf_counter() - started) / queries
+
+    plain, instrumented = create_engine(url), create_engine(url)
+    instrument_engine(instrumented)
+    return min(run(instrumented) for _ in range(3)) - min(run(plain) for _ in range(3))
+
+
+async def _endpoints(args: argparse.Namespace) -> None:
+    import httpx
+
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    settings = get_settings()
+    for enabled in (False, True):
+        settings.telemetry_enabled = enabled
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in ("/api/status/health", "/api/metrics?limit=50"):
+                latencies = []
+                for _ in range(args.http_requests):
+                    started = time.perf_counter()
+                    (await client.get(path)).raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+                label = "on " if enabled else "off"
+                print(f"telemetry {label} {path:<24} p50={format_ms(percentile(latencies, 50))} p99={format_ms(percentile(latencies, 99))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=3, help="queries per request in the budget check")
+    parser.add_argument("--http-requests", type=int, default=2000)
+    parser.add_argument("--budget-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    url = configure_database()
+    create_schema()
+    from sqlalchemy import insert
+
+    from app.db.models import Metric
+    from app.db.session import engine
+
+    with engine.begin() as conn:
+        conn.execute(insert(Metric), [{"name": f"Metrik {i}", "value": float(i)} for i in range(200)])
+
+    per_request = _middleware_cost(args.requests) * 1e6
+    per_query = _query_cost(url, args.requests) * 1e6
+    total = per_request + args.queries * per_query
+    print(f"middleware per request   {per_request:6.2f} µs")
+    print(f"engine hooks per query   {per_query:6.2f} µs")
+    print(f"request with {args.queries} queries   {total:6.2f} µs  (budget {args.budget_us:g} µs)")
+    asyncio.run(_endpoints(args))
+    if total > args.budget_us:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
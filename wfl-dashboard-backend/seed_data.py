@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 sys.path.append(os.getcwd())
 
 from app.db.session import SessionLocal, engine
-from app.db import base
+from app.db.migrations import upgrade_database
 from app.db.models.user import User
 from app.db.models.project import Project
 from app.db.models.news import News
@@ -17,8 +17,8 @@ from app.db.models.system_status import SystemStatus
 from app.core.security import get_password_hash
 
 def seed():
-    # Ensure tables exist when running the seeder standalone (without FastAPI startup)
-    base.Base.metadata.create_all(bind=engine)
+    # Ensure the schema is current when running the seeder standalone (without FastAPI startup)
+    upgrade_database(engine)
 
     db = SessionLocal()
     
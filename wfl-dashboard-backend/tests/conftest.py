@@ -1,13 +1,17 @@
 """Shared pytest fixtures for API tests."""
 
+import asyncio
 import os
 import sys
-from collections.abc import Generator
+import threading
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 
 import bcrypt
@@ -19,36 +23,57 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from app.core import change_feed, metric_buffer, principals, telemetry, view_cache
 from app.core.config import get_settings
 from app.core.security import get_password_hash
 from app.db import session as db_session
 from app.db.base import Base
+from app.db.migrations import stamp_database
 from app.db.models import User
 from app.main import create_app
 
 
-@pytest.fixture(scope="session")
-def test_engine(tmp_path_factory: pytest.TempPathFactory):
-    """Create a dedicated SQLite database for tests."""
+class RecordedStatement(NamedTuple):
+    """One SQL statement run by the app and the name of the thread it ran on."""
+
+    sql: str
+    thread: str
+
+
+@pytest.fixture(scope="session", params=["sync", "async"])
+def test_engine(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory):
+    """Create a dedicated SQLite database for tests, once per session mode."""
 
-    db_file = tmp_path_factory.mktemp("data") / "test.db"
+    db_file = tmp_path_factory.mktemp(f"data-{request.param}") / "test.db"
     os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
     os.environ.setdefault("SECRET_KEY", "test-secret-key")
     get_settings.cache_clear()  # refresh settings after env overrides
 
-    engine = create_engine(
-        os.environ["DATABASE_URL"], connect_args={"check_same_thread": False}
-    )
+    engine = db_session.create_db_engine(os.environ["DATABASE_URL"])
     TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
     # Wire test engine into application session module
     db_session.SessionLocal = TestingSessionLocal
     db_session.engine = engine
+    db_session.AsyncSessionLocal = (
+        db_session.create_async_sessionmaker(os.environ["DATABASE_URL"]) if request.param == "async" else None
+    )
+    # Tokens are minted per mode; start each mode with empty auth caches
+    principals._principal_cache = None
+    principals._token_version_cache = None
+    view_cache._status_summary_cache = None
+    change_feed._change_feed = None
+    metric_buffer._metric_buffer = None
+    telemetry._telemetry = None
 
     Base.metadata.create_all(bind=engine)
+    stamp_database(engine)
 
     yield engine
 
+    if db_session.AsyncSessionLocal is not None:
+        asyncio.run(db_session.AsyncSessionLocal.kw["bind"].dispose())
+        db_session.AsyncSessionLocal = None
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
 
@@ -95,3 +120,37 @@ def admin_credentials(client, test_engine) -> dict[str, str]:
         session.close()
 
     return {"email": "admin@example.com", "password": ADMIN_PASSWORD}
+
+
+@pytest.fixture
+def auth_header(client: TestClient, admin_credentials: dict[str, str]) -> dict[str, str]:
+    """Return an Authorization header with a fresh admin bearer token."""
+
+    response = client.post(
+        "/api/auth/login", data={"username": admin_credentials["email"], "password": admin_credentials["password"]}
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def record_statements(test_engine) -> Callable[[], AbstractContextManager[list[RecordedStatement]]]:
+    """Return a context manager that collects the SQL statements the app runs, in either session mode."""
+
+    @contextmanager
+    def record() -> Iterator[list[RecordedStatement]]:
+        engine = db_session.engine
+        if db_session.AsyncSessionLocal is not None:
+            engine = db_session.AsyncSessionLocal.kw["bind"].sync_engine
+        statements: list[RecordedStatement] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(RecordedStatement(statement, threading.current_thread().name))
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return record
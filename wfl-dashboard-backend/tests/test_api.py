@@ -118,3 +118,36 @@ def test_full_domain_flow(client: TestClient, admin_credentials: dict[str, str])
     # Unauthorized access check: creating project without token should fail
     resp = client.post("/api/projects", json=project_payload)
     assert resp.status_code == 401
+
+
+def test_fast_json_responses_match_response_model_path(
+    client: TestClient, admin_credentials: dict[str, str], monkeypatch
+) -> None:
+    """List bodies, paging headers and the OpenAPI schema are the same with and without the fast path."""
+
+    from app.core.config import get_settings
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    for index in range(3):
+        client.post(
+            "/api/tasks",
+            json={"title": f"Serialisierung {index} – ä", "due_date": "2026-03-01"},
+            headers=auth_header,
+        )
+        client.post("/api/news", json={"title": "Ü", "body": "b", "tags": ["x"]}, headers=auth_header)
+
+    urls = ["/api/tasks", "/api/tasks?limit=2", "/api/news", "/api/projects", "/api/rooms", "/api/metrics"]
+    fast = {url: client.get(url, headers=auth_header) for url in urls}
+    fast_schema = client.get("/openapi.json").json()
+    monkeypatch.setattr(get_settings(), "fast_json_responses", False)
+    for url in urls:
+        slow = client.get(url, headers=auth_header)
+        assert fast[url].status_code == slow.status_code == 200
+        assert fast[url].content == slow.content, url
+        assert fast[url].headers.get("link") == slow.headers.get("link")
+        assert fast[url].headers["content-type"] == "application/json"
+    assert fast["/api/tasks?limit=2"].headers["x-next-cursor"]
+    assert client.get("/openapi.json").json() == fast_schema
+    list_tasks = fast_schema["paths"]["/api/tasks"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert list_tasks["items"] == {"$ref": "#/components/schemas/TaskRead"}
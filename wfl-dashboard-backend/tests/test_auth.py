@@ -0,0 +1,159 @@
+"""Tests for authentication and the password hashing pool."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import security
+
+
+@pytest.fixture
+def saturated_hasher_pool():
+    """Swap in a hashing pool that has no capacity left."""
+
+    original = security._hasher_pool
+    security._hasher_pool = security.PasswordHasherPool(workers=0, max_pending=0, retry_after=7)
+    try:
+        yield security._hasher_pool
+    finally:
+        security._hasher_pool = original
+
+
+def test_login_runs_bcrypt_on_process_pool(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """A successful login goes through the worker pool and leaves nothing pending."""
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": admin_credentials["password"]},
+    )
+    assert resp.status_code == 200, resp.text
+    pool = security.get_password_hasher_pool()
+    assert pool.workers > 0
+    assert pool.pending == 0
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": "wrong-password"},
+    )
+    assert resp.status_code == 401
+
+
+def test_login_returns_503_when_hasher_pool_is_full(
+    client: TestClient, admin_credentials: dict[str, str], saturated_hasher_pool
+) -> None:
+    """Saturated hashing capacity is surfaced as 503 with Retry-After."""
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": admin_credentials["password"]},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "7"
+
+
+def test_principal_cache_serves_repeat_requests_and_invalidates_on_update(
+    client: TestClient, admin_credentials: dict[str, str]
+) -> None:
+    """Repeated requests hit the cache; profile updates are visible immediately."""
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": admin_credentials["password"]},
+    )
+    auth_header = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    me = client.get("/api/users/me", headers=auth_header).json()
+    before = client.get("/api/status/caches", headers=auth_header).json()["principals"]
+    client.get("/api/users/me", headers=auth_header)
+    after = client.get("/api/status/caches", headers=auth_header).json()["principals"]
+    assert after["hits"] >= before["hits"] + 2
+    assert after["db_queries_saved"] == after["hits"]
+
+    resp = client.patch(f"/api/users/{me['id']}", json={"name": "Renamed Admin"}, headers=auth_header)
+    assert resp.status_code == 200, resp.text
+    assert client.get("/api/users/me", headers=auth_header).json()["name"] == "Renamed Admin"
+    client.patch(f"/api/users/{me['id']}", json={"name": me["name"]}, headers=auth_header)
+
+
+def test_role_gated_requests_with_cached_legacy_tokens_skip_decode(
+    client: TestClient, admin_credentials: dict[str, str], monkeypatch
+) -> None:
+    """Tokens without role claims are decoded once on a cache miss and not at all on a hit."""
+
+    from app import dependencies
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": admin_credentials["password"]},
+    )
+    auth_header = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    decodes: list[str] = []
+
+    def counting_decode(token: str) -> dict[str, str | int]:
+        decodes.append(token)
+        return security.decode_access_token(token)
+
+    monkeypatch.setattr(dependencies, "decode_access_token", counting_decode)
+    assert client.post("/api/projects", json={"title": "Decode 1"}, headers=auth_header).status_code == 201
+    assert len(decodes) == 1
+    assert client.post("/api/projects", json={"title": "Decode 2"}, headers=auth_header).status_code == 201
+    assert len(decodes) == 1
+
+
+@pytest.fixture
+def role_claim_tokens():
+    """Issue tokens that carry uid/role/version claims for the duration of a test."""
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    settings.token_role_claims = True
+    try:
+        yield
+    finally:
+        settings.token_role_claims = False
+
+
+def test_role_claim_tokens_skip_user_lookup_and_are_revoked_on_role_change(
+    client: TestClient, admin_credentials: dict[str, str], record_statements, role_claim_tokens
+) -> None:
+    """Role-gated routes authorize from claims; role changes and deletes revoke old tokens."""
+
+    from app.core.security import decode_access_token
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": admin_credentials["email"], "password": admin_credentials["password"]},
+    )
+    admin_header = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    resp = client.post(
+        "/api/auth/users",
+        json={"name": "Claims", "email": "claims@example.com", "password": "claims-pass-1", "role": "team"},
+        headers=admin_header,
+    )
+    assert resp.status_code == 201, resp.text
+    member = resp.json()
+
+    resp = client.post("/api/auth/login", data={"username": "claims@example.com", "password": "claims-pass-1"})
+    member_token = resp.json()["access_token"]
+    claims = decode_access_token(member_token)
+    assert (claims["uid"], claims["role"], claims["ver"]) == (member["id"], "team", 0)
+    member_header = {"Authorization": f"Bearer {member_token}"}
+
+    # Warm the version cache, then count user lookups on a role-gated write
+    client.post("/api/projects", json={"title": "Warmup"}, headers=member_header)
+    with record_statements() as statements:
+        resp = client.post("/api/projects", json={"title": "Claims Project"}, headers=member_header)
+    assert resp.status_code == 201, resp.text
+    assert not [statement for statement in statements if "FROM users" in statement.sql]
+
+    resp = client.patch(f"/api/users/{member['id']}", json={"role": "mitarbeit"}, headers=admin_header)
+    assert resp.status_code == 200, resp.text
+    resp = client.post("/api/projects", json={"title": "Stale Role"}, headers=member_header)
+    assert resp.status_code == 401
+
+    resp = client.post("/api/auth/login", data={"username": "claims@example.com", "password": "claims-pass-1"})
+    fresh_header = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    assert client.post("/api/projects", json={"title": "Demoted"}, headers=fresh_header).status_code == 403
+
+    assert client.delete(f"/api/users/{member['id']}", headers=admin_header).status_code == 204
+    assert client.post("/api/projects", json={"title": "Deleted"}, headers=fresh_header).status_code == 401
@@ -0,0 +1,84 @@
+"""Tests for the transactional change outbox and its readers."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
+
+from app.db.changes import ChangeReader, ChangesCompacted, compact_changes
+from app.db.models import Change, Project
+from tests.test_api import authenticate
+
+
+def _head(client: TestClient, auth_header: dict[str, str]) -> int:
+    return int(client.get("/api/changes?limit=1", headers=auth_header).headers["X-Changes-Head"])
+
+
+def test_writes_append_outbox_entries_in_order(client: TestClient, admin_credentials: dict[str, str], db_session_fixture) -> None:
+    """Route writes are recorded with entity, id, operation and changed fields; pulls resume after a seq."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/changes").status_code == 401
+    after = _head(client, auth_header)
+
+    project = client.post("/api/projects", json={"title": "Outbox"}, headers=auth_header).json()
+    client.put(f"/api/projects/{project['id']}", json={"status": "yellow", "title": "Outbox"}, headers=auth_header)
+    room = client.post("/api/rooms", json={"name": "Outbox-Raum"}, headers=auth_header).json()
+    client.delete(f"/api/projects/{project['id']}", headers=auth_header)
+
+    resp = client.get(f"/api/changes?after={after}", headers=auth_header)
+    assert resp.status_code == 200
+    changes = [(c["entity"], c["entity_id"], c["operation"], c["fields"]) for c in resp.json()]
+    assert changes == [
+        ("projects", project["id"], "create", None),
+        ("projects", project["id"], "update", ["status"]),
+        ("rooms", room["id"], "create", None),
+        ("projects", project["id"], "delete", None),
+    ]
+    seqs = [c["seq"] for c in resp.json()]
+    assert seqs == list(range(after + 1, after + 5))
+    assert resp.headers["X-Changes-Head"] == str(seqs[-1])
+
+    rooms_only = client.get(f"/api/changes?after={after}&entity=rooms", headers=auth_header).json()
+    assert [c["seq"] for c in rooms_only] == [seqs[2]]
+    assert [c["seq"] for c in client.get(f"/api/changes?after={seqs[0]}&limit=2", headers=auth_header).json()] == seqs[1:3]
+    assert client.get("/api/changes?entity=news_tags", headers=auth_header).status_code == 422
+
+    # The entry is part of the write's transaction
+    db_session_fixture.add(Project(title="Verworfen"))
+    db_session_fixture.flush()
+    assert db_session_fixture.scalar(select(func.max(Change.seq))) == seqs[-1] + 1
+    db_session_fixture.rollback()
+    assert _head(client, auth_header) == seqs[-1]
+
+
+def test_compaction_keeps_the_head_and_reports_lost_positions(
+    test_engine, client: TestClient, admin_credentials: dict[str, str]
+) -> None:
+    """Compaction removes old entries; readers behind it are told to reload instead of skipping changes."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    old = datetime.utcnow() - timedelta(days=90)
+    with test_engine.begin() as conn:
+        conn.execute(insert(Change), [{"entity": "news", "entity_id": i, "operation": "create", "created_at": old} for i in range(5)])
+        head = conn.scalar(select(func.max(Change.seq)))
+
+    reader = ChangeReader(after=head - 5, batch_size=2)
+    with test_engine.connect() as conn:
+        assert [[row.seq for row in batch] for batch in reader.batches(conn)] == [[head - 4, head - 3], [head - 2, head - 1], [head]]
+    assert reader.position == head
+
+    with test_engine.begin() as conn:
+        removed = compact_changes(conn, retention_days=30)
+        assert removed >= 4
+        assert conn.scalar(select(func.min(Change.seq))) == head
+
+    resp = client.get(f"/api/changes?after={head - 5}", headers=auth_header)
+    assert resp.status_code == 410
+    assert resp.headers["X-Changes-Head"] == str(head)
+    with test_engine.connect() as conn, pytest.raises(ChangesCompacted):
+        ChangeReader(after=head - 5).read(conn)
+    assert client.get(f"/api/changes?after={head - 1}", headers=auth_header).status_code == 200
@@ -0,0 +1,163 @@
+"""Tests for engine configuration, migrations and query plans."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, inspect, select, text
+
+from app.db.base import Base
+from app.db.changes import changes_query
+from app.db.metric_series import RAW, _series_query
+from app.db.room_bookings import bookings_query, overlapping_events
+from app.db.status_history import transitions_query
+from app.db.models import Change, Event, News, NewsTag, Project, SystemStatusDay, Task
+from app.pagination import keyset_predicate
+from app.routes.events import EVENT_SORT
+from app.routes.news import NEWS_SORT, TAGGED_NEWS_SORT, news_list_query
+from app.routes.projects import PROJECT_SORT
+from app.routes.tasks import TASK_SORT
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+NOW = datetime(2026, 1, 1)
+
+
+def _keyset_page(model, keys, values):
+    return (
+        select(model)
+        .where(keyset_predicate(keys, values))
+        .order_by(*(key.order_by() for key in keys))
+        .limit(51)
+    )
+
+
+# Statement shapes issued by the dashboard summary, project summary and list endpoints
+HOT_QUERIES = {
+    "summary_projects": select(Project).order_by(Project.created_at.desc()).limit(10),
+    "summary_events": select(Event).where(Event.start >= NOW).order_by(Event.start.asc()).limit(5),
+    "summary_news": select(News).order_by(News.created_at.desc()).limit(5),
+    "project_task_counts": select(func.count(Task.id)).where(Task.project_id == 1, Task.status == "open"),
+    "project_task_groups": select(Task.project_id, Task.status, func.count())
+    .where(Task.project_id == 1)
+    .group_by(Task.project_id, Task.status),
+    "project_events": select(Event)
+    .where(Event.project_id == 1, Event.start >= NOW)
+    .order_by(Event.start.asc())
+    .limit(5),
+    "project_news": select(News).where(News.project_id == 1).order_by(News.created_at.desc()).limit(5),
+    "list_projects": select(Project).order_by(Project.created_at.desc()),
+    "list_projects_status": select(Project).where(Project.status == "green").order_by(Project.created_at.desc()),
+    "list_events_range": select(Event).where(Event.start >= NOW, Event.start <= NOW).order_by(Event.start.asc()),
+    "list_events_room": select(Event).where(Event.room_id == 1).order_by(Event.start.asc()),
+    "list_news_public": select(News).where(News.is_public.is_(True)).order_by(News.created_at.desc()),
+    "list_news_since": select(News).where(News.created_at >= NOW).order_by(News.created_at.desc()),
+    "list_tasks": select(Task).order_by(Task.due_date.asc(), Task.created_at.desc()),
+    "list_tasks_assignee": select(Task).where(Task.assignee_id == 1).order_by(Task.due_date.asc()),
+    "list_tasks_status": select(Task).where(Task.status == "open").order_by(Task.due_date.asc()),
+    "list_tasks_project": select(Task).where(Task.project_id == 1),
+    "page_projects": _keyset_page(Project, PROJECT_SORT, [NOW, 10]),
+    "page_events": _keyset_page(Event, EVENT_SORT, [NOW, 10]),
+    "page_news": _keyset_page(News, NEWS_SORT, [NOW, 10]),
+    "page_tasks": _keyset_page(Task, TASK_SORT, [NOW.date(), NOW, 10]),
+    "list_news_tag": news_list_query(["kultur"], "any", None, None)[0]
+    .where(keyset_predicate(TAGGED_NEWS_SORT, [NOW, 10]))
+    .order_by(*(key.order_by() for key in TAGGED_NEWS_SORT))
+    .limit(6),
+    "news_tag_facets": select(NewsTag.tag, func.count()).group_by(NewsTag.tag),
+    "changes_after": changes_query(10, 50),
+    "changes_entity_after": changes_query(10, 50).where(Change.entity == "projects"),
+    "metric_series_raw": _series_query(1, RAW, 0, 3600),
+    "metric_series_rollup": _series_query(1, 3600, 0, 86400),
+    "event_room_conflicts": overlapping_events(1, NOW, NOW, exclude_id=10).limit(5),
+    "room_availability": bookings_query([1, 2, 3], NOW, NOW),
+    "status_history_window": transitions_query("Database", 0, 86400),
+    "status_daily_window": select(func.sum(SystemStatusDay.down_seconds)).where(
+        SystemStatusDay.service == "Database", SystemStatusDay.day >= 0, SystemStatusDay.day < 86400
+    ),
+}
+
+
+def _query_plan(conn, statement) -> list[str]:
+    compiled = statement.compile(conn, compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    params = tuple(value.isoformat(" ") if isinstance(value, datetime) else value for value in params)
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+    return [row[-1] for row in rows]
+
+
+def test_sqlite_profile_is_applied_on_connect(test_engine) -> None:
+    """New connections run in WAL mode with the configured pragmas."""
+
+    with test_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_queries_use_an_index(test_engine, name: str) -> None:
+    """Every hot query is served by an index, without a full scan or sort step."""
+
+    with test_engine.connect() as conn:
+        plan = _query_plan(conn, HOT_QUERIES[name])
+    assert plan
+    for step in plan:
+        assert "USING" in step, f"{name}: {plan}"
+        assert "TEMP B-TREE" not in step, f"{name}: {plan}"
+
+
+def test_migrations_reach_model_schema(tmp_path: Path) -> None:
+    """Upgrading an empty database to head yields every table and index of the models."""
+
+    database_url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["database_url"] = database_url
+    command.upgrade(config, "head")
+
+    engine = create_engine(database_url)
+    try:
+        inspector = inspect(engine)
+        for table in Base.metadata.sorted_tables:
+            migrated = {index["name"] for index in inspector.get_indexes(table.name)}
+            assert {index.name for index in table.indexes} <= migrated, table.name
+            assert {column.name for column in table.columns} == {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+    finally:
+        engine.dispose()
+
+
+def test_startup_migrates_once_and_then_skips_ddl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Startup only checks the revision when the schema is current; unversioned databases get the stamp hint."""
+
+    from app.db import session as db_session
+    from app.main import prepare_database
+
+    legacy = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    monkeypatch.setattr(db_session, "engine", legacy)
+    try:
+        with legacy.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+        with pytest.raises(RuntimeError, match=r"python -m app\.cli stamp 0001_initial_schema"):
+            prepare_database(auto_migrate=True, timings={})
+    finally:
+        legacy.dispose()
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'boot.db'}")
+    monkeypatch.setattr(db_session, "engine", engine)
+    try:
+        with pytest.raises(RuntimeError, match="app.cli migrate"):
+            prepare_database(auto_migrate=False, timings={})
+
+        timings: dict[str, float] = {}
+        prepare_database(auto_migrate=True, timings=timings)
+        assert "migrate_ms" in timings
+
+        timings = {}
+        prepare_database(auto_migrate=False, timings=timings)
+        assert set(timings) == {"schema_check_ms"}
+    finally:
+        engine.dispose()
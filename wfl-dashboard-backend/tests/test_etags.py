@@ -0,0 +1,67 @@
+"""Tests for ETag / If-None-Match handling driven by table change versions."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.test_api import authenticate
+
+
+def test_unchanged_list_answers_304_without_running_the_query(
+    client: TestClient, admin_credentials: dict[str, str], record_statements
+) -> None:
+    """A matching If-None-Match skips the list query; any write or other parameters change the ETag."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    client.post("/api/projects", json={"title": "ETag"}, headers=auth_header)
+
+    first = client.get("/api/projects")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    with record_statements() as statements:
+        resp = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    assert statements and all("table_versions" in statement.sql for statement in statements)
+    assert client.get("/api/projects", headers={"If-None-Match": f'"other", {etag.removeprefix("W/")}'}).status_code == 304
+
+    assert client.get("/api/projects?status=green").headers["ETag"] != etag
+    # Writes to other tables leave the ETag alone
+    client.post("/api/news", json={"title": "N", "body": "b"}, headers=auth_header)
+    assert client.get("/api/projects", headers={"If-None-Match": etag}).status_code == 304
+
+    project = client.post("/api/projects", json={"title": "ETag 2"}, headers=auth_header).json()
+    changed = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json() == client.get("/api/projects").json()
+
+    etag = changed.headers["ETag"]
+    client.put(f"/api/projects/{project['id']}", json={"status": "red"}, headers=auth_header)
+    assert client.get("/api/projects", headers={"If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.parametrize(
+    "url, create",
+    [
+        ("/api/news", ("/api/news", {"title": "E", "body": "b", "tags": ["etag"]})),
+        ("/api/news/tags", ("/api/news", {"title": "E", "body": "b", "tags": ["etag"]})),
+        ("/api/metrics", ("/api/metrics", {"name": "etag", "value": 1})),
+        ("/api/system/status", ("/api/system/status", {"service": "etag", "status": "ok"})),
+    ],
+)
+def test_polled_endpoints_revalidate_on_their_table(
+    client: TestClient, admin_credentials: dict[str, str], url: str, create: tuple[str, dict]
+) -> None:
+    """Each polled list endpoint answers 304 until its own table changes."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    etag = client.get(url, headers=auth_header).headers["ETag"]
+    assert client.get(url, headers={**auth_header, "If-None-Match": etag}).status_code == 304
+
+    resp = client.post(create[0], json=create[1], headers=auth_header)
+    assert resp.status_code == 201, resp.text
+    assert client.get(url, headers={**auth_header, "If-None-Match": etag}).status_code == 200
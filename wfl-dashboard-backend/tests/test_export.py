@@ -0,0 +1,94 @@
+"""Tests for the streaming NDJSON/CSV export endpoints."""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import tracemalloc
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, text
+
+from app.db.models import Task
+from app.export import export_response
+from app.routes.tasks import TASK_SORT, task_list_query
+from app.schemas.task import TaskRead
+from tests.test_api import authenticate
+
+# Set WFL_EXPORT_TEST_ROWS=1000000 to check the streaming memory bound at full scale
+EXPORT_TEST_ROWS = int(os.environ.get("WFL_EXPORT_TEST_ROWS", "20000"))
+
+
+def test_exports_stream_filtered_rows_as_ndjson_and_csv(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Exports apply the list filters and order, and encode every row in the requested format."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    project = client.post("/api/projects", json={"title": "Export"}, headers=auth_header).json()
+    for index, status in enumerate(["open", "done", "open"]):
+        client.post(
+            "/api/tasks",
+            json={"title": f"Export {index}", "status": status, "due_date": f"2026-02-0{index + 1}", "project_id": project["id"]},
+            headers=auth_header,
+        )
+    client.post("/api/news", json={"title": "Export, \"CSV\"", "body": "a\nb", "tags": ["export", "csv"]}, headers=auth_header)
+
+    resp = client.get(f"/api/tasks/export?project_id={project['id']}&status=open")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Export 0", "Export 2"]
+    listed = client.get(f"/api/tasks?project_id={project['id']}&status=open").json()
+    assert rows == listed
+
+    resp = client.get("/api/news/export?format=csv&tag=export")
+    assert resp.headers["content-disposition"] == 'attachment; filename="news.csv"'
+    [row] = list(csv.DictReader(io.StringIO(resp.text)))
+    assert (row["title"], row["body"], row["tags"], row["is_public"]) == ('Export, "CSV"', "a\nb", "export;csv", "false")
+
+    assert client.get("/api/events/export?format=csv").text.startswith("title,description,start,end,room_id")
+    assert client.get("/api/events/export?format=xml").status_code == 422
+
+
+def _export_peak(project_id: int) -> tuple[int, int]:
+    """Stream the tasks of ``project_id`` outside any request session; return (rows, peak bytes)."""
+
+    async def run() -> tuple[int, int]:
+        response = export_response(task_list_query(None, project_id, None), TASK_SORT, TaskRead, "ndjson", "tasks")
+        rows = 0
+        tracemalloc.start()
+        try:
+            async for chunk in response.body_iterator:
+                rows += chunk.count(b"\n")
+            return rows, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return asyncio.run(run())
+
+
+def test_export_memory_stays_flat_as_rows_grow(test_engine, client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Peak memory while exporting does not grow with the number of rows."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    small, large = (client.post("/api/projects", json={"title": f"Export {size}"}, headers=auth_header).json()["id"] for size in "SL")
+    seed = text(
+        "WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < :rows) "
+        "INSERT INTO tasks (title, description, status, project_id, created_by, created_at) "
+        "SELECT 'Export ' || i, 'Beschreibung der Aufgabe', 'open', :project_id, 1, '2026-01-01 00:00:00' FROM seq"
+    )
+    with test_engine.begin() as conn:
+        conn.execute(seed, {"rows": EXPORT_TEST_ROWS // 10, "project_id": small})
+        conn.execute(seed, {"rows": EXPORT_TEST_ROWS, "project_id": large})
+    try:
+        small_rows, small_peak = _export_peak(small)
+        large_rows, large_peak = _export_peak(large)
+    finally:
+        with test_engine.begin() as conn:
+            conn.execute(delete(Task).where(Task.project_id.in_([small, large])))
+
+    assert (small_rows, large_rows) == (EXPORT_TEST_ROWS // 10, EXPORT_TEST_ROWS)
+    # Ten times the rows may not cost noticeably more memory than one batch does
+    assert large_peak < small_peak * 1.5, (small_peak, large_peak)
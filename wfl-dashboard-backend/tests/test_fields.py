@@ -0,0 +1,72 @@
+"""Tests for sparse fieldsets (``?fields=``) on read endpoints."""
+
+from fastapi.testclient import TestClient
+
+from tests.test_api import authenticate
+
+
+def test_fields_narrow_sql_projection_and_body(
+    client: TestClient, admin_credentials: dict[str, str], record_statements
+) -> None:
+    """Only the requested columns are selected and returned, across pages and tag filters."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    created = []
+    for index in range(3):
+        resp = client.post(
+            "/api/news",
+            json={"title": f"Feld {index}", "body": "Langer Text " * 50, "tags": ["felder"]},
+            headers=auth_header,
+        )
+        created.append(resp.json())
+
+    with record_statements() as statements:
+        resp = client.get("/api/news?fields=title,created_at&limit=2", headers=auth_header)
+    assert resp.status_code == 200, resp.text
+    items = resp.json()
+    assert [set(item) for item in items] == [{"id", "title", "created_at"}] * 2
+    [select_news] = [statement.sql for statement in statements if "FROM news" in statement.sql]
+    assert "news.body" not in select_news and "news.title" in select_news
+
+    resp = client.get(f"/api/news?fields=title&limit=2&cursor={resp.headers['X-Next-Cursor']}", headers=auth_header)
+    assert resp.status_code == 200
+    assert set(resp.json()[0]) == {"id", "title"}
+
+    tagged = client.get("/api/news?tag=felder&fields=title&limit=2", headers=auth_header)
+    assert [item["title"] for item in tagged.json()] == ["Feld 2", "Feld 1"]
+    assert "X-Next-Cursor" in tagged.headers
+
+    with record_statements() as statements:
+        detail = client.get(f"/api/news/{created[0]['id']}?fields=title", headers=auth_header)
+    assert detail.json() == {"id": created[0]["id"], "title": "Feld 0"}
+    assert not [statement for statement in statements if "news.body" in statement.sql]
+    assert client.get(f"/api/news/{created[0]['id']}").json()["body"] == created[0]["body"]
+
+
+def test_fields_on_other_endpoints_and_unknown_names(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Every read endpoint accepts fields from its schema and rejects unknown names."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    project = client.post("/api/projects", json={"title": "Felder", "description": "lang"}, headers=auth_header).json()
+    client.post("/api/tasks", json={"title": "T", "description": "lang", "due_date": "2026-05-01"}, headers=auth_header)
+
+    assert set(client.get("/api/tasks?fields=title,due_date", headers=auth_header).json()[0]) == {"id", "title", "due_date"}
+    room = client.post("/api/rooms", json={"name": "Felder Raum"}, headers=auth_header).json()
+    client.post(
+        "/api/events",
+        json={"title": "E", "start": "2026-05-01T10:00:00", "end": "2026-05-01T11:00:00", "room_id": room["id"]},
+        headers=auth_header,
+    )
+    assert set(client.get("/api/events?fields=start").json()[0]) == {"id", "start"}
+    assert set(client.get("/api/projects?fields=title").json()[0]) == {"id", "title"}
+    assert client.get(f"/api/projects/{project['id']}?fields=status").json() == {"id": project["id"], "status": "green"}
+    users = client.get("/api/users?fields=name", headers=auth_header).json()
+    assert set(users[0]) == {"id", "name"}
+    assert client.get(f"/api/users/{users[0]['id']}?fields=email", headers=auth_header).json()["email"]
+
+    resp = client.get("/api/tasks?fields=title,password_hash", headers=auth_header)
+    assert resp.status_code == 422
+    assert "password_hash" in resp.json()["detail"]
+    assert client.get("/api/users?fields=password_hash", headers=auth_header).status_code == 422
@@ -0,0 +1,146 @@
+"""Tests for the health-check poller against local stand-in servers."""
+
+import asyncio
+import os
+import socket
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.health_poller import OPERATIONAL, HealthPoller, ProbeResult, load_probes
+from app.db import session as db_session
+from app.db.models import SystemStatus
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _http_server(status: dict[str, int], delay: float = 0.0) -> asyncio.Server:
+    """Answer every request with ``status["code"]`` after ``delay`` seconds; track the peak of open requests."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        status["open"] = status.get("open", 0) + 1
+        status["peak"] = max(status.get("peak", 0), status["open"])
+        await asyncio.sleep(delay)
+        status["open"] -= 1
+        writer.write(f"HTTP/1.1 {status['code']} X\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _url(server: asyncio.Server) -> str:
+    return f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/health"
+
+
+def _rows() -> dict[str, tuple[str, str | None]]:
+    with db_session.SessionLocal() as session:
+        return {row.service: (row.status, row.message) for row in session.scalars(select(SystemStatus))}
+
+
+def test_poll_writes_only_state_changes(client: TestClient, auth_header: dict[str, str], tmp_path: Path) -> None:
+    """Every probe kind reports, steady states cause no writes, manual edits are corrected, planned rows stay."""
+
+    fresh, stale = tmp_path / "fresh.txt", tmp_path / "stale.txt"
+    fresh.write_text("ok")
+    stale.write_text("old")
+    os.utime(stale, (time.time() - 7200, time.time() - 7200))
+
+    with db_session.SessionLocal() as session:
+        session.add(SystemStatus(service="Probe Maintenance", status="planned", message="Wartung"))
+        session.commit()
+
+    async def scenario() -> None:
+        status = {"code": 200}
+        server = await _http_server(status)
+        listener = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        probes = load_probes(
+            [
+                {"service": "Probe HTTP", "kind": "http", "target": _url(server)},
+                {"service": "Probe TCP", "kind": "tcp", "target": f"127.0.0.1:{listener.sockets[0].getsockname()[1]}"},
+                {"service": "Probe TCP closed", "kind": "tcp", "target": f"127.0.0.1:{_free_port()}"},
+                {"service": "Probe SQL", "kind": "sql"},
+                {"service": "Probe File", "kind": "file", "target": str(fresh), "max_age": 3600},
+                {"service": "Probe File stale", "kind": "file", "target": str(stale), "max_age": 3600},
+                {"service": "Probe File missing", "kind": "file", "target": str(tmp_path / "missing")},
+                {"service": "Probe Maintenance", "kind": "tcp", "target": f"127.0.0.1:{_free_port()}"},
+            ]
+        )
+        poller = HealthPoller(probes, concurrency=4)
+        async with server, listener:
+            results = await poller.poll_once()
+            assert results["Probe HTTP"] == ProbeResult("ok", OPERATIONAL)
+            assert results["Probe TCP"] == ProbeResult("ok", OPERATIONAL)
+            assert results["Probe TCP closed"].status == "down"
+            assert results["Probe SQL"] == ProbeResult("ok", OPERATIONAL)
+            assert results["Probe File"] == ProbeResult("ok", OPERATIONAL)
+            assert results["Probe File stale"] == ProbeResult("warning", "Older than 1 h")
+            assert results["Probe File missing"] == ProbeResult("down", "File missing")
+            assert poller.writes == 7
+
+            await poller.poll_once()
+            assert poller.writes == 7
+
+            # Hand edits and deleted rows are put back although the probe results stay the same
+            entries = {entry["service"]: entry for entry in client.get("/api/system/status").json()}
+            client.patch(
+                f"/api/system/status/{entries['Probe TCP']['id']}", json={"status": "down", "message": "Manuell"}, headers=auth_header
+            )
+            client.delete(f"/api/system/status/{entries['Probe File']['id']}", headers=auth_header)
+            await poller.poll_once()
+            assert poller.writes == 9
+            assert _rows()["Probe TCP"] == ("ok", OPERATIONAL)
+            assert _rows()["Probe File"] == ("ok", OPERATIONAL)
+
+            status["code"] = 503
+            await poller.poll_once()
+            assert poller.writes == 10
+            await poller.close()
+
+    asyncio.run(scenario())
+
+    rows = _rows()
+    assert rows["Probe HTTP"] == ("down", "HTTP 503")
+    assert rows["Probe TCP"] == ("ok", OPERATIONAL)
+    assert rows["Probe File stale"] == ("warning", "Older than 1 h")
+    assert rows["Probe Maintenance"] == ("planned", "Wartung")
+
+    statuses = {entry["service"]: entry["status"] for entry in client.get("/api/system/status").json()}
+    assert statuses["Probe HTTP"] == "down"
+
+
+def test_timeouts_and_concurrency_bound(test_engine) -> None:
+    """Slow services count as down after their timeout; no more than ``concurrency`` checks overlap."""
+
+    async def scenario() -> None:
+        status = {"code": 200}
+        server = await _http_server(status, delay=0.2)
+        async with server:
+            slow = load_probes([{"service": "Probe Slow", "kind": "http", "target": _url(server), "timeout": 0.05}])
+            poller = HealthPoller(slow, concurrency=1)
+            assert await poller.check(slow[0]) == ProbeResult("down", "No answer within 0.05 s")
+            await poller.close()
+
+            degraded = load_probes([{"service": "Probe Degraded", "kind": "http", "target": _url(server), "degraded_after": 0.1}])
+            poller = HealthPoller(degraded, concurrency=1)
+            assert await poller.check(degraded[0]) == ProbeResult("warning", "Slower than 0.1 s")
+            await poller.close()
+
+            probes = load_probes(
+                [{"service": f"Probe Pool {index}", "kind": "http", "target": _url(server)} for index in range(4)]
+            )
+            for concurrency in (2, 4):
+                status["peak"] = 0
+                poller = HealthPoller(probes, concurrency=concurrency)
+                await poller.poll_once()
+                assert status["peak"] == concurrency
+                await poller.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,91 @@
+"""Tests for the bulk metric upsert and its write-behind buffer."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.metric_buffer import get_metric_buffer
+from app.db.metric_series import epoch
+from app.db.models import MetricPoint
+
+
+def _metrics(client: TestClient) -> dict[str, dict]:
+    return {metric["name"]: metric for metric in client.get("/api/metrics").json()}
+
+
+def test_bulk_upsert_creates_updates_and_keeps_derived_data(
+    client: TestClient, auth_header: dict[str, str], db_session_fixture
+) -> None:
+    """One request creates and updates metrics by name; stale records only land in the series."""
+
+    existing = client.post("/api/metrics", json={"name": "Bulk A", "value": 1}, headers=auth_header).json()
+    etag = client.get("/api/metrics").headers["ETag"]
+    head = int(client.get("/api/changes?limit=1", headers=auth_header).headers["X-Changes-Head"])
+    now = datetime.utcnow().replace(microsecond=0)
+
+    records = [
+        {"name": "Bulk A", "value": 2, "timestamp": (now + timedelta(seconds=5)).isoformat()},
+        {"name": "Bulk B", "value": 10, "timestamp": now.isoformat()},
+        {"name": "Bulk B", "value": 11, "timestamp": (now + timedelta(seconds=1)).isoformat()},
+        {"name": "Bulk A", "value": 0, "timestamp": (now - timedelta(days=1)).isoformat()},
+    ]
+    assert client.post("/api/metrics/bulk", json=records).status_code == 401
+    assert client.post("/api/metrics/bulk", json=[], headers=auth_header).status_code == 422
+    expired = {"name": "Bulk A", "value": -5, "timestamp": (now - timedelta(days=30)).isoformat()}
+    assert client.post("/api/metrics/bulk", json=[records[0], expired], headers=auth_header).status_code == 422
+    resp = client.post("/api/metrics/bulk", json=records, headers=auth_header)
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"received": 4, "written": 2, "queued": 0}
+
+    metrics = _metrics(client)
+    assert (metrics["Bulk A"]["id"], metrics["Bulk A"]["value"]) == (existing["id"], 2)
+    assert metrics["Bulk B"]["value"] == 11
+    assert client.get("/api/metrics", headers={"If-None-Match": etag}).status_code == 200
+
+    changes = client.get(f"/api/changes?after={head}", headers=auth_header).json()
+    assert [(c["entity_id"], c["operation"], c["fields"]) for c in changes] == [
+        (existing["id"], "update", ["value", "updated_at"]),
+        (metrics["Bulk B"]["id"], "create", None),
+    ]
+
+    stale = {"name": "Bulk A", "value": -1, "timestamp": (now - timedelta(hours=1)).isoformat()}
+    assert client.post("/api/metrics/bulk", json=[stale], headers=auth_header).json()["written"] == 0
+    assert _metrics(client)["Bulk A"]["value"] == 2
+    # A record from the future would shut out every current value until its date passes
+    future = {"name": "Bulk C", "value": -6, "timestamp": (now + timedelta(days=1)).isoformat()}
+    assert client.post("/api/metrics/bulk", json=[future], headers=auth_header).status_code == 422
+    undated = client.post("/api/metrics/bulk", json=[{"name": "Bulk C", "value": 3}], headers=auth_header)
+    assert undated.json()["written"] == 1
+    assert _metrics(client)["Bulk C"]["value"] == 3
+    samples = dict(
+        db_session_fixture.execute(select(MetricPoint.ts, MetricPoint.value).where(MetricPoint.metric_id == existing["id"])).all()
+    )
+    assert samples[epoch(now - timedelta(days=1))] == 0
+    assert samples[epoch(now - timedelta(hours=1))] == -1
+
+
+def test_write_behind_coalesces_updates_until_flushed(
+    client: TestClient, auth_header: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Queued records are coalesced per name and written by the flush; a full buffer writes through."""
+
+    monkeypatch.setattr(get_settings(), "metric_write_behind_seconds", 3600.0)
+    buffer = get_metric_buffer()
+    for value in (1, 2, 3):
+        resp = client.post("/api/metrics/bulk", json=[{"name": "Puffer", "value": value}], headers=auth_header)
+        assert resp.status_code == 202
+        assert resp.json()["queued"] == 1
+    assert "Puffer" not in _metrics(client)
+    assert buffer.stats()["pending"] == 1
+
+    monkeypatch.setattr(buffer, "max_pending", 1)
+    resp = client.post("/api/metrics/bulk", json=[{"name": "Durchgeschrieben", "value": 5}], headers=auth_header)
+    assert resp.status_code == 200
+    assert resp.json()["written"] == 1
+
+    assert buffer.flush() == 1
+    assert buffer.flush() == 0
+    assert _metrics(client)["Puffer"]["value"] == 3
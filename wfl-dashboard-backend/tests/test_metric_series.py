@@ -0,0 +1,89 @@
+"""Tests for metric time series: sampling, ingest, rollups and range reads."""
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.db.metric_series import epoch, run_rollups
+from app.db.models import Metric, MetricDirtyHour, MetricPoint, MetricRollup
+from tests.test_api import authenticate
+
+
+def _iso(ts: int) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def test_ingest_rollups_and_resolution_choice(test_engine, client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Ingested samples roll up exactly into buckets; reads pick the finest resolution within the point budget."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    metric = client.post("/api/metrics", json={"name": "Besucher:innen", "value": 7}, headers=auth_header).json()
+    now = epoch(datetime.now(timezone.utc))
+    base = now - now % 3600 - 7200
+
+    points = [(base, 1), (base + 30, 3), (base + 60, 5), (base + 61, 2), (base + 3605, 10), (base + 30, 4)]
+    payload = [{"ts": _iso(ts), "value": value} for ts, value in points]
+    resp = client.post(f"/api/metrics/{metric['id']}/points", json=payload, headers=auth_header)
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["value"] == 7  # older samples leave the current value alone
+    assert client.post(f"/api/metrics/{metric['id']}/points", json=payload).status_code == 401
+    old = [{"ts": _iso(now - 30 * 86400), "value": 1}]
+    assert client.post(f"/api/metrics/{metric['id']}/points", json=old, headers=auth_header).status_code == 422
+    future = [{"ts": _iso(now + 86400), "value": 1}]
+    assert client.post(f"/api/metrics/{metric['id']}/points", json=future, headers=auth_header).status_code == 422
+    assert client.post("/api/metrics/999999/points", json=payload, headers=auth_header).status_code == 404
+
+    run_rollups(test_engine)
+    with test_engine.connect() as conn:
+        rollups = {
+            (row.resolution, row.bucket - base): (row.min, row.max, row.sum, row.count, row.last)
+            for row in conn.execute(select(MetricRollup).where(MetricRollup.metric_id == metric["id"]))
+        }
+        assert conn.scalar(select(MetricDirtyHour.id)) is None
+    assert rollups[(60, 0)] == (1, 4, 5, 2, 4)
+    assert rollups[(60, 60)] == (2, 5, 7, 2, 2)
+    assert rollups[(3600, 0)] == (1, 5, 12, 4, 2)
+    assert rollups[(3600, 3600)] == (10, 10, 10, 1, 10)
+
+    params = {"start": _iso(base), "end": _iso(base + 7200)}
+    raw = client.get(f"/api/metrics/{metric['id']}/series", params=params).json()
+    assert raw["resolution"] == "raw"
+    assert [(epoch(datetime.fromisoformat(p["ts"])) - base, p["last"]) for p in raw["points"]] == [
+        (0, 1), (30, 4), (60, 5), (61, 2), (3605, 10)
+    ]
+    hourly = client.get(f"/api/metrics/{metric['id']}/series", params={**params, "points": 3}).json()
+    assert hourly["resolution"] == "1h"
+    assert [(p["min"], p["max"], p["avg"], p["count"], p["last"]) for p in hourly["points"]] == [(1, 5, 3, 4, 2), (10, 10, 10, 1, 10)]
+    backwards = {"start": params["end"], "end": params["start"]}
+    assert client.get(f"/api/metrics/{metric['id']}/series", params=backwards).status_code == 422
+
+    latest = client.post(f"/api/metrics/{metric['id']}/points", json=[{"value": 42}], headers=auth_header).json()
+    assert latest["value"] == 42
+    client.delete(f"/api/metrics/{metric['id']}", headers=auth_header)
+
+
+def test_metric_writes_record_samples_and_deletes_drop_the_series(test_engine, db_session_fixture) -> None:
+    """Creating a metric or changing its value records a sample; deleting it removes points and rollups."""
+
+    hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+    metric = Metric(name="Spenden", value=10, updated_at=hour)
+    db_session_fixture.add(metric)
+    db_session_fixture.commit()
+    metric.value = 12
+    metric.updated_at = hour + timedelta(minutes=5)
+    db_session_fixture.commit()
+    metric.name = "Spenden gesamt"  # no new sample without a value change
+    db_session_fixture.commit()
+
+    start = epoch(hour)
+    samples = db_session_fixture.execute(select(MetricPoint.ts, MetricPoint.value).where(MetricPoint.metric_id == metric.id)).all()
+    assert [(ts - start, value) for ts, value in samples] == [(0, 10), (300, 12)]
+
+    run_rollups(test_engine)
+    assert db_session_fixture.scalar(select(MetricRollup.count).where(MetricRollup.metric_id == metric.id, MetricRollup.resolution == 3600)) == 2
+    db_session_fixture.delete(metric)
+    db_session_fixture.commit()
+    for model in (MetricPoint, MetricRollup, MetricDirtyHour):
+        assert db_session_fixture.scalar(select(model).where(model.metric_id == metric.id)) is None
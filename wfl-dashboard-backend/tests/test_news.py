@@ -0,0 +1,56 @@
+"""Tests for news tag filtering and tag facets."""
+
+from fastapi.testclient import TestClient
+
+from tests.test_api import authenticate
+
+
+def _ids(resp) -> list[int]:
+    assert resp.status_code == 200, resp.text
+    return [item["id"] for item in resp.json()]
+
+
+def test_tag_filters_run_in_sql_and_follow_updates(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Tag filters honour limit, AND/OR matching and tag edits; facets count per tag."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+
+    created = []
+    for index, tags in enumerate(
+        [["t9-chor"], ["t9-chor", "t9-jugend"], ["t9-jugend"], ["t9-chor", "t9-chor"], None, ["t9-chor"]]
+    ):
+        resp = client.post(
+            "/api/news",
+            json={"title": f"Tag {index}", "body": "...", "tags": tags, "is_public": index % 2 == 0},
+            headers=auth_header,
+        )
+        assert resp.status_code == 201, resp.text
+        created.append(resp.json()["id"])
+
+    chor = [created[5], created[3], created[1], created[0]]
+    assert _ids(client.get("/api/news", params={"tag": "t9-chor"})) == chor
+
+    # The limit applies to matching rows, so the page is full and the cursor continues the tag
+    first = client.get("/api/news", params={"tag": "t9-chor", "limit": 3})
+    assert _ids(first) == chor[:3]
+    rest = client.get("/api/news", params={"tag": "t9-chor", "limit": 3, "cursor": first.headers["X-Next-Cursor"]})
+    assert _ids(rest) == chor[3:]
+
+    both = {"tag": ["t9-chor", "t9-jugend"]}
+    assert _ids(client.get("/api/news", params={**both, "tag_mode": "all"})) == [created[1]]
+    assert _ids(client.get("/api/news", params=both)) == [created[5], created[3], created[2], created[1], created[0]]
+    assert _ids(client.get("/api/news", params={"tag": "t9-chor", "is_public": True})) == [created[0]]
+
+    resp = client.put(f"/api/news/{created[0]}", json={"tags": ["t9-jugend"]}, headers=auth_header)
+    assert resp.status_code == 200, resp.text
+    resp = client.delete(f"/api/news/{created[5]}", headers=auth_header)
+    assert resp.status_code == 204
+    assert _ids(client.get("/api/news", params={"tag": "t9-chor"})) == [created[3], created[1]]
+
+    facets = {item["tag"]: item["count"] for item in client.get("/api/news/tags").json()}
+    assert facets["t9-chor"] == 2
+    assert facets["t9-jugend"] == 3
+    public = {item["tag"]: item["count"] for item in client.get("/api/news/tags", params={"is_public": True}).json()}
+    assert public["t9-jugend"] == 2
+    assert "t9-chor" not in public
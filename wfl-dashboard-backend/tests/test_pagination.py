@@ -0,0 +1,120 @@
+"""Tests for keyset pagination of the list endpoints."""
+
+from datetime import date, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.db.models import Task, User
+from app.pagination import decode_cursor, encode_cursor, keyset_predicate
+from app.routes.tasks import TASK_SORT
+from tests.test_api import authenticate
+
+
+def _walk(client: TestClient, url: str, headers: dict[str, str]) -> tuple[list[dict], int]:
+    """Follow X-Next-Cursor until exhausted; return all items and the page count."""
+
+    items: list[dict] = []
+    pages = 0
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        resp = client.get(url, params=params, headers=headers)
+        assert resp.status_code == 200, resp.text
+        pages += 1
+        items.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return items, pages
+        assert 'rel="next"' in resp.headers["Link"]
+        params = {"limit": 2, "cursor": cursor}
+
+
+def test_cursor_pages_match_legacy_listing(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Walking the pages returns the same rows, in order, as the unbounded list."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    for index in range(5):
+        resp = client.post(
+            "/api/rooms",
+            json={"name": f"Pagination Raum {index}", "capacity": 10},
+            headers=auth_header,
+        )
+        assert resp.status_code == 201, resp.text
+        resp = client.post("/api/projects", json={"title": f"Pagination {index}"}, headers=auth_header)
+        assert resp.status_code == 201, resp.text
+
+    for url in ("/api/rooms", "/api/projects"):
+        legacy = client.get(url, headers=auth_header)
+        assert legacy.status_code == 200
+        assert "X-Next-Cursor" not in legacy.headers
+
+        items, pages = _walk(client, url, auth_header)
+        assert [item["id"] for item in items] == [item["id"] for item in legacy.json()]
+        assert pages == -(-len(items) // 2)
+
+
+def test_page_size_is_capped_and_bad_cursors_are_rejected(
+    client: TestClient, admin_credentials: dict[str, str], monkeypatch
+) -> None:
+    """Oversized limits fall back to the configured maximum; malformed cursors yield 400."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    settings = get_settings()
+    monkeypatch.setattr(settings, "pagination_max_page_size", 1)
+
+    resp = client.get("/api/users", params={"limit": 100}, headers=auth_header)
+    assert resp.status_code == 200
+    assert len(resp.json()) == 1
+
+    for cursor in ("not-a-cursor", encode_cursor([], object()), "WyJ4Il0"):
+        resp = client.get("/api/rooms", params={"cursor": cursor})
+        assert resp.status_code == 400, cursor
+        assert resp.json()["detail"] == "Invalid cursor"
+
+    monkeypatch.setattr(settings, "pagination_legacy_unbounded", False)
+    monkeypatch.setattr(settings, "pagination_default_page_size", 1)
+    monkeypatch.setattr(settings, "pagination_max_page_size", 500)
+    resp = client.get("/api/rooms")
+    assert len(resp.json()) == 1
+    assert "X-Next-Cursor" in resp.headers
+
+
+def test_keyset_predicate_handles_ties_and_nulls(db_session_fixture, admin_credentials: dict[str, str]) -> None:
+    """Task pages stay gap-free with duplicate keys and NULL due dates or timestamps."""
+
+    admin = db_session_fixture.scalar(select(User).where(User.email == admin_credentials["email"]))
+    stamp = datetime(2026, 3, 1, 12, 0)
+    combos = [
+        (None, stamp),
+        (None, None),
+        (date(2026, 3, 2), stamp),
+        (date(2026, 3, 2), stamp),
+        (date(2026, 3, 2), None),
+        (date(2026, 3, 1), datetime(2026, 2, 1)),
+        (None, stamp),
+    ]
+    for due_date, created_at in combos:
+        task = Task(title="Keyset", due_date=due_date, created_by=admin.id)
+        db_session_fixture.add(task)
+        db_session_fixture.flush()
+        task.created_at = created_at
+    db_session_fixture.flush()
+
+    order = [key.order_by() for key in TASK_SORT]
+    base = select(Task).where(Task.title == "Keyset").order_by(*order)
+    expected = [task.id for task in db_session_fixture.scalars(base)]
+    assert len(expected) == len(combos)
+
+    seen: list[int] = []
+    values = None
+    while True:
+        query = base if values is None else base.where(keyset_predicate(TASK_SORT, values))
+        page = db_session_fixture.scalars(query.limit(2)).all()
+        if not page:
+            break
+        seen.extend(task.id for task in page)
+        values = decode_cursor(TASK_SORT, encode_cursor(TASK_SORT, page[-1]))
+    assert seen == expected
@@ -0,0 +1,195 @@
+"""Tests for project summaries, batch summaries and the denormalized project counters."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app import cli
+from app.core.config import get_settings
+from app.db import session as db_session
+from app.db.counters import utc_today
+from app.db.models import ProjectCounter
+from tests.test_api import authenticate
+
+
+@pytest.mark.parametrize("counters_enabled", [False, True])
+def test_project_summary_counts_follow_task_and_news_writes(
+    client: TestClient, admin_credentials: dict[str, str], monkeypatch, counters_enabled: bool
+) -> None:
+    """Counts by status, overdue and news stay exact across creates, moves, updates and deletes."""
+
+    monkeypatch.setattr(get_settings(), "project_counters_enabled", counters_enabled)
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+
+    project = client.post("/api/projects", json={"title": "Zähler"}, headers=auth_header).json()
+    other = client.post("/api/projects", json={"title": "Zähler 2"}, headers=auth_header).json()
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    tasks = []
+    for status, due in [("open", yesterday), ("open", tomorrow), ("in_progress", yesterday), ("done", yesterday)]:
+        resp = client.post(
+            "/api/tasks",
+            json={"title": "T", "status": status, "due_date": due, "project_id": project["id"]},
+            headers=auth_header,
+        )
+        assert resp.status_code == 201, resp.text
+        tasks.append(resp.json())
+    client.post("/api/news", json={"title": "N", "body": "b", "project_id": project["id"]}, headers=auth_header)
+
+    def summary(project_id: int) -> dict:
+        resp = client.get(f"/api/projects/{project_id}/summary")
+        assert resp.status_code == 200, resp.text
+        return resp.json()
+
+    data = summary(project["id"])
+    assert data["task_counts"] == {"open": 2, "in_progress": 1, "done": 1}
+    assert data["total_tasks"] == 4
+    assert data["overdue_tasks"] == 2
+    assert data["news_count"] == 1
+
+    client.patch(f"/api/tasks/{tasks[0]['id']}", json={"status": "done"}, headers=auth_header)
+    client.patch(f"/api/tasks/{tasks[1]['id']}", json={"project_id": other["id"]}, headers=auth_header)
+    client.delete(f"/api/tasks/{tasks[2]['id']}", headers=auth_header)
+
+    data = summary(project["id"])
+    assert data["task_counts"] == {"open": 0, "in_progress": 0, "done": 2}
+    assert data["overdue_tasks"] == 0
+    assert summary(other["id"])["task_counts"] == {"open": 1, "in_progress": 0, "done": 0}
+
+
+def test_counters_refresh_daily_and_repair_command_rebuilds(
+    client: TestClient, admin_credentials: dict[str, str], record_statements, monkeypatch
+) -> None:
+    """Rows counted on an earlier day are refreshed off the event loop; the CLI recomputes corrupted rows."""
+
+    monkeypatch.setattr(get_settings(), "project_counters_enabled", True)
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    project = client.post("/api/projects", json={"title": "Reparatur"}, headers=auth_header).json()
+    client.post("/api/tasks", json={"title": "T", "project_id": project["id"]}, headers=auth_header)
+
+    with db_session.engine.begin() as conn:
+        conn.execute(
+            update(ProjectCounter)
+            .where(ProjectCounter.project_id == project["id"])
+            .values(tasks_open=99, counted_on=date.today() - timedelta(days=1))
+        )
+    with record_statements() as statements:
+        summary = client.get(f"/api/projects/{project['id']}/summary").json()
+    assert summary["task_counts"]["open"] == 1
+    assert summary["project"]["title"] == "Reparatur"
+    if db_session.AsyncSessionLocal is None:
+        # The project loaded before the refresh must not be reloaded from the event loop
+        assert {statement.thread for statement in statements} == {"AnyIO worker thread"}
+
+    with db_session.engine.begin() as conn:
+        row = conn.execute(select(ProjectCounter).where(ProjectCounter.project_id == project["id"])).one()
+        assert (row.tasks_open, row.counted_on) == (1, utc_today())
+        conn.execute(update(ProjectCounter).where(ProjectCounter.project_id == project["id"]).values(tasks_open=99))
+    assert client.get(f"/api/projects/{project['id']}/summary").json()["task_counts"]["open"] == 99
+    assert cli.main(["counters", str(project["id"])]) == 0
+    assert client.get(f"/api/projects/{project['id']}/summary").json()["task_counts"]["open"] == 1
+    assert cli.main(["counters"]) == 0
+
+
+def _count_statements(client: TestClient, record_statements, url: str) -> tuple[dict, int]:
+    """Return the JSON body of ``GET url`` and the number of SQL statements it ran."""
+
+    with record_statements() as statements:
+        resp = client.get(url)
+    assert resp.status_code == 200, resp.text
+    return resp.json(), len(statements)
+
+
+@pytest.mark.parametrize("counters_enabled", [False, True])
+def test_batch_summaries_match_single_summaries_with_constant_queries(
+    client: TestClient, admin_credentials: dict[str, str], record_statements, monkeypatch, counters_enabled: bool
+) -> None:
+    """Batch summaries equal the per-project summaries and cost the same queries for 1 or 7 projects."""
+
+    monkeypatch.setattr(get_settings(), "project_counters_enabled", counters_enabled)
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    room = client.post("/api/rooms", json={"name": f"Raum Batch {counters_enabled}"}, headers=auth_header).json()
+
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    ids = []
+    for index in range(7):
+        project = client.post(
+            "/api/projects", json={"title": f"Raster {index}", "status": "yellow" if index % 2 else "green"}, headers=auth_header
+        ).json()
+        ids.append(project["id"])
+        for offset in range(index):
+            client.post("/api/tasks", json={"title": "T", "project_id": project["id"]}, headers=auth_header)
+            client.post(
+                "/api/news", json={"title": f"N{offset}", "body": "b", "project_id": project["id"]}, headers=auth_header
+            )
+            client.post(
+                "/api/events",
+                json={
+                    "title": f"E{offset}",
+                    "start": (start + timedelta(days=index, hours=offset)).isoformat(),
+                    "end": (start + timedelta(days=index, hours=offset + 1)).isoformat(),
+                    "room_id": room["id"],
+                    "project_id": project["id"],
+                },
+                headers=auth_header,
+            )
+
+    url = f"/api/projects/summaries?ids={','.join(map(str, ids))}"
+    batch, _ = _count_statements(client, record_statements, url)
+    _, single_queries = _count_statements(client, record_statements, f"/api/projects/summaries?ids={ids[0]}")
+    batch, batch_queries = _count_statements(client, record_statements, f"{url}&ids=999999")
+    assert batch_queries == single_queries
+    assert list(batch) == [str(project_id) for project_id in ids]
+    for project_id in ids:
+        assert batch[str(project_id)] == client.get(f"/api/projects/{project_id}/summary").json()
+    assert len(batch[str(ids[6])]["upcoming_events"]) == 5
+    assert batch[str(ids[6])]["news_count"] == 6
+
+    yellow = client.get("/api/projects/summaries", params={"status": "yellow", "ids": [str(i) for i in ids]}).json()
+    assert list(yellow) == [str(project_id) for project_id in ids if ids.index(project_id) % 2]
+    page = client.get("/api/projects/summaries", params={"status": "green", "limit": 2})
+    assert len(page.json()) == 2
+    assert "X-Next-Cursor" in page.headers
+
+    assert client.get("/api/projects/summaries?ids=1,x").status_code == 422
+
+
+def test_batch_summaries_with_stale_counters_keep_constant_queries(
+    client: TestClient, admin_credentials: dict[str, str], record_statements, monkeypatch
+) -> None:
+    """Missing and outdated counter rows are recounted in one pass, off the event loop, for 1 or 5 projects."""
+
+    monkeypatch.setattr(get_settings(), "project_counters_enabled", True)
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    ids = []
+    for index in range(5):
+        project = client.post("/api/projects", json={"title": f"Veraltet {index}"}, headers=auth_header).json()
+        ids.append(project["id"])
+        for _ in range(index):
+            client.post("/api/tasks", json={"title": "T", "project_id": project["id"]}, headers=auth_header)
+
+    def stale_summaries(project_ids: list[int]) -> tuple[dict, list]:
+        with db_session.engine.begin() as conn:
+            conn.execute(update(ProjectCounter).values(tasks_open=99, counted_on=utc_today() - timedelta(days=1)))
+            conn.execute(ProjectCounter.__table__.delete().where(ProjectCounter.project_id.in_(project_ids[::2])))
+        with record_statements() as statements:
+            resp = client.get(f"/api/projects/summaries?ids={','.join(map(str, project_ids))}")
+        assert resp.status_code == 200, resp.text
+        return resp.json(), statements
+
+    _, single = stale_summaries(ids[:1])
+    batch, statements = stale_summaries(ids)
+    assert len(statements) == len(single)
+    if db_session.AsyncSessionLocal is None:
+        assert {statement.thread for statement in statements} == {"AnyIO worker thread"}
+    assert [batch[str(project_id)]["task_counts"]["open"] for project_id in ids] == [0, 1, 2, 3, 4]
+    assert [batch[str(project_id)]["project"]["title"] for project_id in ids] == [f"Veraltet {index}" for index in range(5)]
+    with db_session.engine.connect() as conn:
+        stored = conn.execute(select(ProjectCounter.tasks_open).where(ProjectCounter.project_id.in_(ids))).scalars().all()
+    assert sorted(stored) == [0, 1, 2, 3, 4]
@@ -0,0 +1,101 @@
+"""Tests for room booking conflicts and the availability endpoint."""
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from app.db.room_bookings import free_slots
+
+DAY = "2027-03-01"
+
+
+def _book(client: TestClient, headers: dict[str, str], room_id: int, start: str, end: str, title: str = "Probe"):
+    payload = {"title": title, "start": f"{DAY}T{start}:00", "end": f"{DAY}T{end}:00", "room_id": room_id}
+    return client.post("/api/events", json=payload, headers=headers)
+
+
+def test_overlapping_bookings_are_rejected(client: TestClient, auth_header: dict[str, str]) -> None:
+    """Overlaps in the same room conflict on create and update; back-to-back and other rooms do not."""
+
+    hall = client.post("/api/rooms", json={"name": "Konfliktsaal"}, headers=auth_header).json()
+    chapel = client.post("/api/rooms", json={"name": "Konfliktkapelle"}, headers=auth_header).json()
+    first = _book(client, auth_header, hall["id"], "10:00", "12:00").json()
+
+    resp = _book(client, auth_header, hall["id"], "11:00", "13:00")
+    assert resp.status_code == 409
+    assert str(first["id"]) in resp.json()["detail"]
+    assert _book(client, auth_header, hall["id"], "09:00", "13:00").status_code == 409
+    assert _book(client, auth_header, hall["id"], "12:00", "10:00").status_code == 422
+    assert _book(client, auth_header, chapel["id"], "11:00", "13:00").status_code == 201
+    second = _book(client, auth_header, hall["id"], "12:00", "13:00")
+    assert second.status_code == 201, second.text
+
+    moved = {"start": f"{DAY}T11:30:00"}
+    assert client.put(f"/api/events/{second.json()['id']}", json=moved, headers=auth_header).status_code == 409
+    renamed = client.put(f"/api/events/{second.json()['id']}", json={"title": "Umbenannt"}, headers=auth_header)
+    assert renamed.status_code == 200
+    assert renamed.json()["start"] == f"{DAY}T12:00:00"
+    hall_events = client.get("/api/events", params={"room_id": hall["id"]}).json()
+    assert [event["id"] for event in hall_events] == [first["id"], second.json()["id"]]
+
+
+def test_offsets_are_converted_before_checking_and_storing(client: TestClient, auth_header: dict[str, str]) -> None:
+    """A booking sent with a UTC offset occupies the same UTC slot for conflicts, reads and availability."""
+
+    room = client.post("/api/rooms", json={"name": "Zeitzonensaal"}, headers=auth_header).json()
+    payload = {"title": "Sommerzeit", "start": f"{DAY}T10:00:00+02:00", "end": f"{DAY}T11:00:00+02:00", "room_id": room["id"]}
+    created = client.post("/api/events", json=payload, headers=auth_header)
+    assert created.status_code == 201, created.text
+    assert (created.json()["start"], created.json()["end"]) == (f"{DAY}T08:00:00", f"{DAY}T09:00:00")
+
+    assert _book(client, auth_header, room["id"], "08:30", "09:30").status_code == 409
+    assert _book(client, auth_header, room["id"], "10:00", "11:00").status_code == 201
+    moved = client.put(f"/api/events/{created.json()['id']}", json={"start": f"{DAY}T09:00:00+01:00"}, headers=auth_header)
+    assert moved.status_code == 200, moved.text
+    assert moved.json()["start"] == f"{DAY}T08:00:00"
+
+    params = {"from": f"{DAY}T07:00:00Z", "to": f"{DAY}T12:00:00Z"}
+    rooms = {entry["room_id"]: entry for entry in client.get("/api/rooms/availability", params=params).json()}
+    assert [(slot["start"][11:16], slot["end"][11:16]) for slot in rooms[room["id"]]["free"]] == [
+        ("07:00", "08:00"),
+        ("09:00", "10:00"),
+        ("11:00", "12:00"),
+    ]
+
+
+def test_availability_sweeps_all_rooms(client: TestClient, auth_header: dict[str, str]) -> None:
+    """Free slots come per room within the range; capacity filters rooms and the range is validated."""
+
+    small = client.post("/api/rooms", json={"name": "Frei Klein", "capacity": 10}, headers=auth_header).json()
+    large = client.post("/api/rooms", json={"name": "Frei Groß", "capacity": 200}, headers=auth_header).json()
+    _book(client, auth_header, small["id"], "07:00", "09:00")
+    _book(client, auth_header, small["id"], "12:00", "14:00")
+    _book(client, auth_header, small["id"], "14:00", "15:00")
+
+    params = {"from": f"{DAY}T08:00:00Z", "to": f"{DAY}T18:00:00Z"}
+    rooms = {room["room_id"]: room for room in client.get("/api/rooms/availability", params=params).json()}
+    assert [(slot["start"][11:16], slot["end"][11:16]) for slot in rooms[small["id"]]["free"]] == [
+        ("09:00", "12:00"),
+        ("15:00", "18:00"),
+    ]
+    assert [(slot["start"][11:16], slot["end"][11:16]) for slot in rooms[large["id"]]["free"]] == [("08:00", "18:00")]
+
+    filtered = client.get("/api/rooms/availability", params={**params, "min_capacity": 100}).json()
+    assert large["id"] in {room["room_id"] for room in filtered} and small["id"] not in {room["room_id"] for room in filtered}
+    assert client.get("/api/rooms/availability", params={"from": params["to"], "to": params["from"]}).status_code == 422
+    far = {"from": params["from"], "to": "2028-03-01T00:00:00Z"}
+    assert client.get("/api/rooms/availability", params=far).status_code == 422
+
+
+def test_free_slots_merge_overlapping_bookings() -> None:
+    """Double bookings made before the conflict check merge into one busy stretch."""
+
+    def at(hour: int) -> datetime:
+        return datetime(2027, 3, 1, hour)
+
+    bookings = [(1, at(9), at(13)), (1, at(10), at(11)), (1, at(12), at(15)), (2, at(20), at(23))]
+    assert free_slots([1, 2, 3], bookings, at(8), at(22)) == {
+        1: [(at(8), at(9)), (at(15), at(22))],
+        2: [(at(8), at(20))],
+        3: [(at(8), at(22))],
+    }
@@ -0,0 +1,78 @@
+"""Tests for the FTS5 search endpoint."""
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from tests.test_api import authenticate
+
+
+def test_search_ranks_filters_and_tracks_writes(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Search finds all entry types, ranks title hits first and follows updates and deletes."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+
+    project = client.post(
+        "/api/projects",
+        json={"title": "Orgelsanierung", "description": "Spendenaktion für die Orgel"},
+        headers=auth_header,
+    ).json()
+    task = client.post(
+        "/api/tasks",
+        json={"title": "Angebote einholen", "description": "Orgelbauer für die Orgelsanierung anfragen", "project_id": project["id"]},
+        headers=auth_header,
+    ).json()
+    news = client.post(
+        "/api/news",
+        json={"title": "Konzert", "body": "Erlös geht an die <b>Orgelsanierung</b>", "is_public": True},
+        headers=auth_header,
+    ).json()
+    room = client.post("/api/rooms", json={"name": "Suchsaal"}, headers=auth_header).json()
+    start = datetime.now(timezone.utc) + timedelta(days=3)
+    event = client.post(
+        "/api/events",
+        json={
+            "title": "Orgelführung",
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+            "room_id": room["id"],
+            "project_id": project["id"],
+        },
+        headers=auth_header,
+    ).json()
+
+    resp = client.get("/api/search", params={"q": "orgelsanierung"})
+    assert resp.status_code == 200, resp.text
+    hits = resp.json()
+    assert [(hit["type"], hit["id"]) for hit in hits][0] == ("project", project["id"])
+    assert {(hit["type"], hit["id"]) for hit in hits} == {
+        ("project", project["id"]),
+        ("task", task["id"]),
+        ("news", news["id"]),
+    }
+    news_hit = next(hit for hit in hits if hit["type"] == "news")
+    assert "&lt;b&gt;<mark>Orgelsanierung</mark>&lt;/b&gt;" in news_hit["snippet"]
+
+    # Prefix match on the last word, diacritics folded, filters by type and project
+    hits = client.get("/api/search", params={"q": "orgelfuhr"}).json()
+    assert [(hit["type"], hit["id"]) for hit in hits] == [("event", event["id"])]
+    hits = client.get("/api/search", params={"q": "orgel", "type": ["task", "event"]}).json()
+    assert {hit["type"] for hit in hits} == {"task", "event"}
+    hits = client.get("/api/search", params={"q": "orgel", "project_id": project["id"]}).json()
+    assert {hit["type"] for hit in hits} == {"project", "task", "event"}
+
+    first = client.get("/api/search", params={"q": "orgel", "limit": 2})
+    assert len(first.json()) == 2
+    rest = client.get("/api/search", params={"q": "orgel", "limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    ids = [(hit["type"], hit["id"]) for hit in first.json() + rest.json()]
+    assert len(ids) == len(set(ids)) == 4
+
+    client.patch(f"/api/tasks/{task['id']}", json={"description": "Kostenvoranschlag"}, headers=auth_header)
+    client.delete(f"/api/news/{news['id']}", headers=auth_header)
+    hits = client.get("/api/search", params={"q": "orgelsanierung"}).json()
+    assert [(hit["type"], hit["id"]) for hit in hits] == [("project", project["id"])]
+
+    # FTS5 syntax in user input is taken literally
+    assert client.get("/api/search", params={"q": '"OR (NEAR'}).status_code == 200
+    assert client.get("/api/search", params={"q": "?!"}).json() == []
@@ -0,0 +1,68 @@
+"""Tests for the cached dashboard summary."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.core.view_cache import ViewCache
+from tests.test_api import authenticate
+
+
+def test_summary_is_cached_and_invalidated_by_writes(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Repeat requests hit the cache; creating or deleting a project shows up immediately."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+
+    def stats() -> dict:
+        return client.get("/api/status/caches", headers=auth_header).json()["status_summary"]
+
+    first = client.get("/api/status/summary")
+    assert first.status_code == 200
+    before = stats()
+    assert client.get("/api/status/summary").json() == first.json()
+    assert stats()["hits"] == before["hits"] + 1
+
+    project = client.post("/api/projects", json={"title": "Cache-Test"}, headers=auth_header).json()
+    summary = client.get("/api/status/summary").json()
+    assert summary["projects"][0]["id"] == project["id"]
+    assert stats()["invalidations"] > before["invalidations"]
+
+    client.delete(f"/api/projects/{project['id']}", headers=auth_header)
+    assert project["id"] not in [item["id"] for item in client.get("/api/status/summary").json()["projects"]]
+
+
+def test_view_cache_coalesces_misses_and_honours_deadlines() -> None:
+    """Concurrent misses share one computation; a value expires at its own deadline."""
+
+    cache = ViewCache("test", tables=("projects",), ttl_seconds=60)
+    calls = 0
+
+    async def compute(valid_for: float | None = None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls, valid_for
+
+    async def scenario() -> None:
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(10)))
+        assert results == [1] * 10
+        assert (cache.misses, cache.coalesced) == (1, 9)
+        assert await cache.get_or_compute("k", compute) == 1
+
+        cache.invalidate()
+        assert await cache.get_or_compute("k", lambda: compute(0.02)) == 2
+        assert await cache.get_or_compute("k", compute) == 2
+        await asyncio.sleep(0.03)
+        assert await cache.get_or_compute("k", compute) == 3
+
+        # A write landing mid-computation: the result is returned but not cached
+        async def racing():
+            cache.invalidate()
+            return await compute()
+
+        cache.invalidate()
+        assert await cache.get_or_compute("k", racing) == 4
+        assert await cache.get_or_compute("k", compute) == 5
+
+    asyncio.run(scenario())
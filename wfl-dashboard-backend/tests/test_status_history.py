@@ -0,0 +1,93 @@
+"""Tests for the system status history, daily rollups and uptime windows."""
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+
+from app.db.metric_series import epoch
+from app.db.models import SystemStatusDay, SystemStatusTransition
+from app.db.status_history import DAY, compute_uptime, run_status_rollups
+from tests.test_api import authenticate
+
+HOUR = 3600
+
+
+def test_status_changes_append_transitions(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Creating, changing the status of and deleting an entry are transitions; message edits are not."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+    entry = client.post("/api/system/status", json={"service": "Queue", "status": "ok"}, headers=auth_header).json()
+    client.patch(f"/api/system/status/{entry['id']}", json={"message": "Läuft"}, headers=auth_header)
+    client.patch(f"/api/system/status/{entry['id']}", json={"status": "down", "message": "Keine Verbindung"}, headers=auth_header)
+    client.patch(f"/api/system/status/{entry['id']}", json={"status": "ok", "message": None}, headers=auth_header)
+    client.delete(f"/api/system/status/{entry['id']}", headers=auth_header)
+
+    history = client.get("/api/system/status/Queue/history", params={"window": "1d"}).json()
+    assert [(item["status"], item["message"]) for item in history] == [
+        (None, None),
+        ("ok", None),
+        ("down", "Keine Verbindung"),
+        ("ok", None),
+    ]
+    assert client.get("/api/system/status/Queue/uptime", params={"window": "24h"}).status_code == 200
+    assert client.get("/api/system/status/Unbekannt/uptime").status_code == 404
+    assert client.get("/api/system/status/Queue/uptime", params={"window": "3x"}).status_code == 422
+
+
+@pytest.fixture
+def seeded_history(test_engine) -> tuple[str, int]:
+    """Three days of one service: an incident across midnight, maintenance, a short outage."""
+
+    service = "Mailserver"
+    today = epoch(datetime.now(timezone.utc))
+    base = today - today % DAY - 10 * DAY
+    transitions = [
+        ("ok", base),
+        ("down", base + 22 * HOUR),
+        ("ok", base + DAY + 2 * HOUR),
+        ("planned", base + DAY + 10 * HOUR),
+        ("ok", base + DAY + 12 * HOUR),
+        ("down", base + 2 * DAY + HOUR),
+        ("warning", base + 2 * DAY + HOUR + 600),
+        ("ok", base + 2 * DAY + 2 * HOUR),
+    ]
+    with test_engine.begin() as conn:
+        conn.execute(insert(SystemStatusTransition), [{"service": service, "status": s, "ts": ts} for s, ts in transitions])
+    yield service, base
+    with test_engine.begin() as conn:
+        conn.execute(SystemStatusTransition.__table__.delete().where(SystemStatusTransition.service == service))
+        conn.execute(SystemStatusDay.__table__.delete().where(SystemStatusDay.service == service))
+
+
+def test_rollups_match_the_history(test_engine, client: TestClient, seeded_history: tuple[str, int]) -> None:
+    """Windows give the same totals from the raw history and from the daily rollups."""
+
+    service, base = seeded_history
+    windows = [
+        (base, base + 3 * DAY),
+        (base + DAY, base + 2 * DAY),
+        (base + 20 * HOUR, base + DAY + 4 * HOUR),
+        (base - DAY, base + 5 * DAY),
+    ]
+    with test_engine.connect() as conn:
+        from_history = [compute_uptime(conn, service, start, end) for start, end in windows]
+
+    assert run_status_rollups(test_engine, batch_days=2) > 0
+    with test_engine.connect() as conn:
+        days = conn.scalars(select(SystemStatusDay.day).where(SystemStatusDay.service == service)).all()
+        assert days[0] == base and len(days) == 10  # every complete day, including those without transitions
+        assert [compute_uptime(conn, service, start, end) for start, end in windows] == from_history
+
+    totals = from_history[0]
+    assert (totals.ok_seconds, totals.warning_seconds, totals.down_seconds, totals.planned_seconds) == (234000, 3000, 15000, 7200)
+    assert (totals.incidents, totals.recoveries, totals.mttr_seconds) == (2, 2, 7500)
+    day_one = from_history[1]
+    assert (day_one.down_seconds, day_one.incidents, day_one.recoveries, day_one.repair_seconds) == (7200, 0, 1, 4 * HOUR)
+
+    end = datetime.fromtimestamp(base + 3 * DAY, timezone.utc).isoformat()
+    body = client.get(f"/api/system/status/{service}/uptime", params={"window": "3d", "end": end}).json()
+    assert body["observed_seconds"] == 3 * DAY
+    assert (body["uptime_percent"], body["incidents"], body["mttr_seconds"]) == (94.0476, 2, 7500)
@@ -0,0 +1,172 @@
+"""Tests for the ``/api/stream`` Server-Sent Events change feed."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.core.change_feed import ChangeFeed, get_change_feed
+from app.core.config import get_settings
+from app.db.models import Project
+from tests.test_api import authenticate
+
+
+class StreamReader:
+    """Drive the ASGI app like an EventSource client and parse the frames it receives."""
+
+    def __init__(self, app, query: str = "", headers: dict[str, str] | None = None) -> None:
+        self.app = app
+        self.scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/stream",
+            "raw_path": b"/api/stream",
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        self.status: int | None = None
+        self.headers: dict[str, str] = {}
+        self._chunks: asyncio.Queue[str] = asyncio.Queue()
+        self._buffer = ""
+        self._requested = False
+        self._disconnect = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "StreamReader":
+        self._task = asyncio.create_task(self.app(self.scope, self._receive, self._send))
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        self._disconnect.set()
+        await asyncio.wait_for(self._task, 5)
+
+    async def _receive(self) -> dict:
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: dict) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.headers = {name.decode(): value.decode() for name, value in message["headers"]}
+        elif message.get("body"):
+            await self._chunks.put(message["body"].decode())
+
+    async def frame(self, timeout: float = 5) -> dict[str, str]:
+        """Return the next frame as a dict of its fields; comment lines come back as ``{"comment": ...}``."""
+
+        while "\n\n" not in self._buffer:
+            self._buffer += await asyncio.wait_for(self._chunks.get(), timeout)
+        raw, self._buffer = self._buffer.split("\n\n", 1)
+        fields: dict[str, str] = {}
+        for line in raw.splitlines():
+            name, _, value = line.partition(":")
+            fields[name or "comment"] = value.strip()
+        return fields
+
+
+def test_stream_pushes_typed_changes_of_subscribed_topics(client: TestClient, admin_credentials: dict[str, str]) -> None:
+    """Committed writes arrive as events named after their topic, filtered by the subscription."""
+
+    token = authenticate(client, admin_credentials["email"], admin_credentials["password"])
+    auth_header = {"Authorization": f"Bearer {token}"}
+
+    async def run() -> None:
+        async with StreamReader(client.app, "topics=projects,news") as stream:
+            ready = await stream.frame()
+            assert stream.status == 200
+            assert stream.headers["content-type"].startswith("text/event-stream")
+            assert (ready["event"], json.loads(ready["data"])) == ("ready", {"topics": ["news", "projects"]})
+
+            def write() -> int:
+                project = client.post("/api/projects", json={"title": "Stream"}, headers=auth_header).json()
+                client.put(f"/api/projects/{project['id']}", json={"status": "red"}, headers=auth_header)
+                client.post("/api/tasks", json={"title": "Nicht abonniert"}, headers=auth_header)
+                client.delete(f"/api/projects/{project['id']}", headers=auth_header)
+                return project["id"]
+
+            project_id = await asyncio.to_thread(write)
+            frames = [await stream.frame() for _ in range(3)]
+            changes = [(frame["event"], json.loads(frame["data"])) for frame in frames]
+            assert changes == [
+                ("projects", {"entity": "projects", "id": project_id, "operation": "create", "fields": []}),
+                ("projects", {"entity": "projects", "id": project_id, "operation": "update", "fields": ["status"]}),
+                ("projects", {"entity": "projects", "id": project_id, "operation": "delete", "fields": []}),
+            ]
+
+        # Reconnecting with the ready id replays everything committed since
+        async with StreamReader(client.app, "topics=projects", {"Last-Event-ID": ready["id"]}) as stream:
+            assert (await stream.frame())["event"] == "ready"
+            replayed = [json.loads((await stream.frame())["data"])["operation"] for _ in range(3)]
+            assert replayed == ["create", "update", "delete"]
+
+        # Ids from another process run cannot be resumed
+        async with StreamReader(client.app, "", {"Last-Event-ID": "0000-1"}) as stream:
+            assert (await stream.frame())["event"] == "reset"
+
+    asyncio.run(run())
+    assert client.get("/api/stream?topics=projects,rooms").status_code == 422
+
+
+def test_stream_sends_heartbeats_and_skips_rolled_back_writes(
+    client: TestClient, db_session_fixture, monkeypatch
+) -> None:
+    """Idle streams get heartbeat comments; rolled back writes are never published."""
+
+    feed = get_change_feed()
+    monkeypatch.setattr(feed, "heartbeat_seconds", 0.05)
+    before = feed.last_seq
+    db_session_fixture.add(Project(title="Verworfen"))
+    db_session_fixture.flush()
+    db_session_fixture.rollback()
+    assert feed.last_seq == before
+
+    async def run() -> None:
+        async with StreamReader(client.app) as stream:
+            assert (await stream.frame())["event"] == "ready"
+            assert await stream.frame() == {"comment": "heartbeat"}
+            assert feed.subscribers == 1
+        assert feed.subscribers == 0
+        # With the last subscriber gone the heartbeat timer of this loop stops
+        await asyncio.sleep(0.15)
+        assert asyncio.get_running_loop() not in feed._wakeups
+
+    asyncio.run(run())
+
+
+def test_stream_cap_holds_for_a_burst_of_connects(client: TestClient, monkeypatch) -> None:
+    """Slots are taken before the response starts, so simultaneous connects cannot exceed the cap."""
+
+    feed = get_change_feed()
+    monkeypatch.setattr(get_settings(), "stream_max_subscribers", feed.subscribers + 2)
+
+    async def run() -> None:
+        readers = [StreamReader(client.app, "topics=news") for _ in range(3)]
+        for reader in readers:
+            await reader.__aenter__()
+        await asyncio.sleep(0.1)
+        assert sorted(reader.status for reader in readers) == [200, 200, 503]
+        assert feed.subscribers == 2
+        for reader in readers:
+            await reader.__aexit__(None, None, None)
+        assert feed.subscribers == 0
+
+    asyncio.run(run())
+
+
+def test_change_feed_reports_gaps_beyond_the_replay_buffer() -> None:
+    """Positions older than the buffer cannot be replayed; newer ones replay in order."""
+
+    feed = ChangeFeed(buffer_size=2, heartbeat_seconds=15)
+    feed.publish([("news", 1, "create", ()), ("news", 2, "create", ()), ("news", 1, "update", ("title",))])
+    assert feed.since(0) is None
+    assert [change.seq for change in feed.since(1)] == [2, 3]
+    assert feed.since(3) == []
@@ -0,0 +1,52 @@
+"""Tests for the Prometheus request and database telemetry."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+
+
+def _scrape(client: TestClient) -> dict[str, float]:
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in resp.text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_requests_and_queries_are_recorded_per_route(client: TestClient) -> None:
+    """Requests are counted per route template and status, with their size and database queries."""
+
+    before = _scrape(client)
+    for metric_id in (1, 2, 999999):
+        client.get(f"/api/metrics/{metric_id}/series")
+    client.get("/api/does-not-exist")
+    after = _scrape(client)
+
+    def delta(name: str) -> float:
+        return after.get(name, 0) - before.get(name, 0)
+
+    route = 'method="GET",route="/api/metrics/{metric_id}/series"'
+    statuses = [delta(f'http_requests_total{{{route},status="{code}"}}') for code in (200, 404)]
+    assert sum(statuses) == 3
+    assert delta('http_requests_total{method="GET",route="<unmatched>",status="404"}') == 1
+    assert delta(f"http_request_duration_seconds_count{{{route}}}") == 3
+    assert delta(f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}') == 3
+    assert delta(f"http_response_size_bytes_sum{{{route}}}") > 0
+    assert delta(f"http_request_db_queries_sum{{{route}}}") >= 3  # at least the metric lookup per request
+    assert delta(f"http_request_db_duration_seconds_sum{{{route}}}") > 0
+    assert delta("db_query_duration_seconds_count") >= 3
+    assert after["http_requests_in_flight"] == 1  # the scrape itself
+
+
+def test_scrape_token_is_required_when_configured(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With a token configured, scrapes without the matching bearer token are rejected."""
+
+    monkeypatch.setattr(get_settings(), "telemetry_token", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200